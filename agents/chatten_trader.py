@@ -7,13 +7,26 @@ executes buy orders when prices are attractive.
 """
 
 import os
+import re
+import sys
 import asyncio
-from typing import Any, Optional
+import base64
+import functools
+import hashlib
+import logging
+import time
+from dataclasses import dataclass
+from decimal import Decimal, ROUND_DOWN
+from typing import Any, Callable, Optional
 from dotenv import load_dotenv
 
+from .numba_kernels import find_buy_candidates
+
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # SpoonOS SDK imports
 try:
     from spoon_ai_sdk import ToolCallAgent, Tool, ToolResult
@@ -44,24 +57,335 @@ except ImportError:
     CONTRACT_HASHES = {}
     Transaction = object
 
+# orjson-backed (de)serialization and pooled aiohttp sessions for raw
+# JSON-RPC batch requests
+from tools._jsonrpc import (
+    AIOHTTP_AVAILABLE,
+    json_dumps as _json_dumps,
+    json_loads as _json_loads,
+    new_rpc_session,
+    rpc_batch,
+)
+
+# Use uvloop's faster event loop when installed
+try:
+    import uvloop
+    _LOOP_FACTORY = uvloop.new_event_loop
+except ImportError:
+    _LOOP_FACTORY = None  # default asyncio event loop
+
 
 # GAS Token Contract Hash (Neo N3)
 # This is the standard GAS token contract on Neo N3
 GAS_TOKEN_HASH = "0xd2a4cff31913016155e38e472a4c06d08be276cf"
 
+# GAS has 8 decimals: 1 GAS = 10^8 smallest units
+ONE_GAS = 100_000_000
+
+# Parsed once at import; the GAS contract hash never changes
+_GAS_TOKEN_UINT160 = UInt160.from_string(GAS_TOKEN_HASH) if NEO3_AVAILABLE else None
+
+# Default buy rule: buy 2.0 GAS worth of credits when price < 1,000,000
+DEFAULT_BUY_PRICE_THRESHOLD = 1_000_000
+DEFAULT_BUY_GAS_AMOUNT = 2.0
+
+# Storage prefix of the price slots (PREFIX_PRICE in contracts/chatten_token.py)
+_PRICE_STORAGE_PREFIX = b'\x20'
+
+# Maximum number of request objects sent in a single JSON-RPC batch
+MAX_RPC_BATCH_SIZE = 100
+
+# Long-lived HTTP resources shared by all tools, keyed by RPC URL, so that
+# repeated agent steps reuse pooled keep-alive connections instead of paying
+# a fresh TCP+TLS handshake per call.
+_SHARED_SESSIONS: dict[str, "aiohttp.ClientSession"] = {}
+_SHARED_CLIENTS: dict[str, NeoRpcClient] = {}
+_FACADES: dict[str, ChainFacade] = {}
+
+
+@dataclass(frozen=True, slots=True)
+class PriceResult:
+    """Result of a PriceCheckTool run."""
+    
+    model_id: str
+    success: bool
+    price: Optional[float] = None     # GAS units, set on success
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class TradeResult:
+    """Result of a buy order placed by BuyComputeTool."""
+    
+    model_id: str
+    success: bool
+    gas_amount: float = 0.0
+    tx_hash: Optional[str] = None
+    message: Optional[str] = None
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class CheckAndBuyResult:
+    """Result of a CheckAndBuyTool run."""
+    
+    model_id: str
+    success: bool
+    price: Optional[float] = None
+    bought: bool = False              # False when price was at/above threshold
+    trade: Optional[TradeResult] = None
+    error: Optional[str] = None
+
+
+_CONTRACT_HASH_PROMPT = "Please enter the deployed Chatten contract hash: "
+
+# Contract script hash: 40 hex characters, optionally 0x-prefixed
+_HEX40 = re.compile(r'(?:0[xX])?[0-9a-fA-F]{40}')
+
+
+def _normalize_contract_hash(contract_hash: str) -> str:
+    """
+    Validate a contract hash and normalize it to the form used by RPC calls.
+    
+    Args:
+        contract_hash: Hex string with or without 0x prefix
+        
+    Returns:
+        str: The lowercase, 0x-prefixed contract hash
+        
+    Raises:
+        ValueError: If the hash is not 40 hex characters
+    """
+    contract_hash = contract_hash.strip()
+    if not _HEX40.fullmatch(contract_hash):
+        raise ValueError(
+            f"Invalid contract hash '{contract_hash}': expected 40 hex characters"
+        )
+    return "0x" + contract_hash[-40:].lower()
+
+
+def _ensure_can_prompt() -> None:
+    """Raise if there is no interactive terminal to prompt on."""
+    if sys.stdin is None or not sys.stdin.isatty():
+        raise ValueError(
+            "CHATTEN_CONTRACT_HASH is not set and no terminal is available to prompt for it"
+        )
+
 
 def get_contract_hash() -> str:
     """
-    Helper function to get the deployed contract hash from user input.
+    Helper function to get the deployed contract hash.
+    
+    Reads CHATTEN_CONTRACT_HASH first and only falls back to prompting
+    the user when it is unset and stdin is an interactive terminal.
+    
+    Returns:
+        str: The contract hash (lowercase hex string without 0x prefix)
+    """
+    contract_hash = os.getenv("CHATTEN_CONTRACT_HASH", "").strip()
+    if not contract_hash:
+        _ensure_can_prompt()
+        contract_hash = input(_CONTRACT_HASH_PROMPT)
+    return _normalize_contract_hash(contract_hash)[2:]
+
+
+async def get_contract_hash_async() -> str:
+    """
+    Async variant of get_contract_hash that never blocks the event loop.
+    
+    The interactive prompt, if needed, runs in a worker thread.
+    
+    Returns:
+        str: The contract hash (lowercase hex string without 0x prefix)
+    """
+    contract_hash = os.getenv("CHATTEN_CONTRACT_HASH", "").strip()
+    if not contract_hash:
+        _ensure_can_prompt()
+        contract_hash = await asyncio.to_thread(input, _CONTRACT_HASH_PROMPT)
+    return _normalize_contract_hash(contract_hash)[2:]
+
+
+@functools.lru_cache(maxsize=256)
+def _encode_model_id(model_id: str) -> bytes:
+    """
+    Encode a model_id to UTF-8 bytes, reusing the result for repeat IDs.
     
+    Args:
+        model_id: The model identifier
+        
     Returns:
-        str: The contract hash (hex string with or without 0x prefix)
+        bytes: The UTF-8 encoded model_id
     """
-    contract_hash = input("Please enter the deployed Chatten contract hash: ").strip()
-    # Remove 0x prefix if present for consistency
-    if contract_hash.startswith("0x") or contract_hash.startswith("0X"):
-        contract_hash = contract_hash[2:]
-    return contract_hash
+    return model_id.encode('utf-8')
+
+
+def _gas_to_units(gas_amount: float | Decimal) -> int:
+    """
+    Convert a GAS amount to the contract's smallest units.
+    
+    Goes through Decimal so values like 0.29 GAS do not lose a unit to
+    binary float rounding; any fraction below one unit is truncated.
+    
+    Args:
+        gas_amount: Amount of GAS
+        
+    Returns:
+        int: Amount in smallest GAS units
+    """
+    units = Decimal(str(gas_amount)) * ONE_GAS
+    return int(units.to_integral_value(rounding=ROUND_DOWN))
+
+
+@functools.lru_cache(maxsize=256)
+def _price_storage_key(model_id: str) -> str:
+    """
+    Build the base64 storage key of a model's price slot.
+    
+    Mirrors the contract layout: PREFIX_PRICE + sha256(model_id).
+    
+    Args:
+        model_id: The model identifier
+        
+    Returns:
+        str: Base64-encoded storage key for ``getstorage``
+    """
+    token_id = hashlib.sha256(_encode_model_id(model_id)).digest()
+    return base64.b64encode(_PRICE_STORAGE_PREFIX + token_id).decode()
+
+
+def _pick_hash_extractor(tx: Any) -> Callable[[Any], str]:
+    """
+    Choose how to read the transaction hash from an SDK invoke result.
+    
+    The result shape is fixed for a given neo3 SDK version, so the
+    choice is made once and reused for every later buy.
+    
+    Args:
+        tx: A result returned by ChainFacade.invoke
+        
+    Returns:
+        Callable: Function extracting the hash as a string
+    """
+    if hasattr(tx, 'hash'):
+        return lambda t: str(t.hash)
+    if hasattr(tx, 'tx_id'):
+        return lambda t: str(t.tx_id)
+    return str
+
+
+def _get_shared_session(rpc_url: str) -> "aiohttp.ClientSession":
+    """
+    Get or create the keep-alive aiohttp session for an RPC URL.
+    
+    Args:
+        rpc_url: Neo N3 RPC URL
+        
+    Returns:
+        aiohttp.ClientSession: Shared session with pooled connections
+    """
+    session = _SHARED_SESSIONS.get(rpc_url)
+    if session is None or session.closed:
+        session = new_rpc_session()
+        _SHARED_SESSIONS[rpc_url] = session
+    return session
+
+
+def _get_shared_client(rpc_url: str) -> NeoRpcClient:
+    """
+    Get or create the shared neo3 RPC client for an RPC URL.
+    
+    Args:
+        rpc_url: Neo N3 RPC URL
+        
+    Returns:
+        NeoRpcClient: Shared RPC client
+    """
+    if not NEO3_AVAILABLE:
+        raise ImportError("neo-mamba is not installed. Install it with: pip install neo-mamba")
+    
+    client = _SHARED_CLIENTS.get(rpc_url)
+    if client is None:
+        client = NeoRpcClient(rpc_url)
+        _SHARED_CLIENTS[rpc_url] = client
+    return client
+
+
+def _facade_for(rpc_url: str) -> ChainFacade:
+    """
+    Get or create the shared ChainFacade for an RPC URL.
+    
+    Construction is synchronous, so there is no await point between the
+    lookup and the store and concurrent callers cannot build duplicates.
+    
+    Args:
+        rpc_url: Neo N3 RPC URL
+        
+    Returns:
+        ChainFacade: Facade shared by every tool using this URL
+    """
+    facade = _FACADES.get(rpc_url)
+    if facade is None:
+        facade = ChainFacade(_get_shared_client(rpc_url))
+        _FACADES[rpc_url] = facade
+    return facade
+
+
+async def aclose_shared_clients() -> None:
+    """Close all shared RPC clients and HTTP sessions."""
+    clients = list(_SHARED_CLIENTS.values())
+    sessions = list(_SHARED_SESSIONS.values())
+    _FACADES.clear()
+    _SHARED_CLIENTS.clear()
+    _SHARED_SESSIONS.clear()
+    
+    for client in clients:
+        await client.close()
+    for session in sessions:
+        if not session.closed:
+            await session.close()
+
+
+async def _rpc_batch(rpc_url: str, calls: list[tuple[str, list]]) -> list[dict]:
+    """
+    Send several JSON-RPC calls to a Neo N3 RPC node in one HTTP request.
+    
+    Args:
+        rpc_url: Neo N3 RPC URL
+        calls: List of (method, params) pairs
+        
+    Returns:
+        list: Response objects, in the same order as ``calls``
+    """
+    return await rpc_batch(_get_shared_session(rpc_url), rpc_url, calls)
+
+
+def _decode_price(response: dict, model_id: str) -> float:
+    """
+    Decode the price from an ``invokefunction`` JSON-RPC response.
+    
+    Args:
+        response: Single JSON-RPC response object
+        model_id: The model identifier (for error messages)
+        
+    Returns:
+        float: The price in GAS units
+    """
+    if "error" in response:
+        message = response["error"].get("message", "Unknown RPC error")
+        raise RuntimeError(f"Failed to fetch price for '{model_id}': {message}")
+    
+    result = response.get("result") or {}
+    if result.get("state") == "FAULT":
+        raise RuntimeError(
+            f"Failed to fetch price for '{model_id}': {result.get('exception')}"
+        )
+    
+    stack = result.get("stack") or []
+    if not stack:
+        raise ValueError(f"No price data returned for model '{model_id}'")
+    
+    # Integer stack items are serialized as decimal strings
+    return float(int(stack[0].get("value", 0)))
 
 
 class PriceCheckTool(BaseTool):
@@ -80,7 +404,8 @@ class PriceCheckTool(BaseTool):
         model_id: The model identifier (e.g., "gpt-4")
     
     Returns:
-        float: The current price in GAS units
+        PriceResult: model_id, success, price (the current price in GAS
+        units, set on success), and error (set on failure)
     """
     
     def __init__(
@@ -92,101 +417,238 @@ class PriceCheckTool(BaseTool):
         Initialize the Price Check Tool.
         
         Args:
-            contract_hash: Chatten contract hash (will prompt if None)
+            contract_hash: Chatten contract hash (read from env or prompted if None)
             rpc_url: Neo N3 RPC URL
+            
+        Raises:
+            ValueError: If contract_hash is not 40 hex characters
         """
         super().__init__()
         self.contract_hash = contract_hash
+        self._contract_hex: Optional[str] = (
+            _normalize_contract_hash(contract_hash) if contract_hash else None
+        )
         self.rpc_url = rpc_url or os.getenv("NEO_RPC_URL", "http://localhost:50012")
-        self._facade: Optional[ChainFacade] = None
+        
+        # Read price slots with getstorage instead of running the VM
+        self._fast_read = os.getenv("CHATTEN_FAST_READ", "1") == "1"
+        
+        # Short-lived price cache: model_id -> (price, monotonic fetch time)
+        self._price_cache: dict[str, tuple[float, float]] = {}
+        self._ttl = float(os.getenv("CHATTEN_PRICE_TTL", "2.0"))
     
-    async def _get_facade(self) -> ChainFacade:
-        """Get or create ChainFacade instance."""
-        if self._facade is None:
-            if not NEO3_AVAILABLE:
-                raise ImportError("neo-mamba is not installed. Install it with: pip install neo-mamba")
-            # Create RPC client and facade
-            client = NeoRpcClient(self.rpc_url)
-            self._facade = ChainFacade(client)
-        return self._facade
+    async def _resolve_contract_hash(self) -> str:
+        """Get the normalized contract hash, looking it up once if not provided."""
+        if self._contract_hex is None:
+            self.contract_hash = await get_contract_hash_async()
+            self._contract_hex = _normalize_contract_hash(self.contract_hash)
+        return self._contract_hex
+    
+    def _get_cached_price(self, model_id: str) -> Optional[float]:
+        """Get a cached price if it was fetched within the TTL."""
+        entry = self._price_cache.get(model_id)
+        if entry and time.monotonic() - entry[1] < self._ttl:
+            return entry[0]
+        return None
+    
+    def invalidate(self, model_id: Optional[str] = None) -> None:
+        """
+        Drop cached prices so the next lookup hits the chain.
+        
+        Args:
+            model_id: Model to invalidate (all models if None)
+        """
+        if model_id is None:
+            self._price_cache.clear()
+        else:
+            self._price_cache.pop(model_id, None)
+    
+    async def _get_price_via_storage(self, model_id: str) -> Optional[int]:
+        """
+        Read a model's price slot directly with the ``getstorage`` RPC.
+        
+        This skips the VM execution that ``test_invoke`` triggers on the node.
+        
+        Args:
+            model_id: The model identifier
+            
+        Returns:
+            int: The stored price, or None if the slot could not be read
+        """
+        contract_hash = await self._resolve_contract_hash()
+        responses = await _rpc_batch(
+            self.rpc_url,
+            [("getstorage", [contract_hash, _price_storage_key(model_id)])]
+        )
+        value = responses[0].get("result")
+        if "error" in responses[0] or value is None:
+            return None
+        # put_int stores a little-endian two's complement integer
+        return int.from_bytes(base64.b64decode(value), "little", signed=True)
     
     async def get_price(self, model_id: str) -> float:
         """
         Get the current price for a model.
         
+        Prices are cached for CHATTEN_PRICE_TTL seconds (default 2.0).
+        Reads go through ``getstorage`` first (disable with
+        CHATTEN_FAST_READ=0) and fall back to the same batched
+        ``invokefunction`` lookup as get_prices.
+        
         Args:
             model_id: The model identifier
             
         Returns:
             float: The current price in GAS units
+            
+        Raises:
+            RuntimeError: If the invocation errors or faults
+            ValueError: If the contract returns no price
         """
-        if not NEO3_AVAILABLE:
-            raise ImportError("neo-mamba is not installed")
+        cached = self._get_cached_price(model_id)
+        if cached is not None:
+            return cached
         
-        # Get contract hash if not set
-        contract_hash = self.contract_hash
-        if not contract_hash:
-            contract_hash = get_contract_hash()
+        if self._fast_read and AIOHTTP_AVAILABLE:
+            try:
+                price_int = await self._get_price_via_storage(model_id)
+            except Exception as e:
+                # getstorage is only an optimization; test-invoke instead
+                logger.warning(
+                    "getstorage price read for '%s' failed, falling back to invokefunction: %s",
+                    model_id, e
+                )
+                price_int = None
+            if price_int is not None:
+                price = float(price_int)
+                self._price_cache[model_id] = (price, time.monotonic())
+                return price
         
-        # Convert contract hash to UInt160
-        if len(contract_hash) == 40:  # Without 0x prefix
-            contract_hash = "0x" + contract_hash
-        contract_script_hash = UInt160.from_string(contract_hash)
+        # Fall back to test-invoking get_current_price through the batch path
+        outcome = (await self._fetch_prices([model_id]))[model_id]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+    
+    async def _fetch_prices(self, model_ids: list[str]) -> dict[str, float | Exception]:
+        """
+        Test-invoke get_current_price for several models in batched requests.
         
-        # Get facade and test invoke
-        facade = await self._get_facade()
+        Every lookup is sent as an ``invokefunction`` call inside a single
+        JSON-RPC batch request (split into chunks of MAX_RPC_BATCH_SIZE).
+        Successful prices are cached.
         
-        # Convert model_id to bytes for the contract call
-        model_id_bytes = model_id.encode('utf-8')
+        Args:
+            model_ids: The model identifiers, none of them repeated
+            
+        Returns:
+            dict: Mapping of model_id to its price in GAS units, or to the
+            exception raised while decoding that model's response
+        """
+        contract_hash = await self._resolve_contract_hash()
+        outcomes: dict[str, float | Exception] = {}
         
-        # Test invoke get_current_price (read-only, no gas cost)
-        try:
-            result = await facade.test_invoke(
-                contract_script_hash,
-                "get_current_price",
-                [model_id_bytes]
-            )
+        for start in range(0, len(model_ids), MAX_RPC_BATCH_SIZE):
+            chunk = model_ids[start:start + MAX_RPC_BATCH_SIZE]
+            calls = [
+                (
+                    "invokefunction",
+                    [
+                        contract_hash,
+                        "get_current_price",
+                        [{
+                            "type": "ByteArray",
+                            "value": base64.b64encode(_encode_model_id(model_id)).decode(),
+                        }],
+                    ],
+                )
+                for model_id in chunk
+            ]
+            responses = await _rpc_batch(self.rpc_url, calls)
+            fetched_at = time.monotonic()
+            for model_id, response in zip(chunk, responses):
+                try:
+                    price = _decode_price(response, model_id)
+                except (RuntimeError, ValueError) as e:
+                    outcomes[model_id] = e
+                    continue
+                self._price_cache[model_id] = (price, fetched_at)
+                outcomes[model_id] = price
+        
+        return outcomes
+    
+    async def get_prices(self, model_ids: list[str]) -> dict[str, float]:
+        """
+        Get the current prices for several models in one RPC round-trip.
+        
+        Models with a cached price are not re-fetched. A model whose lookup
+        fails is logged and left out of the result instead of failing the
+        whole batch.
+        
+        Args:
+            model_ids: The model identifiers
             
-            if result and hasattr(result, 'stack') and len(result.stack) > 0:
-                # Extract price from stack (price is stored as int in contract)
-                price_value = result.stack[0]
-                # The contract returns price as int
-                # Extract the integer value
-                if hasattr(price_value, 'value'):
-                    price_int = price_value.value
-                elif isinstance(price_value, (int, str)):
-                    price_int = int(price_value)
-                else:
-                    price_int = int(price_value)
-                
-                # The contract stores price as an integer
-                # Based on the requirement "below 1,000,000", the price is likely
-                # already in a reasonable unit (not smallest units)
-                # Return as float for consistency, but keep the integer value
-                return float(price_int)
+        Returns:
+            dict: Mapping of model_id to price in GAS units, for every model
+            whose price could be read
+        """
+        prices: dict[str, float] = {}
+        missing: list[str] = []
+        for model_id in dict.fromkeys(model_ids):
+            cached = self._get_cached_price(model_id)
+            if cached is not None:
+                prices[model_id] = cached
             else:
-                raise ValueError(f"No price data returned for model '{model_id}'")
-        except Exception as e:
-            raise RuntimeError(f"Failed to fetch price for '{model_id}': {str(e)}")
+                missing.append(model_id)
+        
+        if not missing:
+            return prices
+        
+        for model_id, outcome in (await self._fetch_prices(missing)).items():
+            if isinstance(outcome, Exception):
+                logger.warning("Skipping price for '%s': %s", model_id, outcome)
+            else:
+                prices[model_id] = outcome
+        
+        return prices
     
-    async def run(self, **kwargs: Any) -> ToolResult:
+    async def get_prices_concurrent(
+        self,
+        model_ids: list[str],
+        concurrency: int = 8
+    ) -> dict[str, float]:
+        """
+        Get prices for several models with overlapping get_price calls.
+        
+        Use this instead of get_prices when the RPC node does not support
+        JSON-RPC batch requests.
+        
+        Args:
+            model_ids: The model identifiers
+            concurrency: Maximum number of in-flight requests
+            
+        Returns:
+            dict: Mapping of model_id to price in GAS units
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def _fetch_one(model_id: str) -> tuple[str, float]:
+            async with semaphore:
+                return model_id, await self.get_price(model_id)
+        
+        return dict(await asyncio.gather(*(_fetch_one(m) for m in model_ids)))
+    
+    async def run(self, **kwargs: Any) -> PriceResult:
         """SpoonOS tool execution entry point."""
         model_id = kwargs.get("model_id", "")
         if not model_id:
-            return {"error": "model_id is required"}
+            return PriceResult(model_id="", success=False, error="model_id is required")
         
         try:
             price = await self.get_price(model_id)
-            return {
-                "model_id": model_id,
-                "price": price,
-                "success": True
-            }
+            return PriceResult(model_id=model_id, success=True, price=price)
         except Exception as e:
-            return {
-                "error": str(e),
-                "success": False
-            }
+            return PriceResult(model_id=model_id, success=False, error=str(e))
 
 
 class BuyComputeTool(BaseTool):
@@ -209,86 +671,112 @@ class BuyComputeTool(BaseTool):
         gas_amount: Amount of GAS to spend (e.g., 2.0)
     
     Returns:
-        dict: Transaction result with tx_hash
+        TradeResult: model_id, success, gas_amount, tx_hash (set when
+        the transaction was broadcast), message, and error (set on failure)
     """
     
     def __init__(
         self,
         contract_hash: Optional[str] = None,
         rpc_url: Optional[str] = None,
-        private_key: Optional[str] = None
+        private_key: Optional[str] = None,
+        price_tool: Optional[PriceCheckTool] = None
     ) -> None:
         """
         Initialize the Buy Compute Tool.
         
         Args:
-            contract_hash: Chatten contract hash (will prompt if None)
+            contract_hash: Chatten contract hash (read from env or prompted if None)
             rpc_url: Neo N3 RPC URL
             private_key: Private key for signing (from env if None)
+            price_tool: Price tool whose cache is invalidated after a buy
+            
+        Raises:
+            ValueError: If contract_hash is not 40 hex characters
         """
         super().__init__()
         self.contract_hash = contract_hash
+        self._contract_hex: Optional[str] = (
+            _normalize_contract_hash(contract_hash) if contract_hash else None
+        )
         self.rpc_url = rpc_url or os.getenv("NEO_RPC_URL", "http://localhost:50012")
         self.private_key = private_key or os.getenv("NEO_PRIVATE_KEY")
-        self._facade: Optional[ChainFacade] = None
+        self.price_tool = price_tool
         self._account: Optional[Account] = None
+        self._contract_script_hash: Optional[UInt160] = None
+        self._from_script_hash: Optional[UInt160] = None
+        self._extract_hash: Optional[Callable[[Any], str]] = None
     
     async def _get_facade(self) -> ChainFacade:
-        """Get or create ChainFacade instance."""
-        if self._facade is None:
-            if not NEO3_AVAILABLE:
-                raise ImportError("neo-mamba is not installed. Install it with: pip install neo-mamba")
-            # Create RPC client and facade
-            client = NeoRpcClient(self.rpc_url)
-            self._facade = ChainFacade(client)
-        return self._facade
+        """Get the ChainFacade shared by all tools on this RPC URL."""
+        return _facade_for(self.rpc_url)
+    
+    async def _resolve_contract_hash(self) -> str:
+        """Get the normalized contract hash, looking it up once if not provided."""
+        if self._contract_hex is None:
+            self.contract_hash = await get_contract_hash_async()
+            self._contract_hex = _normalize_contract_hash(self.contract_hash)
+        return self._contract_hex
     
-    def _get_account(self) -> Account:
+    async def _get_contract_script_hash(self) -> UInt160:
+        """Get the contract script hash, parsing it only on first use."""
+        if self._contract_script_hash is None:
+            contract_hash = await self._resolve_contract_hash()
+            self._contract_script_hash = UInt160.from_string(contract_hash)
+        return self._contract_script_hash
+    
+    async def _get_account(self) -> Account:
         """Get or create Account from private key."""
         if self._account is None:
             if not self.private_key:
                 raise ValueError("NEO_PRIVATE_KEY not set in environment or provided")
             if not NEO3_AVAILABLE:
                 raise ImportError("neo-mamba is not installed")
-            self._account = Account.from_wif(self.private_key)
+            # WIF decoding and key derivation are CPU-bound; keep them off the loop
+            self._account = await asyncio.to_thread(Account.from_wif, self.private_key)
         return self._account
     
-    async def buy_credits(self, model_id: str, gas_amount: float) -> dict:
+    async def buy_credits(
+        self,
+        model_id: str,
+        gas_amount: float | Decimal = 0.0,
+        gas_amount_units: Optional[int] = None
+    ) -> TradeResult:
         """
         Execute a buy order by transferring GAS to the contract.
         
+        ``gas_amount_units`` (integer smallest GAS units) is the canonical
+        form; when given it is used as-is and ``gas_amount`` is ignored.
+        
         Args:
             model_id: The model identifier
             gas_amount: Amount of GAS to spend
+            gas_amount_units: Amount to spend in smallest GAS units (10^-8 GAS)
             
         Returns:
-            dict: Transaction result with tx_hash and status
+            TradeResult: Transaction result with tx_hash and status
         """
         if not NEO3_AVAILABLE:
             raise ImportError("neo-mamba is not installed")
         
-        # Get contract hash if not set
-        contract_hash = self.contract_hash
-        if not contract_hash:
-            contract_hash = get_contract_hash()
-        
-        # Convert contract hash to UInt160
-        if len(contract_hash) == 40:  # Without 0x prefix
-            contract_hash = "0x" + contract_hash
-        contract_script_hash = UInt160.from_string(contract_hash)
-        
-        # Get GAS token contract hash
-        gas_token_hash = UInt160.from_string(GAS_TOKEN_HASH)
+        contract_script_hash = await self._get_contract_script_hash()
+        gas_token_hash = _GAS_TOKEN_UINT160
         
         # Get account and facade
-        account = self._get_account()
+        account = await self._get_account()
+        if self._from_script_hash is None:
+            self._from_script_hash = account.script_hash
         facade = await self._get_facade()
         
         # Convert gas_amount to contract units (GAS has 8 decimals)
-        gas_amount_int = int(gas_amount * 100_000_000)  # 10^8
+        if gas_amount_units is not None:
+            gas_amount_int = gas_amount_units
+            gas_amount = gas_amount_units / ONE_GAS
+        else:
+            gas_amount_int = _gas_to_units(gas_amount)
         
         # Prepare model_id as data (bytes)
-        model_id_data = model_id.encode('utf-8')
+        model_id_data = _encode_model_id(model_id)
         
         # Construct transfer transaction: transfer GAS from account to contract
         # The transfer's data parameter will be the model_id, triggering onNEP17Payment
@@ -301,7 +789,7 @@ class BuyComputeTool(BaseTool):
                 gas_token_hash,
                 "transfer",
                 [
-                    account.script_hash,  # from
+                    self._from_script_hash,  # from
                     contract_script_hash,  # to (Chatten contract)
                     gas_amount_int,       # amount (in smallest units)
                     model_id_data         # data (model_id as bytes)
@@ -310,50 +798,147 @@ class BuyComputeTool(BaseTool):
             )
             
             # Extract transaction hash
-            tx_hash = None
-            if hasattr(tx, 'hash'):
-                tx_hash = str(tx.hash)
-            elif hasattr(tx, 'tx_id'):
-                tx_hash = str(tx.tx_id)
-            elif isinstance(tx, str):
-                tx_hash = tx
-            else:
-                tx_hash = str(tx)
+            if self._extract_hash is None:
+                self._extract_hash = _pick_hash_extractor(tx)
+            tx_hash = self._extract_hash(tx)
             
-            return {
-                "success": True,
-                "tx_hash": tx_hash,
-                "gas_amount": gas_amount,
-                "model_id": model_id,
-                "message": f"Successfully initiated buy order for {gas_amount} GAS worth of {model_id} credits"
-            }
+            # The buy moves the price; make the next check re-fetch it
+            if self.price_tool is not None:
+                self.price_tool.invalidate(model_id)
+            
+            return TradeResult(
+                model_id=model_id,
+                success=True,
+                gas_amount=gas_amount,
+                tx_hash=tx_hash,
+                message=f"Successfully initiated buy order for {gas_amount} GAS worth of {model_id} credits"
+            )
         except Exception as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "gas_amount": gas_amount,
-                "model_id": model_id
-            }
-    
-    async def run(self, **kwargs: Any) -> ToolResult:
+            return TradeResult(
+                model_id=model_id,
+                success=False,
+                gas_amount=gas_amount,
+                error=str(e)
+            )
+    
+    async def run(self, **kwargs: Any) -> TradeResult:
         """SpoonOS tool execution entry point."""
         model_id = kwargs.get("model_id", "")
         gas_amount = kwargs.get("gas_amount", 0.0)
         
         if not model_id:
-            return {"error": "model_id is required", "success": False}
+            return TradeResult(model_id="", success=False, error="model_id is required")
         
         if gas_amount <= 0:
-            return {"error": "gas_amount must be greater than 0", "success": False}
+            return TradeResult(
+                model_id=model_id,
+                success=False,
+                gas_amount=gas_amount,
+                error="gas_amount must be greater than 0"
+            )
         
         try:
-            result = await self.buy_credits(model_id, gas_amount)
-            return result
+            return await self.buy_credits(model_id, gas_amount)
         except Exception as e:
-            return {
-                "error": str(e),
-                "success": False
-            }
+            return TradeResult(
+                model_id=model_id,
+                success=False,
+                gas_amount=gas_amount,
+                error=str(e)
+            )
+
+
+class CheckAndBuyTool(BaseTool):
+    """
+    SpoonOS Tool that checks a price and buys in a single tool call.
+    
+    Fusing the read and the conditional write saves the agent a full LLM
+    round-trip between calling get_price and deciding to call buy_credits.
+    """
+    
+    name: str = "check_and_buy_if_below"
+    description: str = """
+    Check the on-chain price of a compute model and, only if it is below
+    the threshold, immediately buy credits by transferring GAS.
+    
+    Args:
+        model_id: The model identifier (e.g., "gpt-4")
+        threshold: Buy only if the price is strictly below this value
+        gas_amount: Amount of GAS to spend if buying (e.g., 2.0)
+    
+    Returns:
+        CheckAndBuyResult: model_id, success, price, bought (False when
+        the price was at or above threshold), trade (the TradeResult of
+        the buy, if one was placed), and error (set on failure)
+    """
+    
+    def __init__(
+        self,
+        price_tool: PriceCheckTool,
+        buy_tool: BuyComputeTool
+    ) -> None:
+        """
+        Initialize the Check-and-Buy Tool.
+        
+        Args:
+            price_tool: Tool used to read the price
+            buy_tool: Tool used to execute the buy
+        """
+        super().__init__()
+        self.price_tool = price_tool
+        self.buy_tool = buy_tool
+    
+    async def check_and_buy_if_below(
+        self,
+        model_id: str,
+        threshold: float = DEFAULT_BUY_PRICE_THRESHOLD,
+        gas_amount: float = DEFAULT_BUY_GAS_AMOUNT
+    ) -> CheckAndBuyResult:
+        """
+        Fetch the price and buy credits if it is below threshold.
+        
+        Args:
+            model_id: The model identifier
+            threshold: Buy only if the price is strictly below this value
+            gas_amount: Amount of GAS to spend if buying
+            
+        Returns:
+            CheckAndBuyResult: Price, buy decision and trade result
+        """
+        price = await self.price_tool.get_price(model_id)
+        if price >= threshold:
+            return CheckAndBuyResult(model_id=model_id, success=True, price=price)
+        
+        trade = await self.buy_tool.buy_credits(model_id, gas_amount)
+        return CheckAndBuyResult(
+            model_id=model_id,
+            success=trade.success,
+            price=price,
+            bought=trade.success,
+            trade=trade,
+            error=trade.error
+        )
+    
+    async def run(self, **kwargs: Any) -> CheckAndBuyResult:
+        """SpoonOS tool execution entry point."""
+        model_id = kwargs.get("model_id", "")
+        threshold = kwargs.get("threshold", DEFAULT_BUY_PRICE_THRESHOLD)
+        gas_amount = kwargs.get("gas_amount", DEFAULT_BUY_GAS_AMOUNT)
+        
+        if not model_id:
+            return CheckAndBuyResult(model_id="", success=False, error="model_id is required")
+        
+        if gas_amount <= 0:
+            return CheckAndBuyResult(
+                model_id=model_id,
+                success=False,
+                error="gas_amount must be greater than 0"
+            )
+        
+        try:
+            return await self.check_and_buy_if_below(model_id, threshold, gas_amount)
+        except Exception as e:
+            return CheckAndBuyResult(model_id=model_id, success=False, error=str(e))
 
 
 class ChattenTraderAgent(ToolCallAgent):
@@ -368,13 +953,20 @@ class ChattenTraderAgent(ToolCallAgent):
     You are an AI Liquidity Manager operating on the Neo N3 blockchain.
     
     Your primary task:
-    - Check the on-chain price of 'gpt-4' using the get_price tool
-    - If the price is below 1,000,000, immediately execute a BUY order for 2.0 GAS worth of credits using the buy_credits tool
+    - Check the on-chain price of 'gpt-4' and, if the price is below 1,000,000,
+      immediately execute a BUY order for 2.0 GAS worth of credits
+    - Do both in one step with the check_and_buy_if_below tool
+      (model_id='gpt-4', threshold=1000000, gas_amount=2.0)
     
-    Always verify the price before executing any buy orders.
+    Use get_price and buy_credits separately only when you need just one of them.
+    Never buy without the price having been checked first.
     Report the price and your decision clearly.
     """
     
+    # Default buy rule from SYSTEM_PROMPT
+    BUY_PRICE_THRESHOLD = DEFAULT_BUY_PRICE_THRESHOLD
+    BUY_GAS_AMOUNT = DEFAULT_BUY_GAS_AMOUNT
+    
     def __init__(
         self,
         contract_hash: Optional[str] = None,
@@ -386,7 +978,7 @@ class ChattenTraderAgent(ToolCallAgent):
         Initialize the Chatten Trader Agent.
         
         Args:
-            contract_hash: Chatten contract hash (will prompt if None)
+            contract_hash: Chatten contract hash (read from env or prompted if None)
             rpc_url: Neo N3 RPC URL
             private_key: Private key for signing transactions
             **kwargs: Additional arguments for ToolCallAgent
@@ -401,14 +993,16 @@ class ChattenTraderAgent(ToolCallAgent):
         buy_tool = BuyComputeTool(
             contract_hash=contract_hash,
             rpc_url=rpc_url,
-            private_key=private_key
+            private_key=private_key,
+            price_tool=price_tool
         )
+        check_and_buy_tool = CheckAndBuyTool(price_tool=price_tool, buy_tool=buy_tool)
         
         # Initialize parent with tools
         super().__init__(
             name=kwargs.get("name", "ChattenTrader"),
             system_prompt=self.SYSTEM_PROMPT,
-            tools=[price_tool, buy_tool],
+            tools=[check_and_buy_tool, price_tool, buy_tool],
             **{k: v for k, v in kwargs.items() if k != "name"}
         )
         
@@ -416,6 +1010,49 @@ class ChattenTraderAgent(ToolCallAgent):
         self.rpc_url = rpc_url
         self.price_tool = price_tool
         self.buy_tool = buy_tool
+        self.check_and_buy_tool = check_and_buy_tool
+    
+    async def scan_and_buy(
+        self,
+        model_ids: list[str],
+        threshold: int = BUY_PRICE_THRESHOLD,
+        gas_amount: float = BUY_GAS_AMOUNT
+    ) -> list[TradeResult]:
+        """
+        Check many model prices at once and buy every model below threshold.
+        
+        Prices are fetched with one batched RPC request, scanned with a
+        compiled kernel, and the resulting buys are sent concurrently.
+        
+        Args:
+            model_ids: The model identifiers to scan (duplicates are ignored)
+            threshold: Buy when the price is strictly below this value
+            gas_amount: Amount of GAS to spend per buy
+            
+        Returns:
+            list: Buy results, one per model that was below threshold
+        """
+        # Repeated ids would otherwise be bought once per occurrence
+        model_ids = list(dict.fromkeys(model_ids))
+        prices = await self.price_tool.get_prices(model_ids)
+        # Models whose price lookup failed are skipped
+        priced = [model_id for model_id in model_ids if model_id in prices]
+        candidates = find_buy_candidates(
+            [int(prices[model_id]) for model_id in priced],
+            threshold
+        )
+        return list(await asyncio.gather(*(
+            self.buy_tool.buy_credits(priced[i], gas_amount)
+            for i in candidates
+        )))
+
+
+# Header for run_trader_loop, rendered in a single write
+_TRADER_HEADER = (
+    "=" * 70 + "\n"
+    "Chatten Trader Agent - Autonomous Trading Bot\n"
+    + "=" * 70 + "\n\n"
+)
 
 
 async def run_trader_loop(contract_hash: Optional[str] = None) -> None:
@@ -423,16 +1060,14 @@ async def run_trader_loop(contract_hash: Optional[str] = None) -> None:
     Run the trader agent loop once to demonstrate a trade.
     
     Args:
-        contract_hash: Optional contract hash (will prompt if None)
+        contract_hash: Optional contract hash (read from env or prompted if None)
     """
-    print("=" * 70)
-    print("Chatten Trader Agent - Autonomous Trading Bot")
-    print("=" * 70)
-    print()
+    sys.stdout.write(_TRADER_HEADER)
+    sys.stdout.flush()
     
     # Get contract hash if not provided
     if not contract_hash:
-        contract_hash = get_contract_hash()
+        contract_hash = await get_contract_hash_async()
     
     # Check environment variables
     rpc_url = os.getenv("NEO_RPC_URL", "http://localhost:50012")
@@ -480,11 +1115,14 @@ async def run_trader_loop(contract_hash: Optional[str] = None) -> None:
         print()
         import traceback
         traceback.print_exc()
+    finally:
+        await aclose_shared_clients()
 
 
 def main() -> None:
     """Main entry point."""
-    asyncio.run(run_trader_loop())
+    with asyncio.Runner(loop_factory=_LOOP_FACTORY) as runner:
+        runner.run(run_trader_loop())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,61 @@
+"""
+Numba Kernels
+
+Compiled helpers for scanning large batches of on-chain prices.
+Falls back to NumPy, then pure Python, when the optional
+accelerators are not installed. Kernels compile (or load from the
+on-disk cache) on first call, not at import.
+"""
+
+import math
+from typing import Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    njit = None
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _find_below_kernel(prices: "np.ndarray", threshold: "np.int64") -> "np.ndarray":
+        """Return the indices of all prices strictly below threshold."""
+        out = np.empty(prices.shape[0], dtype=np.int64)
+        count = 0
+        for i in range(prices.shape[0]):
+            if prices[i] < threshold:
+                out[count] = i
+                count += 1
+        return out[:count]
+
+
+def find_buy_candidates(prices: Sequence[int], threshold: int) -> list[int]:
+    """
+    Find the positions of all prices below a buy threshold.
+    
+    Args:
+        prices: Prices in contract units, one per model
+        threshold: Exclusive upper bound for a buy (may be a float)
+        
+    Returns:
+        list: Indices into ``prices`` that are below ``threshold``
+    """
+    # Integer prices are below t exactly when they are below ceil(t), so
+    # every backend can compare against the same integer bound
+    threshold = math.ceil(threshold)
+    if NUMBA_AVAILABLE:
+        array = np.asarray(prices, dtype=np.int64)
+        return _find_below_kernel(array, np.int64(threshold)).tolist()
+    if NUMPY_AVAILABLE:
+        array = np.asarray(prices, dtype=np.int64)
+        return np.flatnonzero(array < threshold).tolist()
+    return [i for i, price in enumerate(prices) if price < threshold]
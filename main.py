@@ -5,8 +5,10 @@ Main entry point for the Chatten application.
 """
 
 import asyncio
+import functools
 import os
 import sys
+from dataclasses import dataclass
 from typing import Optional
 
 # Load environment variables
@@ -16,61 +18,148 @@ try:
 except ImportError:
     pass  # dotenv not installed, rely on system env vars
 
+# Use uvloop's faster event loop when installed
+try:
+    import uvloop
+    _LOOP_FACTORY = uvloop.new_event_loop
+except ImportError:
+    _LOOP_FACTORY = None  # default asyncio event loop
+
 # Local imports
 from agents import ChattenTraderAgent
-from tools import NeoBridgeTool, TokenBalanceTool, TokenTransferTool, QScoreAnalyzerTool
-from tools.neo_bridge import NeoConfig
+from tools import NeoBridgeTool, NeoConfig, TokenBalanceTool, TokenTransferTool, QScoreAnalyzerTool
+
+
+# Startup banner, rendered in a single write
+_BANNER = """
+╔══════════════════════════════════════════════════════════════╗
+║                                                              ║
+║   ██████╗██╗  ██╗ █████╗ ████████╗████████╗███████╗███╗   ██╗║
+║  ██╔════╝██║  ██║██╔══██╗╚══██╔══╝╚══██╔══╝██╔════╝████╗  ██║║
+║  ██║     ███████║███████║   ██║      ██║   █████╗  ██╔██╗ ██║║
+║  ██║     ██╔══██║██╔══██║   ██║      ██║   ██╔══╝  ██║╚██╗██║║
+║  ╚██████╗██║  ██║██║  ██║   ██║      ██║   ███████╗██║ ╚████║║
+║   ╚═════╝╚═╝  ╚═╝╚═╝  ╚═╝   ╚═╝      ╚═╝   ╚══════╝╚═╝  ╚═══╝║
+║                                                              ║
+║        Decentralized Exchange for AI Compute                 ║
+║              Powered by Neo N3 & SpoonOS                     ║
+║                                                              ║
+╚══════════════════════════════════════════════════════════════╝
+
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class NeoSettings:
+    """Neo N3 connection and wallet settings."""
+    
+    rpc_url: str
+    network_magic: int
+    private_key: Optional[str] = None
+    wallet_address: Optional[str] = None
+    wallet_path: Optional[str] = None
+    wallet_password: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class ContractSettings:
+    """Deployed Chatten contract settings."""
+    
+    hash: Optional[str] = None
+    owner: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class SpoonSettings:
+    """SpoonOS agent framework settings."""
+    
+    api_key: Optional[str] = None
+    workspace_id: Optional[str] = None
+    agent_name: str = "ChattenTrader"
 
 
-def get_config() -> dict:
+@dataclass(frozen=True, slots=True)
+class OpenAISettings:
+    """OpenAI LLM settings."""
+    
+    api_key: Optional[str] = None
+    model: str = "gpt-4-turbo-preview"
+    temperature: float = 0.7
+
+
+@dataclass(frozen=True, slots=True)
+class AppSettings:
+    """General application settings."""
+    
+    debug: bool = False
+    dry_run: bool = False
+    log_level: str = "INFO"
+
+
+@dataclass(frozen=True, slots=True)
+class AppConfig:
+    """Complete application configuration."""
+    
+    neo: NeoSettings
+    contract: ContractSettings
+    spoon: SpoonSettings
+    openai: OpenAISettings
+    app: AppSettings
+
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> AppConfig:
     """
     Load configuration from environment variables.
     
+    The result is built once and cached; call ``get_config.cache_clear()``
+    to re-read the environment.
+    
     Returns:
-        dict: Application configuration
+        AppConfig: Application configuration
     """
-    return {
+    return AppConfig(
         # Neo N3 Configuration
-        "neo": {
-            "rpc_url": os.getenv("NEO_RPC_URL", "https://testnet1.neo.coz.io:443"),
-            "network_magic": int(os.getenv("NEO_NETWORK_MAGIC", "894710606")),
-            "private_key": os.getenv("NEO_PRIVATE_KEY"),
-            "wallet_address": os.getenv("NEO_WALLET_ADDRESS"),
-            "wallet_path": os.getenv("NEO_WALLET_PATH"),
-            "wallet_password": os.getenv("NEO_WALLET_PASSWORD"),
-        },
+        neo=NeoSettings(
+            rpc_url=os.getenv("NEO_RPC_URL", "https://testnet1.neo.coz.io:443"),
+            network_magic=int(os.getenv("NEO_NETWORK_MAGIC", "894710606")),
+            private_key=os.getenv("NEO_PRIVATE_KEY"),
+            wallet_address=os.getenv("NEO_WALLET_ADDRESS"),
+            wallet_path=os.getenv("NEO_WALLET_PATH"),
+            wallet_password=os.getenv("NEO_WALLET_PASSWORD"),
+        ),
         # Chatten Contract
-        "contract": {
-            "hash": os.getenv("CHATTEN_CONTRACT_HASH"),
-            "owner": os.getenv("CHATTEN_OWNER_ADDRESS"),
-        },
+        contract=ContractSettings(
+            hash=os.getenv("CHATTEN_CONTRACT_HASH"),
+            owner=os.getenv("CHATTEN_OWNER_ADDRESS"),
+        ),
         # SpoonOS Configuration
-        "spoon": {
-            "api_key": os.getenv("SPOON_API_KEY"),
-            "workspace_id": os.getenv("SPOON_WORKSPACE_ID"),
-            "agent_name": os.getenv("SPOON_AGENT_NAME", "ChattenTrader"),
-        },
+        spoon=SpoonSettings(
+            api_key=os.getenv("SPOON_API_KEY"),
+            workspace_id=os.getenv("SPOON_WORKSPACE_ID"),
+            agent_name=os.getenv("SPOON_AGENT_NAME", "ChattenTrader"),
+        ),
         # OpenAI Configuration
-        "openai": {
-            "api_key": os.getenv("OPENAI_API_KEY"),
-            "model": os.getenv("OPENAI_MODEL", "gpt-4-turbo-preview"),
-            "temperature": float(os.getenv("OPENAI_TEMPERATURE", "0.7")),
-        },
+        openai=OpenAISettings(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            model=os.getenv("OPENAI_MODEL", "gpt-4-turbo-preview"),
+            temperature=float(os.getenv("OPENAI_TEMPERATURE", "0.7")),
+        ),
         # Application Settings
-        "app": {
-            "debug": os.getenv("DEBUG", "false").lower() == "true",
-            "dry_run": os.getenv("DRY_RUN", "false").lower() == "true",
-            "log_level": os.getenv("LOG_LEVEL", "INFO"),
-        }
-    }
+        app=AppSettings(
+            debug=os.getenv("DEBUG", "false").lower() == "true",
+            dry_run=os.getenv("DRY_RUN", "false").lower() == "true",
+            log_level=os.getenv("LOG_LEVEL", "INFO"),
+        ),
+    )
 
 
-def validate_config(config: dict) -> list[str]:
+def validate_config(config: AppConfig) -> list[str]:
     """
     Validate required configuration values.
     
     Args:
-        config: Configuration dictionary
+        config: Application configuration
         
     Returns:
         list: List of validation errors (empty if valid)
@@ -78,23 +167,23 @@ def validate_config(config: dict) -> list[str]:
     errors = []
     
     # Check critical values
-    if not config["neo"]["rpc_url"]:
+    if not config.neo.rpc_url:
         errors.append("NEO_RPC_URL is required")
     
-    if not config["openai"]["api_key"]:
+    if not config.openai.api_key:
         errors.append("OPENAI_API_KEY is required")
     
     # Warn about optional but recommended values
-    if not config["neo"]["wallet_address"]:
+    if not config.neo.wallet_address:
         print("⚠️  Warning: NEO_WALLET_ADDRESS not set - some features will be limited")
     
-    if not config["spoon"]["api_key"]:
+    if not config.spoon.api_key:
         print("⚠️  Warning: SPOON_API_KEY not set - SpoonOS features disabled")
     
     return errors
 
 
-def setup_tools(config: dict) -> dict:
+def setup_tools(config: AppConfig) -> dict:
     """
     Initialize and configure SpoonOS tools.
     
@@ -106,16 +195,16 @@ def setup_tools(config: dict) -> dict:
     """
     # Create Neo bridge configuration
     neo_config = NeoConfig(
-        rpc_url=config["neo"]["rpc_url"],
-        network_magic=config["neo"]["network_magic"],
-        wallet_path=config["neo"]["wallet_path"],
-        wallet_password=config["neo"]["wallet_password"],
+        rpc_url=config.neo.rpc_url,
+        network_magic=config.neo.network_magic,
+        wallet_path=config.neo.wallet_path,
+        wallet_password=config.neo.wallet_password,
     )
     
     # Initialize tools
     neo_bridge = NeoBridgeTool(config=neo_config)
     
-    contract_hash = config["contract"]["hash"] or ""
+    contract_hash = config.contract.hash or ""
     
     tools = {
         "neo_bridge": neo_bridge,
@@ -127,7 +216,7 @@ def setup_tools(config: dict) -> dict:
     return tools
 
 
-def create_agent(config: dict, tools: Optional[dict] = None) -> ChattenTraderAgent:
+def create_agent(config: AppConfig, tools: Optional[dict] = None) -> ChattenTraderAgent:
     """
     Create and configure the Chatten Trader Agent.
     
@@ -139,8 +228,8 @@ def create_agent(config: dict, tools: Optional[dict] = None) -> ChattenTraderAge
         ChattenTraderAgent: Configured agent instance
     """
     agent = ChattenTraderAgent(
-        name=config["spoon"]["agent_name"],
-        neo_wallet_address=config["neo"]["wallet_address"],
+        name=config.spoon.agent_name,
+        neo_wallet_address=config.neo.wallet_address,
     )
     
     # TODO: Register tools with agent
@@ -151,7 +240,7 @@ def create_agent(config: dict, tools: Optional[dict] = None) -> ChattenTraderAge
     return agent
 
 
-async def run_agent(agent: ChattenTraderAgent, config: dict) -> None:
+async def run_agent(agent: ChattenTraderAgent, config: AppConfig) -> None:
     """
     Run the agent's main loop.
     
@@ -161,7 +250,7 @@ async def run_agent(agent: ChattenTraderAgent, config: dict) -> None:
     """
     print("🚀 Starting Chatten Trader Agent...")
     print(f"   Agent: {agent.name}")
-    print(f"   Network: {'TestNet' if 'testnet' in config['neo']['rpc_url'] else 'MainNet'}")
+    print(f"   Network: {'TestNet' if 'testnet' in config.neo.rpc_url else 'MainNet'}")
     print(f"   Wallet: {agent.neo_wallet_address or 'Not configured'}")
     print()
     
@@ -202,21 +291,8 @@ async def async_main() -> int:
     Returns:
         int: Exit code
     """
-    print()
-    print("╔══════════════════════════════════════════════════════════════╗")
-    print("║                                                              ║")
-    print("║   ██████╗██╗  ██╗ █████╗ ████████╗████████╗███████╗███╗   ██╗║")
-    print("║  ██╔════╝██║  ██║██╔══██╗╚══██╔══╝╚══██╔══╝██╔════╝████╗  ██║║")
-    print("║  ██║     ███████║███████║   ██║      ██║   █████╗  ██╔██╗ ██║║")
-    print("║  ██║     ██╔══██║██╔══██║   ██║      ██║   ██╔══╝  ██║╚██╗██║║")
-    print("║  ╚██████╗██║  ██║██║  ██║   ██║      ██║   ███████╗██║ ╚████║║")
-    print("║   ╚═════╝╚═╝  ╚═╝╚═╝  ╚═╝   ╚═╝      ╚═╝   ╚══════╝╚═╝  ╚═══╝║")
-    print("║                                                              ║")
-    print("║        Decentralized Exchange for AI Compute                 ║")
-    print("║              Powered by Neo N3 & SpoonOS                     ║")
-    print("║                                                              ║")
-    print("╚══════════════════════════════════════════════════════════════╝")
-    print()
+    sys.stdout.write(_BANNER)
+    sys.stdout.flush()
     
     # Load and validate configuration
     config = get_config()
@@ -247,7 +323,8 @@ def main() -> None:
     """
     Main entry point for the Chatten application.
     """
-    exit_code = asyncio.run(async_main())
+    with asyncio.Runner(loop_factory=_LOOP_FACTORY) as runner:
+        exit_code = runner.run(async_main())
     sys.exit(exit_code)
 
 
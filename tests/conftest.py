@@ -10,6 +10,23 @@ from unittest.mock import MagicMock, AsyncMock
 from dataclasses import dataclass
 from typing import Any, Optional
 
+from tools import (
+    NeoBridgeTool,
+    TokenBalanceTool,
+    TokenTransferTool,
+    QScoreAnalyzerTool,
+    PerformanceMetrics,
+)
+
+
+# Contract tests need neo3-boa to import the contract; skip collecting them
+# entirely when it is not installed.
+collect_ignore = []
+try:
+    import boa3.sc.compiletime  # noqa: F401
+except ImportError:
+    collect_ignore.append("test_contract.py")
+
 
 # =============================================================================
 # MOCK SPOON SDK
@@ -106,9 +123,45 @@ class MockNeoRpcClient:
 # =============================================================================
 
 @pytest.fixture
+def clean_neo_rpc_env(monkeypatch):
+    """Fixture removing NEO_RPC_URL so tools fall back to the default URL."""
+    monkeypatch.delenv("NEO_RPC_URL", raising=False)
+    yield
+
+
+@pytest.fixture(scope="session")
+def q_analyzer():
+    """Fixture providing a QScoreAnalyzerTool shared across the session."""
+    return QScoreAnalyzerTool()
+
+
+@pytest.fixture(scope="session")
+def neo_bridge_tool():
+    """Fixture providing a NeoBridgeTool shared across the session."""
+    return NeoBridgeTool()
+
+
+@pytest.fixture(scope="session")
+def token_balance_tool():
+    """Fixture providing a TokenBalanceTool shared across the session."""
+    return TokenBalanceTool(contract_hash="0x123")
+
+
+@pytest.fixture(scope="session")
+def token_transfer_tool():
+    """Fixture providing a TokenTransferTool shared across the session."""
+    return TokenTransferTool(contract_hash="0x123")
+
+
+@pytest.fixture(scope="session")
+def model_ids_pair():
+    """Fixture providing the model ids used by comparison tests."""
+    return ("model-a", "model-b")
+
+
+@pytest.fixture(scope="session")
 def sample_performance_metrics():
     """Fixture providing sample performance metrics for testing."""
-    from tools.market_tools import PerformanceMetrics
     return PerformanceMetrics(
         avg_latency_ms=50.0,
         p95_latency_ms=100.0,
@@ -124,10 +177,9 @@ def sample_performance_metrics():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_poor_metrics():
     """Fixture providing poor performance metrics for testing edge cases."""
-    from tools.market_tools import PerformanceMetrics
     return PerformanceMetrics(
         avg_latency_ms=500.0,
         p95_latency_ms=1000.0,
@@ -143,10 +195,9 @@ def sample_poor_metrics():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def excellent_metrics():
     """Fixture providing excellent performance metrics."""
-    from tools.market_tools import PerformanceMetrics
     return PerformanceMetrics(
         avg_latency_ms=25.0,
         p95_latency_ms=50.0,
@@ -2,8 +2,38 @@
 Tests for ChattenTraderAgent and its tools (PriceCheckTool, BuyComputeTool)
 """
 
+import asyncio
+import base64
+import dataclasses
+import hashlib
+import io
+import re
+import threading
+from decimal import Decimal
+
 import pytest
-import os
+
+from agents import ChattenTraderAgent, chatten_trader
+from agents.chatten_trader import (
+    GAS_TOKEN_HASH,
+    BuyComputeTool,
+    CheckAndBuyTool,
+    PriceCheckTool,
+    PriceResult,
+    TradeResult,
+    _gas_to_units,
+    _json_dumps,
+    _json_loads,
+    _pick_hash_extractor,
+    _price_storage_key,
+    get_contract_hash,
+    get_contract_hash_async,
+)
+from agents.numba_kernels import find_buy_candidates
+from tests.conftest import MockAccount, MockChainFacade, MockNeoRpcClient, MockUInt160
+
+CONTRACT_HASH = "0x" + "ab" * 20
+_HASH160_RE = re.compile(r"0x[0-9a-fA-F]{40}")
 
 
 class TestChattenTraderAgentImport:
@@ -11,140 +41,634 @@ class TestChattenTraderAgentImport:
 
     def test_import_from_agents_module(self):
         """Test basic import works."""
-        from agents import ChattenTraderAgent
         assert ChattenTraderAgent is not None
 
     def test_system_prompt_defined(self):
         """Test that SYSTEM_PROMPT class attribute exists."""
-        from agents import ChattenTraderAgent
         assert hasattr(ChattenTraderAgent, 'SYSTEM_PROMPT')
         assert "Liquidity Manager" in ChattenTraderAgent.SYSTEM_PROMPT
 
 
+@pytest.fixture(scope="class")
+def price_tool():
+    """PriceCheckTool shared by read-only tests in a class."""
+    return PriceCheckTool(contract_hash=CONTRACT_HASH)
+
+
+@pytest.fixture(scope="class")
+def buy_tool():
+    """BuyComputeTool shared by read-only tests in a class."""
+    return BuyComputeTool(contract_hash=CONTRACT_HASH)
+
+
 class TestPriceCheckTool:
     """Tests for PriceCheckTool."""
 
-    def test_tool_has_correct_name(self):
+    def test_tool_has_correct_name(self, price_tool):
         """Test tool name is correctly set."""
-        from agents.chatten_trader import PriceCheckTool
-        tool = PriceCheckTool(contract_hash="0x1234")
-        assert tool.name == "get_price"
+        assert price_tool.name == "get_price"
 
-    def test_tool_stores_contract_hash(self):
+    def test_tool_stores_contract_hash(self, price_tool):
         """Test that tool stores contract_hash."""
-        from agents.chatten_trader import PriceCheckTool
-        tool = PriceCheckTool(contract_hash="0xabc123")
-        assert tool.contract_hash == "0xabc123"
-
-    def test_tool_stores_custom_rpc_url(self):
-        """Test that tool stores custom rpc_url."""
-        from agents.chatten_trader import PriceCheckTool
-        tool = PriceCheckTool(
-            contract_hash="0xabc123",
-            rpc_url="http://test.local:50012"
-        )
-        assert tool.rpc_url == "http://test.local:50012"
-
-    def test_default_rpc_url_from_env(self):
+        assert price_tool.contract_hash == CONTRACT_HASH
+
+    def test_default_rpc_url_from_env(self, clean_neo_rpc_env):
         """Test default RPC URL is used when not provided."""
-        from agents.chatten_trader import PriceCheckTool
+        tool = PriceCheckTool(contract_hash=CONTRACT_HASH)
+        assert tool.rpc_url == "http://localhost:50012"
 
-        # Save original and clear env var
-        original = os.environ.get("NEO_RPC_URL")
-        if "NEO_RPC_URL" in os.environ:
-            del os.environ["NEO_RPC_URL"]
+    def test_tool_has_description(self, price_tool):
+        """Test tool has a description for agent context."""
+        assert price_tool.description
+
+
+class TestToolConfig:
+    """Test both trader tools store their constructor configuration."""
+
+    @pytest.mark.parametrize("tool_cls, expected", [
+        (PriceCheckTool, {
+            "contract_hash": CONTRACT_HASH,
+            "rpc_url": "http://test.local:50012",
+        }),
+        (BuyComputeTool, {
+            "contract_hash": CONTRACT_HASH,
+            "rpc_url": "http://test.local:50012",
+            "private_key": "test_key",
+        }),
+    ], ids=["PriceCheckTool", "BuyComputeTool"])
+    def test_tool_stores_config(self, tool_cls, expected):
+        """Test that tool stores configuration."""
+        tool = tool_cls(**expected)
+        assert {k: getattr(tool, k) for k in expected} == expected
 
-        try:
-            tool = PriceCheckTool(contract_hash="0x123")
-            assert tool.rpc_url == "http://localhost:50012"
-        finally:
-            if original:
-                os.environ["NEO_RPC_URL"] = original
 
-    def test_tool_has_description(self):
-        """Test tool has a description for agent context."""
-        from agents.chatten_trader import PriceCheckTool
-        tool = PriceCheckTool(contract_hash="0x123")
-        assert tool.description is not None
-        assert len(tool.description) > 0
+class TestToolModelIdValidation:
+    """Test both trader tools reject calls without a model_id."""
 
-    @pytest.mark.asyncio
-    async def test_run_requires_model_id(self):
+    @pytest.mark.parametrize("tool_cls, run_kwargs", [
+        (PriceCheckTool, {}),
+        (BuyComputeTool, {"gas_amount": 1.0}),
+    ])
+    async def test_missing_model_id(self, tool_cls, run_kwargs):
         """Test that run returns error when model_id missing."""
-        from agents.chatten_trader import PriceCheckTool
-        tool = PriceCheckTool(contract_hash="0x123")
-        result = await tool.run()
-        assert result.get("success") is False or "error" in result
+        tool = tool_cls(contract_hash=CONTRACT_HASH)
+        result = await tool.run(**run_kwargs)
+        assert result.success is False
+        assert "model_id" in result.error.lower()
+
+
+class TestPriceCheckToolBatch:
+    """Tests for batched price lookups via JSON-RPC."""
+
+    async def test_get_prices_single_batch(self, monkeypatch):
+        """Test all model prices are fetched in one batch request."""
+        batches = []
+
+        async def fake_rpc_batch(rpc_url, calls):
+            batches.append(calls)
+            return [
+                {"result": {"state": "HALT", "stack": [{"type": "Integer", "value": str(i * 100)}]}}
+                for i, _ in enumerate(calls)
+            ]
+
+        monkeypatch.setattr(chatten_trader, "_rpc_batch", fake_rpc_batch)
+        tool = chatten_trader.PriceCheckTool(contract_hash="ab" * 20)
+        prices = await tool.get_prices(["gpt-4", "llama-3"])
+
+        assert len(batches) == 1
+        assert batches[0][0][0] == "invokefunction"
+        assert batches[0][0][1][0] == "0x" + "ab" * 20
+        assert prices == {"gpt-4": 0.0, "llama-3": 100.0}
+
+    async def test_get_prices_splits_large_batches(self, monkeypatch):
+        """Test batches are capped at MAX_RPC_BATCH_SIZE requests."""
+        sizes = []
+
+        async def fake_rpc_batch(rpc_url, calls):
+            sizes.append(len(calls))
+            return [{"result": {"stack": [{"type": "Integer", "value": "1"}]}} for _ in calls]
+
+        monkeypatch.setattr(chatten_trader, "_rpc_batch", fake_rpc_batch)
+        tool = chatten_trader.PriceCheckTool(contract_hash="ab" * 20)
+        model_ids = [f"model-{i}" for i in range(chatten_trader.MAX_RPC_BATCH_SIZE + 1)]
+        prices = await tool.get_prices(model_ids)
+
+        assert sizes == [chatten_trader.MAX_RPC_BATCH_SIZE, 1]
+        assert len(prices) == len(model_ids)
+
+    async def test_get_prices_skips_failed_models(self, monkeypatch):
+        """Test one faulted or empty invocation leaves the rest of the batch intact."""
+        async def fake_rpc_batch(rpc_url, calls):
+            return [
+                {"result": {"state": "FAULT", "exception": "boom", "stack": []}},
+                {"result": {"state": "HALT", "stack": [{"type": "Integer", "value": "7"}]}},
+                {"result": {"state": "HALT", "stack": []}},
+            ]
+
+        monkeypatch.setattr(chatten_trader, "_rpc_batch", fake_rpc_batch)
+        tool = chatten_trader.PriceCheckTool(contract_hash="ab" * 20)
+
+        assert await tool.get_prices(["gpt-4", "llama-3", "mistral"]) == {"llama-3": 7.0}
+
+    async def test_get_price_raises_on_fault(self, monkeypatch):
+        """Test get_price surfaces a faulted invocation as RuntimeError."""
+        async def fake_rpc_batch(rpc_url, calls):
+            return [{"result": {"state": "FAULT", "exception": "boom", "stack": []}}]
+
+        monkeypatch.setattr(chatten_trader, "_rpc_batch", fake_rpc_batch)
+        tool = chatten_trader.PriceCheckTool(contract_hash="ab" * 20)
+        tool._fast_read = False
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await tool.get_price("gpt-4")
+
+
+class TestRpcJson:
+    """Test JSON helpers used for raw RPC payloads."""
+
+    def test_dumps_returns_bytes_and_round_trips(self):
+        """Test payloads serialize to bytes and load back unchanged."""
+        payload = [{"jsonrpc": "2.0", "id": 0, "method": "getblockcount", "params": []}]
+        body = _json_dumps(payload)
+        assert isinstance(body, bytes)
+        assert _json_loads(body) == payload
+
+
+class TestPriceCheckToolConcurrent:
+    """Tests for concurrent per-model price lookups."""
+
+    async def test_get_prices_concurrent_bounded(self, monkeypatch):
+        """Test lookups overlap but never exceed the concurrency limit."""
+        tool = PriceCheckTool(contract_hash="ab" * 20)
+        in_flight = 0
+        peak = 0
+
+        async def fake_get_price(model_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return float(len(model_id))
+
+        monkeypatch.setattr(tool, "get_price", fake_get_price)
+        prices = await tool.get_prices_concurrent(["a", "bb", "ccc", "dddd"], concurrency=2)
+
+        assert prices == {"a": 1.0, "bb": 2.0, "ccc": 3.0, "dddd": 4.0}
+        assert peak == 2
+
+
+class TestPriceStorageFastPath:
+    """Tests for reading prices directly from contract storage."""
+
+    def test_storage_key_matches_contract_layout(self):
+        """Test the key is PREFIX_PRICE + sha256(model_id)."""
+        expected = b'\x20' + hashlib.sha256(b"gpt-4").digest()
+        assert base64.b64decode(_price_storage_key("gpt-4")) == expected
+
+    async def test_get_price_reads_storage(self, monkeypatch):
+        """Test get_price decodes the stored integer via getstorage."""
+        calls_made = []
+
+        async def fake_rpc_batch(rpc_url, calls):
+            calls_made.extend(calls)
+            raw = (750_000).to_bytes(3, "little", signed=True)
+            return [{"result": base64.b64encode(raw).decode()}]
+
+        monkeypatch.setattr(chatten_trader, "AIOHTTP_AVAILABLE", True)
+        monkeypatch.setattr(chatten_trader, "_rpc_batch", fake_rpc_batch)
+        tool = chatten_trader.PriceCheckTool(contract_hash=CONTRACT_HASH)
+
+        assert await tool.get_price("gpt-4") == 750_000.0
+        assert calls_made[0][0] == "getstorage"
+        assert calls_made[0][1][0] == CONTRACT_HASH
+
+    async def test_missing_slot_falls_back_to_test_invoke(self, monkeypatch):
+        """Test an empty storage read falls back to invokefunction."""
+        methods = []
+
+        async def fake_rpc_batch(rpc_url, calls):
+            methods.extend(method for method, _ in calls)
+            if calls[0][0] == "getstorage":
+                return [{"result": None}]
+            return [{"result": {"state": "HALT", "stack": [{"type": "Integer", "value": "500000"}]}}]
+
+        monkeypatch.setattr(chatten_trader, "AIOHTTP_AVAILABLE", True)
+        monkeypatch.setattr(chatten_trader, "_rpc_batch", fake_rpc_batch)
+        tool = chatten_trader.PriceCheckTool(contract_hash=CONTRACT_HASH)
+
+        assert await tool.get_price("gpt-4") == 500_000.0
+        assert methods == ["getstorage", "invokefunction"]
+
+    async def test_storage_error_falls_back_to_test_invoke(self, monkeypatch, caplog):
+        """Test a failing storage read is logged and falls back to invokefunction."""
+        async def fake_rpc_batch(rpc_url, calls):
+            if calls[0][0] == "getstorage":
+                raise RuntimeError("getstorage disabled")
+            return [{"result": {"state": "HALT", "stack": [{"type": "Integer", "value": "500000"}]}}]
+
+        monkeypatch.setattr(chatten_trader, "AIOHTTP_AVAILABLE", True)
+        monkeypatch.setattr(chatten_trader, "_rpc_batch", fake_rpc_batch)
+        tool = chatten_trader.PriceCheckTool(contract_hash=CONTRACT_HASH)
+
+        assert await tool.get_price("gpt-4") == 500_000.0
+        assert "getstorage disabled" in caplog.text
+
+    def test_fast_read_can_be_disabled(self, monkeypatch):
+        """Test CHATTEN_FAST_READ=0 turns the storage path off."""
+        monkeypatch.setenv("CHATTEN_FAST_READ", "0")
+        assert PriceCheckTool(contract_hash=CONTRACT_HASH)._fast_read is False
+
+
+class TestPriceCache:
+    """Tests for the short-TTL price cache."""
+
+    @pytest.fixture
+    def counting_rpc(self, monkeypatch):
+        """Patch the batch RPC helper and record requested model counts."""
+        calls_made = []
+
+        async def fake_rpc_batch(rpc_url, calls):
+            calls_made.append(len(calls))
+            return [{"result": {"stack": [{"type": "Integer", "value": "42"}]}} for _ in calls]
+
+        monkeypatch.setattr(chatten_trader, "_rpc_batch", fake_rpc_batch)
+        return calls_made
+
+    async def test_repeat_lookup_served_from_cache(self, counting_rpc):
+        """Test a second lookup within the TTL does not hit the RPC node."""
+        tool = PriceCheckTool(contract_hash="ab" * 20)
+
+        await tool.get_prices(["gpt-4"])
+        prices = await tool.get_prices(["gpt-4", "llama-3"])
+
+        assert counting_rpc == [1, 1]
+        assert prices == {"gpt-4": 42.0, "llama-3": 42.0}
+
+    async def test_invalidate_forces_refetch(self, counting_rpc):
+        """Test invalidate() drops the cached price."""
+        tool = PriceCheckTool(contract_hash="ab" * 20)
+
+        await tool.get_prices(["gpt-4"])
+        tool.invalidate("gpt-4")
+        await tool.get_prices(["gpt-4"])
+
+        assert counting_rpc == [1, 1]
+
+    async def test_zero_ttl_disables_cache(self, counting_rpc, monkeypatch):
+        """Test CHATTEN_PRICE_TTL=0 always re-fetches."""
+        monkeypatch.setenv("CHATTEN_PRICE_TTL", "0")
+        tool = PriceCheckTool(contract_hash="ab" * 20)
+
+        await tool.get_prices(["gpt-4"])
+        await tool.get_prices(["gpt-4"])
+
+        assert counting_rpc == [1, 1]
+
+
+class TestSharedClients:
+    """Tests for RPC clients shared across tools."""
+
+    async def test_shared_client_reused_per_url(self, monkeypatch):
+        """Test tools on the same RPC URL share one client until closed."""
+        class ClosableClient(MockNeoRpcClient):
+            closed = False
+
+            async def close(self):
+                self.closed = True
+
+        monkeypatch.setattr(chatten_trader, "NEO3_AVAILABLE", True)
+        monkeypatch.setattr(chatten_trader, "NeoRpcClient", ClosableClient)
+
+        first = chatten_trader._get_shared_client("http://test.local:50012")
+        second = chatten_trader._get_shared_client("http://test.local:50012")
+        other = chatten_trader._get_shared_client("http://other.local:50012")
+
+        assert first is second
+        assert first is not other
+
+        await chatten_trader.aclose_shared_clients()
+        assert first.closed and other.closed
+        assert chatten_trader._get_shared_client("http://test.local:50012") is not first
+        await chatten_trader.aclose_shared_clients()
+
+    async def test_tools_share_facade(self, monkeypatch):
+        """Test buy tools on one RPC URL share a ChainFacade."""
+        class ClosableClient(MockNeoRpcClient):
+            async def close(self):
+                pass
+
+        monkeypatch.setattr(chatten_trader, "NEO3_AVAILABLE", True)
+        monkeypatch.setattr(chatten_trader, "NeoRpcClient", ClosableClient)
+        monkeypatch.setattr(chatten_trader, "ChainFacade", MockChainFacade)
+
+        first = chatten_trader.BuyComputeTool(contract_hash=CONTRACT_HASH, rpc_url="http://test.local:50012")
+        second = chatten_trader.BuyComputeTool(contract_hash=CONTRACT_HASH, rpc_url="http://test.local:50012")
+
+        assert await first._get_facade() is await second._get_facade()
+        await chatten_trader.aclose_shared_clients()
 
 
 class TestBuyComputeTool:
     """Tests for BuyComputeTool."""
 
-    def test_tool_has_correct_name(self):
+    def test_tool_has_correct_name(self, buy_tool):
         """Test tool name is correctly set."""
-        from agents.chatten_trader import BuyComputeTool
-        tool = BuyComputeTool(contract_hash="0x1234")
-        assert tool.name == "buy_credits"
+        assert buy_tool.name == "buy_credits"
 
-    def test_tool_stores_config(self):
-        """Test that tool stores configuration."""
-        from agents.chatten_trader import BuyComputeTool
-        tool = BuyComputeTool(
-            contract_hash="0xabc123",
-            rpc_url="http://test.local:50012",
-            private_key="test_key"
-        )
-        assert tool.contract_hash == "0xabc123"
-        assert tool.rpc_url == "http://test.local:50012"
-        assert tool.private_key == "test_key"
-
-    def test_default_rpc_url(self):
+    def test_default_rpc_url(self, clean_neo_rpc_env):
         """Test default RPC URL is used when not provided."""
-        from agents.chatten_trader import BuyComputeTool
-
-        original = os.environ.get("NEO_RPC_URL")
-        if "NEO_RPC_URL" in os.environ:
-            del os.environ["NEO_RPC_URL"]
-
-        try:
-            tool = BuyComputeTool(contract_hash="0x123")
-            assert tool.rpc_url == "http://localhost:50012"
-        finally:
-            if original:
-                os.environ["NEO_RPC_URL"] = original
+        tool = BuyComputeTool(contract_hash=CONTRACT_HASH)
+        assert tool.rpc_url == "http://localhost:50012"
 
-    def test_tool_has_description(self):
+    def test_tool_has_description(self, buy_tool):
         """Test tool has a description for agent context."""
-        from agents.chatten_trader import BuyComputeTool
-        tool = BuyComputeTool(contract_hash="0x123")
-        assert tool.description is not None
-        assert len(tool.description) > 0
+        assert buy_tool.description
+
+    @pytest.mark.parametrize("tool_cls, result_cls", [
+        (PriceCheckTool, chatten_trader.PriceResult),
+        (BuyComputeTool, chatten_trader.TradeResult),
+        (chatten_trader.CheckAndBuyTool, chatten_trader.CheckAndBuyResult),
+    ])
+    def test_description_documents_result_fields(self, tool_cls, result_cls):
+        """Test each description names the result type run() returns and its fields."""
+        description = tool_cls.description
+        assert result_cls.__name__ in description
+        assert all(field in description for field in result_cls.__dataclass_fields__)
 
-    @pytest.mark.asyncio
-    async def test_run_requires_model_id(self):
-        """Test that run returns error when model_id missing."""
-        from agents.chatten_trader import BuyComputeTool
-        tool = BuyComputeTool(contract_hash="0x123")
-        result = await tool.run(gas_amount=1.0)
-        assert result["success"] is False
-        assert "model_id" in result["error"].lower()
-
-    @pytest.mark.asyncio
     async def test_run_requires_positive_gas(self):
         """Test that run returns error when gas_amount invalid."""
-        from agents.chatten_trader import BuyComputeTool
-        tool = BuyComputeTool(contract_hash="0x123")
+        tool = BuyComputeTool(contract_hash=CONTRACT_HASH)
         result = await tool.run(model_id="gpt-4", gas_amount=0)
-        assert result["success"] is False
-        assert "gas_amount" in result["error"].lower()
+        assert result.success is False
+        assert "gas_amount" in result.error.lower()
 
-    @pytest.mark.asyncio
     async def test_run_requires_negative_gas_rejected(self):
         """Test that run returns error when gas_amount is negative."""
-        from agents.chatten_trader import BuyComputeTool
-        tool = BuyComputeTool(contract_hash="0x123")
+        tool = BuyComputeTool(contract_hash=CONTRACT_HASH)
         result = await tool.run(model_id="gpt-4", gas_amount=-1.0)
-        assert result["success"] is False
+        assert result.success is False
+
+
+class TestGetContractHash:
+    """Test contract hash lookup from env or prompt."""
+
+    def test_reads_env_and_strips_prefix(self, monkeypatch):
+        """Test CHATTEN_CONTRACT_HASH is used without prompting and normalized."""
+        monkeypatch.setenv("CHATTEN_CONTRACT_HASH", "0x" + "AB" * 20)
+        assert get_contract_hash() == "ab" * 20
+
+    async def test_async_reads_env(self, monkeypatch):
+        """Test the async variant takes the env fast path."""
+        monkeypatch.setenv("CHATTEN_CONTRACT_HASH", CONTRACT_HASH)
+        assert await get_contract_hash_async() == "ab" * 20
+
+    def test_rejects_malformed_env_hash(self, monkeypatch):
+        """Test a malformed CHATTEN_CONTRACT_HASH raises ValueError."""
+        monkeypatch.setenv("CHATTEN_CONTRACT_HASH", "0xabc123")
+        with pytest.raises(ValueError):
+            get_contract_hash()
+
+    def test_raises_without_env_or_terminal(self, monkeypatch):
+        """Test a missing hash fails fast when stdin is not a terminal."""
+        monkeypatch.delenv("CHATTEN_CONTRACT_HASH", raising=False)
+        monkeypatch.setattr("sys.stdin", io.StringIO(""))
+        with pytest.raises(ValueError):
+            get_contract_hash()
+
+    async def test_tool_memoizes_resolved_hash(self, monkeypatch):
+        """Test a tool looks the hash up once and keeps it."""
+        monkeypatch.setenv("CHATTEN_CONTRACT_HASH", CONTRACT_HASH)
+        tool = PriceCheckTool()
+        assert await tool._resolve_contract_hash() == CONTRACT_HASH
+        assert tool.contract_hash == "ab" * 20
+
+
+class TestBuyComputeToolAccount:
+    """Test account loading for BuyComputeTool."""
+
+    async def test_account_derived_once_off_loop(self, monkeypatch):
+        """Test the account is derived in a worker thread and cached."""
+        threads = []
+
+        class ThreadRecordingAccount(MockAccount):
+            @classmethod
+            def from_wif(cls, wif):
+                threads.append(threading.current_thread())
+                return cls()
+
+        monkeypatch.setattr(chatten_trader, "NEO3_AVAILABLE", True)
+        monkeypatch.setattr(chatten_trader, "Account", ThreadRecordingAccount)
+        tool = chatten_trader.BuyComputeTool(contract_hash=CONTRACT_HASH, private_key="test_key")
+
+        first = await tool._get_account()
+        second = await tool._get_account()
+
+        assert first is second
+        assert len(threads) == 1
+        assert threads[0] is not threading.main_thread()
+
+    async def test_sender_script_hash_read_once(self, monkeypatch):
+        """Test the sender script hash is taken from the account only once."""
+        reads = []
+
+        class CountingAccount(MockAccount):
+            @property
+            def script_hash(self):
+                reads.append(1)
+                return MockUInt160()
+
+            @script_hash.setter
+            def script_hash(self, value):
+                pass
+
+        monkeypatch.setattr(chatten_trader, "NEO3_AVAILABLE", True)
+        monkeypatch.setattr(chatten_trader, "Account", CountingAccount)
+        monkeypatch.setattr(chatten_trader, "UInt160", MockUInt160)
+        tool = chatten_trader.BuyComputeTool(contract_hash=CONTRACT_HASH, private_key="test_key")
+
+        async def fake_get_facade():
+            return MockChainFacade()
+
+        monkeypatch.setattr(tool, "_get_facade", fake_get_facade)
+        await tool.buy_credits("gpt-4", 1.0)
+        await tool.buy_credits("gpt-4", 1.0)
+
+        assert len(reads) == 1
+
+    async def test_account_requires_private_key(self, monkeypatch):
+        """Test a missing private key raises ValueError."""
+        monkeypatch.delenv("NEO_PRIVATE_KEY", raising=False)
+        tool = BuyComputeTool(contract_hash=CONTRACT_HASH)
+        with pytest.raises(ValueError):
+            await tool._get_account()
+
+
+class TestFindBuyCandidates:
+    """Test the price-threshold scan kernel."""
+
+    def test_returns_indices_below_threshold(self):
+        """Test only strictly-below-threshold prices are selected."""
+        prices = [500_000, 1_000_000, 999_999, 2_000_000, 0]
+        assert find_buy_candidates(prices, 1_000_000) == [0, 2, 4]
+
+    def test_empty_prices(self):
+        """Test an empty scan returns no candidates."""
+        assert find_buy_candidates([], 1_000_000) == []
+
+    @pytest.mark.parametrize("backend", ["numba", "numpy", "python"])
+    @pytest.mark.parametrize("threshold, expected", [(999_999.5, [0, 2, 4]), (999_999.0, [0, 4])])
+    def test_float_threshold_matches_across_backends(self, backend, threshold, expected, monkeypatch):
+        """Test a fractional threshold selects the same prices on every backend."""
+        from agents import numba_kernels
+
+        if backend == "numba" and not numba_kernels.NUMBA_AVAILABLE:
+            pytest.skip("numba not installed")
+        if backend == "numpy" and not numba_kernels.NUMPY_AVAILABLE:
+            pytest.skip("numpy not installed")
+        monkeypatch.setattr(numba_kernels, "NUMBA_AVAILABLE", backend == "numba")
+        monkeypatch.setattr(numba_kernels, "NUMPY_AVAILABLE", backend != "python")
+
+        prices = [500_000, 1_000_000, 999_999, 2_000_000, 0]
+        assert find_buy_candidates(prices, threshold) == expected
+
+
+class TestGasToUnits:
+    """Test GAS to smallest-unit conversion."""
+
+    @pytest.mark.parametrize("gas_amount, expected", [
+        (2.0, 200_000_000),
+        (0.29, 29_000_000),
+        ("1.123456789", 112_345_678),
+    ])
+    def test_exact_conversion(self, gas_amount, expected):
+        """Test conversion avoids float drift and truncates sub-unit dust."""
+        assert _gas_to_units(Decimal(gas_amount) if isinstance(gas_amount, str) else gas_amount) == expected
+
+
+class TestHashExtractor:
+    """Test transaction hash extraction from invoke results."""
+
+    @pytest.mark.parametrize("tx, expected", [
+        (type("Tx", (), {"hash": "0xaaa"})(), "0xaaa"),
+        (type("Tx", (), {"tx_id": "0xbbb"})(), "0xbbb"),
+        ("0xccc", "0xccc"),
+    ])
+    def test_extractor_matches_result_shape(self, tx, expected):
+        """Test the picked extractor reads the hash for each shape."""
+        assert _pick_hash_extractor(tx)(tx) == expected
+
+
+class TestScanAndBuy:
+    """Tests for ChattenTraderAgent.scan_and_buy."""
+
+    async def test_duplicate_models_bought_once(self, monkeypatch):
+        """Test repeated model ids are priced and bought once, in first-seen order."""
+        price_tool = PriceCheckTool(contract_hash=CONTRACT_HASH)
+        buy_tool = BuyComputeTool(contract_hash=CONTRACT_HASH)
+        requested, buys = [], []
+
+        async def fake_get_prices(model_ids):
+            requested.append(model_ids)
+            return {"gpt-4": 500_000.0, "llama-3": 2_000_000.0, "mistral": 10.0}
+
+        async def fake_buy_credits(model_id, gas_amount=0.0):
+            buys.append(model_id)
+            return TradeResult(model_id=model_id, success=True, gas_amount=gas_amount)
+
+        monkeypatch.setattr(price_tool, "get_prices", fake_get_prices)
+        monkeypatch.setattr(buy_tool, "buy_credits", fake_buy_credits)
+        # The SDK base class is unavailable here, so skip ToolCallAgent.__init__
+        agent = object.__new__(ChattenTraderAgent)
+        agent.price_tool, agent.buy_tool = price_tool, buy_tool
+
+        results = await agent.scan_and_buy(["mistral", "gpt-4", "mistral", "llama-3", "gpt-4"])
+
+        assert requested == [["mistral", "gpt-4", "llama-3"]]
+        assert buys == ["mistral", "gpt-4"]
+        assert [r.model_id for r in results] == ["mistral", "gpt-4"]
+
+
+class TestToolResults:
+    """Test the result dataclasses returned by the trader tools."""
+
+    def test_results_are_slotted_and_frozen(self):
+        """Test results have no per-instance dict and are immutable."""
+        price = PriceResult(model_id="gpt-4", success=True, price=1.0)
+        trade = TradeResult(model_id="gpt-4", success=True, gas_amount=2.0, tx_hash="0xabc")
+
+        for result in (price, trade):
+            assert not hasattr(result, "__dict__")
+            with pytest.raises(dataclasses.FrozenInstanceError):
+                result.success = False
+
+    def test_results_convert_to_dict(self):
+        """Test results can be dict-ified at the SDK boundary."""
+        result = PriceResult(model_id="gpt-4", success=False, error="boom")
+        assert dataclasses.asdict(result) == {
+            "model_id": "gpt-4",
+            "success": False,
+            "price": None,
+            "error": "boom",
+        }
+
+
+class TestCheckAndBuyTool:
+    """Tests for the fused price-check + conditional-buy tool."""
+
+    @pytest.fixture
+    def tools(self, monkeypatch):
+        """Price and buy tools with stubbed chain access."""
+        price_tool = PriceCheckTool(contract_hash=CONTRACT_HASH)
+        buy_tool = BuyComputeTool(contract_hash=CONTRACT_HASH, price_tool=price_tool)
+        buys = []
+
+        async def fake_buy_credits(model_id, gas_amount=0.0, gas_amount_units=None):
+            buys.append((model_id, gas_amount))
+            return TradeResult(model_id=model_id, success=True, gas_amount=gas_amount, tx_hash="0xabc")
+
+        monkeypatch.setattr(buy_tool, "buy_credits", fake_buy_credits)
+        return price_tool, buy_tool, buys
+
+    async def test_buys_when_below_threshold(self, tools, monkeypatch):
+        """Test a price below threshold triggers a buy."""
+        price_tool, buy_tool, buys = tools
+
+        async def fake_get_price(model_id):
+            return 500_000.0
+
+        monkeypatch.setattr(price_tool, "get_price", fake_get_price)
+        tool = CheckAndBuyTool(price_tool, buy_tool)
+        result = await tool.run(model_id="gpt-4", threshold=1_000_000, gas_amount=2.0)
+
+        assert tool.name == "check_and_buy_if_below"
+        assert result.success is True
+        assert result.bought is True
+        assert result.trade.tx_hash == "0xabc"
+        assert buys == [("gpt-4", 2.0)]
+
+    async def test_skips_when_at_or_above_threshold(self, tools, monkeypatch):
+        """Test no buy happens when the price is not attractive."""
+        price_tool, buy_tool, buys = tools
+
+        async def fake_get_price(model_id):
+            return 1_000_000.0
+
+        monkeypatch.setattr(price_tool, "get_price", fake_get_price)
+        tool = CheckAndBuyTool(price_tool, buy_tool)
+        result = await tool.run(model_id="gpt-4")
+
+        assert result.success is True
+        assert result.bought is False
+        assert result.price == 1_000_000.0
+        assert buys == []
+
+    async def test_run_requires_model_id(self, tools):
+        """Test that run returns error when model_id missing."""
+        price_tool, buy_tool, _ = tools
+        result = await CheckAndBuyTool(price_tool, buy_tool).run()
+        assert result.success is False
+        assert "model_id" in result.error.lower()
 
 
 class TestGasTokenHash:
@@ -152,22 +676,48 @@ class TestGasTokenHash:
 
     def test_gas_token_hash_format(self):
         """Test GAS token hash is in correct format."""
-        from agents.chatten_trader import GAS_TOKEN_HASH
-        assert GAS_TOKEN_HASH.startswith("0x")
-        assert len(GAS_TOKEN_HASH) == 42  # 0x + 40 hex chars
+        assert _HASH160_RE.fullmatch(GAS_TOKEN_HASH)  # 0x + 40 hex chars
 
 
 class TestContractHashHelpers:
     """Test contract hash handling."""
 
-    def test_contract_hash_without_prefix(self):
-        """Test tool accepts contract hash without 0x prefix."""
-        from agents.chatten_trader import PriceCheckTool
-        tool = PriceCheckTool(contract_hash="abc123def456")
-        assert tool.contract_hash == "abc123def456"
-
-    def test_contract_hash_with_prefix(self):
-        """Test tool accepts contract hash with 0x prefix."""
-        from agents.chatten_trader import PriceCheckTool
-        tool = PriceCheckTool(contract_hash="0xabc123def456")
-        assert tool.contract_hash == "0xabc123def456"
+    @pytest.mark.parametrize("contract_hash", [
+        "abc123def456" * 3 + "abcd",
+        "0x" + "abc123def456" * 3 + "abcd",
+    ], ids=["no_prefix", "prefix"])
+    def test_contract_hash_roundtrip(self, contract_hash):
+        """Test tool keeps the contract hash exactly as given, with or without 0x."""
+        assert PriceCheckTool(contract_hash=contract_hash).contract_hash is contract_hash
+
+    @pytest.mark.parametrize("contract_hash", ["0x123", "zz" * 20, "0x" + "ab" * 21])
+    def test_invalid_contract_hash_rejected(self, contract_hash):
+        """Test malformed contract hashes fail at construction."""
+        for tool_cls in (PriceCheckTool, BuyComputeTool):
+            with pytest.raises(ValueError):
+                tool_cls(contract_hash=contract_hash)
+
+    def test_contract_hash_normalized_once(self):
+        """Test the normalized hash is lowercase and 0x-prefixed."""
+        tool = PriceCheckTool(contract_hash="AB" * 20)
+        assert tool._contract_hex == "0x" + "ab" * 20
+        assert _HASH160_RE.fullmatch(tool._contract_hex)
+
+    async def test_contract_script_hash_parsed_once(self, monkeypatch):
+        """Test the contract script hash is parsed once and memoized."""
+        parsed = []
+
+        class CountingUInt160(MockUInt160):
+            @classmethod
+            def from_string(cls, hex_string):
+                parsed.append(hex_string)
+                return cls()
+
+        monkeypatch.setattr(chatten_trader, "UInt160", CountingUInt160)
+        tool = chatten_trader.BuyComputeTool(contract_hash="ab" * 20)
+
+        first = await tool._get_contract_script_hash()
+        second = await tool._get_contract_script_hash()
+
+        assert first is second
+        assert parsed == ["0x" + "ab" * 20]
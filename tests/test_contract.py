@@ -5,22 +5,12 @@ These tests verify the contract structure and constants.
 Full integration tests require a Neo N3 test environment.
 
 Note: These tests require neo3-boa to be installed to import the contract.
+conftest.py leaves this module out of collection when it is missing.
 """
 
 import pytest
 
-# Check if neo3-boa is available
-try:
-    from boa3.sc.compiletime import public  # noqa: F401
-    BOA3_AVAILABLE = True
-except ImportError:
-    BOA3_AVAILABLE = False
-
-# Skip all contract tests if boa3 is not installed
-pytestmark = pytest.mark.skipif(
-    not BOA3_AVAILABLE,
-    reason="neo3-boa not installed - contract tests require boa3"
-)
+boa3 = pytest.importorskip("boa3.sc.compiletime", reason="neo3-boa not installed")
 
 
 class TestChattenConstants:
@@ -102,8 +92,7 @@ class TestStoragePrefixes:
             PREFIX_OWNERSHIP_CLAIMED,
         ]
 
-        unique_prefixes = set(prefixes)
-        assert len(unique_prefixes) == len(prefixes), "Storage prefixes must be unique"
+        assert len({*prefixes}) == len(prefixes), "Storage prefixes must be unique"
 
 
 class TestNEP11Methods:
@@ -134,90 +123,78 @@ class TestZeroAddress:
         assert ZERO_ADDRESS == b'\x00' * 20
 
 
-class TestContractFunctions:
-    """Test suite verifying contract functions exist."""
-
-    def test_nep11_methods_exist(self):
-        """Test that core NEP-11 methods exist."""
-        from contracts import chatten_token
-
-        nep11_methods = [
-            'symbol',
-            'decimals',
-            'totalSupply',
-            'balanceOf',
-            'tokensOf',
-            'transfer',
-            'tokenSupply',
-        ]
-
-        for method in nep11_methods:
-            assert hasattr(chatten_token, method), f"Missing NEP-11 method: {method}"
-
-    def test_pricing_methods_exist(self):
-        """Verify pricing engine methods exist."""
-        from contracts import chatten_token
+EXPECTED_METHODS = [
+    ("nep11", "symbol"),
+    ("nep11", "decimals"),
+    ("nep11", "totalSupply"),
+    ("nep11", "balanceOf"),
+    ("nep11", "tokensOf"),
+    ("nep11", "transfer"),
+    ("nep11", "tokenSupply"),
+    ("pricing", "get_current_price"),
+    ("pricing", "update_price_oracle"),
+    ("pricing", "get_gas_reserve"),
+    ("swap", "buy_compute"),
+    ("swap", "sell_compute"),
+    ("receiver", "onNEP17Payment"),
+    ("receiver", "onNEP11Payment"),
+    ("admin", "pause"),
+    ("admin", "resume"),
+    ("admin", "isPaused"),
+    ("admin", "set_oracle"),
+    ("admin", "set_minter"),
+    ("admin", "get_admin"),
+    ("admin", "is_oracle"),
+    ("admin", "is_minter"),
+    ("admin", "withdraw_gas"),
+    ("admin", "claim_ownership"),
+    ("admin", "is_ownership_claimed"),
+    ("mint_burn", "mint"),
+    ("mint_burn", "burn"),
+]
+
+
+@pytest.fixture(scope="session")
+def contract_module():
+    """The compiled-contract module, imported once per session."""
+    from contracts import chatten_token
+    return chatten_token
+
+
+@pytest.fixture(scope="session")
+def chatten_attrs(contract_module):
+    """Names defined by the contract module, computed once per session."""
+    return frozenset(dir(contract_module))
 
-        pricing_methods = [
-            'get_current_price',
-            'update_price_oracle',
-            'get_gas_reserve',
-        ]
 
-        for method in pricing_methods:
-            assert hasattr(chatten_token, method), f"Missing pricing method: {method}"
+class TestContractFunctions:
+    """Test suite verifying contract functions exist."""
 
-    def test_swap_methods_exist(self):
-        """Verify DEX swap methods exist."""
-        from contracts import chatten_token
+    @pytest.mark.parametrize("category, name", EXPECTED_METHODS)
+    def test_method_exists(self, chatten_attrs, category, name):
+        """Verify each expected contract method exists."""
+        assert name in chatten_attrs, f"Missing {category} method: {name}"
 
-        swap_methods = [
-            'buy_compute',
-            'sell_compute',
-        ]
+    def test_no_methods_missing(self, chatten_attrs):
+        """Verify every expected method exists, reporting all gaps at once."""
+        missing = {name for _, name in EXPECTED_METHODS} - chatten_attrs
+        assert not missing, f"Missing: {missing}"
 
-        for method in swap_methods:
-            assert hasattr(chatten_token, method), f"Missing swap method: {method}"
-
-    def test_nep17_receiver_exists(self):
-        """Verify NEP-17 payment receiver exists."""
-        from contracts import chatten_token
-        assert hasattr(chatten_token, 'onNEP17Payment'), "Missing onNEP17Payment"
-
-    def test_nep11_receiver_exists(self):
-        """Verify NEP-11 payment receiver exists."""
-        from contracts import chatten_token
-        assert hasattr(chatten_token, 'onNEP11Payment'), "Missing onNEP11Payment"
-
-    def test_admin_methods_exist(self):
-        """Verify admin methods exist."""
-        from contracts import chatten_token
-
-        admin_methods = [
-            'pause',
-            'resume',
-            'isPaused',
-            'set_oracle',
-            'set_minter',
-            'get_admin',
-            'is_oracle',
-            'is_minter',
-            'withdraw_gas',
-            'claim_ownership',
-            'is_ownership_claimed',
-        ]
 
-        for method in admin_methods:
-            assert hasattr(chatten_token, method), f"Missing admin method: {method}"
+# Fee in contract: gas_amount * 3 // 1000
+_FEE_AMOUNT = 10_000_000  # 0.1 GAS in smallest units
+_FEE_10M = _FEE_AMOUNT * 3 // 1000
 
-    def test_mint_burn_methods_exist(self):
-        """Verify mint/burn methods exist."""
-        from contracts import chatten_token
+_BUY_GAS_AMOUNT = 100_000_000  # 1 GAS
+_BUY_PRICE = 50_000_000  # 0.5 GAS per COMPUTE
+_BUY_NET = _BUY_GAS_AMOUNT - _BUY_GAS_AMOUNT * 3 // 1000
 
-        mint_methods = ['mint', 'burn']
 
-        for method in mint_methods:
-            assert hasattr(chatten_token, method), f"Missing mint/burn method: {method}"
+@pytest.fixture(scope="module")
+def buy_compute_100m():
+    """COMPUTE received for 1 GAS at 0.5 GAS/COMPUTE, after the 0.3% fee."""
+    from contracts.chatten_token import ONE_TOKEN
+    return _BUY_NET * ONE_TOKEN // _BUY_PRICE, ONE_TOKEN
 
 
 class TestSwapFeeLogic:
@@ -225,23 +202,11 @@ class TestSwapFeeLogic:
 
     def test_fee_is_0_3_percent(self):
         """Verify the fee calculation matches 0.3% (3/1000)."""
-        # Fee in contract: gas_amount * 3 // 1000
-        amount = 10_000_000  # 0.1 GAS in smallest units
-        expected_fee = amount * 3 // 1000
-        assert expected_fee == 30_000  # 0.03% of 10M
+        assert _FEE_10M == 30_000  # 0.03% of 10M
 
-    def test_buy_compute_formula(self):
+    def test_buy_compute_formula(self, buy_compute_100m):
         """Test the buy compute formula."""
-        from contracts.chatten_token import ONE_TOKEN
-
-        # Simulating: gas_amount * 3 // 1000 for fee, then compute = net * ONE_TOKEN // price
-        gas_amount = 100_000_000  # 1 GAS
-        price = 50_000_000  # 0.5 GAS per COMPUTE
-
-        fee = gas_amount * 3 // 1000
-        net = gas_amount - fee
-        compute = net * ONE_TOKEN // price
+        compute, one_token = buy_compute_100m
 
         # Expected: ~1.994 COMPUTE (accounting for 0.3% fee)
-        assert compute > ONE_TOKEN * 19 // 10  # > 1.9 COMPUTE
-        assert compute < ONE_TOKEN * 2  # < 2.0 COMPUTE
+        assert one_token * 19 // 10 < compute < one_token * 2
@@ -0,0 +1,123 @@
+"""
+Tests for the tool dataclasses and enums
+"""
+
+import pytest
+from tools import (
+    AppLogNotification, NeoConfig, TransactionResult, PerformanceMetrics, QScoreResult, ModelCategory, MarketAnalysis,
+)
+from tools.token_tools import TokenInfo
+
+
+class TestPerformanceMetricsDataclass:
+    """Test PerformanceMetrics dataclass."""
+
+    def test_is_frozen(self, sample_performance_metrics):
+        """Test shared metrics cannot be mutated in place."""
+        from dataclasses import FrozenInstanceError
+        with pytest.raises(FrozenInstanceError):
+            sample_performance_metrics.avg_latency_ms = 1.0
+
+
+class TestModelCategories:
+    """Test model category enum."""
+
+    def test_category_values(self):
+        """Test ModelCategory integer values and their JSON slugs."""
+        assert [(c.value, c.slug) for c in ModelCategory] == [
+            (0, "llm"),
+            (1, "image_generation"),
+            (2, "embedding"),
+            (3, "audio"),
+            (4, "multimodal"),
+        ]
+
+
+class TestQScoreResult:
+    """Test QScoreResult dataclass."""
+
+    def test_qscore_result_creation(self):
+        """Test QScoreResult can be created."""
+        metrics = PerformanceMetrics()
+        result = QScoreResult(
+            model_id="test-model",
+            q_score=75.0,
+            category=ModelCategory.LLM,
+            metrics=metrics
+        )
+
+        assert result.model_id == "test-model"
+        assert result.q_score == 75.0
+        assert result.category == ModelCategory.LLM
+        assert result.mint_eligible is False  # default
+
+    def test_qscore_result_recommendations_default(self):
+        """Test QScoreResult has empty recommendations by default."""
+        metrics = PerformanceMetrics()
+        result = QScoreResult(
+            model_id="test",
+            q_score=50.0,
+            category=ModelCategory.LLM,
+            metrics=metrics
+        )
+        assert result.recommendations == ()
+
+
+class TestDataclassFields:
+    """Test default and custom field values of the tool dataclasses."""
+
+    @pytest.mark.parametrize("cls, kwargs, expected", [
+        (PerformanceMetrics, {}, {
+            "avg_latency_ms": 0.0,
+            "tokens_per_second": 0.0,
+            "accuracy_score": 0.0,
+            "uptime_percentage": 0.0,
+        }),
+        (PerformanceMetrics, {
+            "avg_latency_ms": 50.0,
+            "tokens_per_second": 1000.0,
+            "accuracy_score": 0.95,
+            "uptime_percentage": 99.9,
+        }, None),
+        (NeoConfig, {}, {
+            "rpc_url": "https://mainnet1.neo.coz.io:443",
+            "network_magic": 860833102,  # MainNet
+        }),
+        (NeoConfig, {
+            "rpc_url": "http://localhost:50012",
+            "network_magic": 12345,
+            "wallet_path": "/path/to/wallet.json",
+            "wallet_password": "secret",
+        }, None),
+        (TransactionResult, {"tx_hash": "0xabc123"}, {
+            "tx_hash": "0xabc123",
+            "block_height": None,
+            "gas_consumed": 0.0,
+            "state": "NONE",
+            "notifications": [],
+        }),
+        (TransactionResult, {
+            "tx_hash": "0xdef456",
+            "block_height": 12345,
+            "gas_consumed": 1.5,
+            "state": "HALT",
+            "notifications": ["event1", "event2"],
+        }, None),
+    ], ids=[
+        "metrics-defaults", "metrics-custom",
+        "neo_config-defaults", "neo_config-custom",
+        "tx_result-defaults", "tx_result-custom",
+    ])
+    def test_dataclass_fields(self, cls, kwargs, expected):
+        """Test fields hold their defaults, or the values passed in (expected=None)."""
+        expected = kwargs if expected is None else expected
+        obj = cls(**kwargs)
+        assert {k: getattr(obj, k) for k in expected} == expected
+
+    @pytest.mark.parametrize("cls", [
+        PerformanceMetrics, QScoreResult, MarketAnalysis, NeoConfig, TransactionResult, TokenInfo,
+        AppLogNotification,
+    ])
+    def test_dataclass_uses_slots(self, cls):
+        """Test tool dataclasses define __slots__ instead of a per-instance __dict__."""
+        assert "__slots__" in vars(cls)
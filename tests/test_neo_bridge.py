@@ -0,0 +1,260 @@
+"""
+Tests for NeoBridgeTool
+"""
+
+import asyncio
+import json
+
+import pytest
+from tools import AppLogNotification, NeoBridgeTool, NeoConfig, TransactionResult
+from tools.neo_bridge import _contract_param, _script_hash_hex, to_uint160
+from tests.conftest import MockAccount
+
+
+class FakeResponse:
+    """Minimal aiohttp response stand-in."""
+
+    def __init__(self, body: dict):
+        self._body = json.dumps(body).encode()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    async def read(self) -> bytes:
+        return self._body
+
+
+class FakeSession:
+    """Minimal aiohttp session stand-in that records posted payloads."""
+
+    def __init__(self, body: dict):
+        self.body = body
+        self.payloads = []
+        self.closed = False
+
+    def post(self, url, data, headers):
+        self.payloads.append(json.loads(data))
+        return FakeResponse(self.body)
+
+    async def close(self):
+        self.closed = True
+
+
+class TestNeoBridgeTool:
+    """Test suite for the Neo Bridge Tool."""
+
+    def test_initialization(self):
+        """Test tool initialization with default config."""
+        tool = NeoBridgeTool()
+
+        assert tool.name == "neo_bridge"
+        assert tool.config is not None
+        assert tool.config.rpc_url == "https://mainnet1.neo.coz.io:443"
+
+    def test_custom_config(self):
+        """Test tool initialization with custom config."""
+        config = NeoConfig(
+            rpc_url="https://testnet1.neo.coz.io:443",
+            network_magic=894710606
+        )
+        tool = NeoBridgeTool(config=config)
+
+        assert tool.config.rpc_url == "https://testnet1.neo.coz.io:443"
+        assert tool.config.network_magic == 894710606
+
+    def test_not_connected_initially(self, neo_bridge_tool):
+        """Test that tool is not connected on init."""
+        assert not neo_bridge_tool.is_connected()
+
+    def test_get_address_returns_none_without_wallet(self, neo_bridge_tool):
+        """Test get_address returns None when no wallet loaded."""
+        assert neo_bridge_tool.get_address() is None
+
+    @pytest.mark.parametrize(
+        "contract_hash", ["ab" * 20, "0x" + "ab" * 20, "0X" + "ab" * 20], ids=["no_prefix", "prefix", "upper_prefix"]
+    )
+    def test_to_uint160_parses_hex(self, contract_hash):
+        """Test to_uint160 parses hex with or without 0x and passes UInt160 through."""
+        script_hash = to_uint160(contract_hash)
+
+        assert len(script_hash) == 20
+        assert to_uint160(script_hash) is script_hash
+
+    def test_to_uint160_rejects_wrong_length(self):
+        """Test to_uint160 rejects hex that is not a 20-byte script hash."""
+        with pytest.raises(ValueError):
+            to_uint160("0xabcd")
+
+    def test_script_hash_hex_normalizes_prefix(self):
+        """Test _script_hash_hex renders every accepted form with a lowercase 0x prefix."""
+        expected = "0x" + "ab" * 20
+
+        assert {_script_hash_hex(h) for h in ("ab" * 20, "0X" + "ab" * 20, to_uint160("ab" * 20))} == {expected}
+
+    def test_contract_param_encodes_nested_arrays(self):
+        """Test lists and tuples encode as Arrays of recursively encoded items."""
+        assert _contract_param([1, ("x", [b"\x01"])]) == {"type": "Array", "value": [
+            {"type": "Integer", "value": "1"},
+            {"type": "Array", "value": [
+                {"type": "String", "value": "x"},
+                {"type": "Array", "value": [{"type": "ByteArray", "value": "AQ=="}]},
+            ]},
+        ]}
+
+    def test_contract_param_rejects_float(self):
+        """Test floats raise TypeError instead of being encoded as bytes."""
+        with pytest.raises(TypeError):
+            _contract_param(1.5)
+
+    async def test_rpc_reuses_session_until_disconnect(self):
+        """Test _rpc sends every call over one session that disconnect() closes."""
+        tool = NeoBridgeTool()
+        session = tool._http = FakeSession({"jsonrpc": "2.0", "id": 1, "result": 42})
+
+        assert await asyncio.gather(tool._rpc("getblockcount"), tool._rpc("getblockcount")) == [42, 42]
+        assert [p["method"] for p in session.payloads] == ["getblockcount"] * 2
+
+        await tool.disconnect()
+        assert session.closed and tool._http is None
+
+    async def test_rpc_raises_on_error(self):
+        """Test _rpc surfaces JSON-RPC errors as RuntimeError."""
+        tool = NeoBridgeTool()
+        tool._http = FakeSession({"jsonrpc": "2.0", "id": 1, "error": {"message": "Unknown block"}})
+
+        with pytest.raises(RuntimeError, match="Unknown block"):
+            await tool._rpc("getblock", [1])
+
+    def test_account_identifiers_cached(self, monkeypatch):
+        """Test the address and script hash are read once when the account is set."""
+        tool = NeoBridgeTool()
+        account = MockAccount()
+        tool._set_account(account)
+        monkeypatch.delattr(account, "address")
+
+        assert tool.get_address() == "NXjtd123..."
+        assert tool._script_hash is account.script_hash
+
+    async def test_invoke_batch_sends_one_request(self):
+        """Test test_invoke_batch posts every call at once, maps replies by id and flags missing results."""
+        tool = NeoBridgeTool()
+        session = tool._http = FakeSession([
+            {"jsonrpc": "2.0", "id": 1, "error": {"message": "Method not found"}},
+            {"jsonrpc": "2.0", "id": 2},
+            {"jsonrpc": "2.0", "id": 0, "result": {
+                "state": "HALT", "gasconsumed": "1000000", "stack": [{"type": "Integer", "value": "7"}],
+            }},
+        ])
+
+        results = await tool.test_invoke_batch([
+            ("ab" * 20, "tokenSupply", [b"\x01"]),
+            ("0x" + "ab" * 20, "missing", [5, True, "x"]),
+            ("ab" * 20, "decimals", []),
+        ])
+
+        assert len(session.payloads) == 1
+        assert [call["params"] for call in session.payloads[0]] == [
+            ["0x" + "ab" * 20, "tokenSupply", [{"type": "ByteArray", "value": "AQ=="}]],
+            ["0x" + "ab" * 20, "missing", [
+                {"type": "Integer", "value": "5"},
+                {"type": "Boolean", "value": True},
+                {"type": "String", "value": "x"},
+            ]],
+            ["0x" + "ab" * 20, "decimals", []],
+        ]
+        assert results == [
+            {"stack": [{"type": "Integer", "value": "7"}], "gas_consumed": 0.01, "state": "HALT"},
+            {"error": "Method not found"},
+            {"error": "No invocation result in response"},
+        ]
+
+    @pytest.mark.parametrize("network, expected", [(860833102, True), (894710606, False)])
+    async def test_connect_checks_network_magic(self, network, expected):
+        """Test connect() queries getversion and only accepts the configured network."""
+        tool = NeoBridgeTool()
+        session = tool._http = FakeSession({"jsonrpc": "2.0", "id": 1, "result": {"protocol": {"network": network}}})
+
+        assert await tool.connect() is expected
+        assert tool.is_connected() is expected
+        assert session.payloads[0]["method"] == "getversion"
+
+    async def test_connect_fails_on_rpc_error(self):
+        """Test connect() reports False when the node returns an error."""
+        tool = NeoBridgeTool()
+        tool._http = FakeSession({"jsonrpc": "2.0", "id": 1, "error": {"message": "Access denied"}})
+
+        assert await tool.connect() is False
+        assert not tool.is_connected()
+
+    async def test_get_block_height_from_block_count(self):
+        """Test get_block_height() is getblockcount minus the genesis block."""
+        tool = NeoBridgeTool()
+        tool._http = FakeSession({"jsonrpc": "2.0", "id": 1, "result": 5_000_001})
+
+        assert await tool.get_block_height() == 5_000_000
+
+    @pytest.mark.parametrize("body, expected", [
+        ({"jsonrpc": "2.0", "id": 1, "result": {"hash": "0xabc123"}}, {"hash": "0xabc123"}),
+        ({"jsonrpc": "2.0", "id": 1, "error": {"code": -100, "message": "Unknown transaction"}}, None),
+    ], ids=["found", "unknown"])
+    async def test_get_transaction(self, body, expected):
+        """Test get_transaction() requests the verbose transaction and maps unknown hashes to None."""
+        tool = NeoBridgeTool()
+        session = tool._http = FakeSession(body)
+
+        assert await tool.get_transaction("0xabc123") == expected
+        assert session.payloads[0]["method"] == "getrawtransaction"
+        assert session.payloads[0]["params"] == ["0xabc123", True]
+
+    async def test_test_invoke_returns_stub(self, neo_bridge_tool):
+        """Test test_invoke() stub returns stack and gas keys."""
+        invoke = await neo_bridge_tool.test_invoke("0xcontract", "method", [])
+        assert isinstance(invoke, dict)
+        assert "stack" in invoke
+        assert "gas_consumed" in invoke
+
+    async def test_wait_for_transaction_returns_result(self, neo_bridge_tool):
+        """Test wait_for_transaction() returns TransactionResult."""
+        result = await neo_bridge_tool.wait_for_transaction("0xabc123")
+        assert isinstance(result, TransactionResult)
+        assert result.tx_hash == "0xabc123"
+
+    async def test_invoke_contract_returns_result(self, neo_bridge_tool):
+        """Test invoke_contract() stub returns TransactionResult."""
+        result = await neo_bridge_tool.invoke_contract("0xcontract", "method", [])
+        assert isinstance(result, TransactionResult)
+
+    async def test_run_unknown_action(self, neo_bridge_tool):
+        """Test run() with unknown action returns error."""
+        result = await neo_bridge_tool.run(action="unknown")
+        assert "error" in result
+
+    def test_result_from_application_log(self):
+        """Test a getapplicationlog result decodes into typed notifications."""
+        log = {
+            "txid": "0xabc123",
+            "executions": [{
+                "trigger": "Application",
+                "vmstate": "HALT",
+                "gasconsumed": "9977780",
+                "stack": [],
+                "notifications": [
+                    {"contract": "0xd2a4", "eventname": "Transfer", "state": {"type": "Array", "value": []}},
+                ],
+            }],
+        }
+
+        result = TransactionResult.from_application_log("0xabc123", log)
+
+        assert result.state == "HALT"
+        assert result.gas_consumed == 0.0997778
+        assert result.notifications == [
+            AppLogNotification("0xd2a4", "Transfer", {"type": "Array", "value": []})
+        ]
+
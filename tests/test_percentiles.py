@@ -0,0 +1,88 @@
+"""
+Tests for StreamingPercentiles
+"""
+
+import random
+
+import pytest
+from tools import QScoreAnalyzerTool, StreamingPercentiles
+
+
+class TestStreamingPercentiles:
+    """Test suite for the streaming latency percentile estimator."""
+
+    def test_empty_quantile_is_zero(self):
+        """Test an estimator with no samples reports 0.0, like PerformanceMetrics."""
+        assert StreamingPercentiles().quantile(0.95) == 0.0
+
+    @pytest.mark.parametrize("q", [-0.1, 1.1])
+    def test_rejects_out_of_range_quantile(self, q):
+        """Test quantiles outside [0, 1] raise ValueError."""
+        with pytest.raises(ValueError):
+            StreamingPercentiles().quantile(q)
+
+    @pytest.mark.parametrize("q", [0.5, 0.95, 0.99])
+    def test_quantiles_track_exact_percentiles(self, q):
+        """Test estimates stay within one bin width of the exact percentile."""
+        rng = random.Random(42)
+        samples = [rng.lognormvariate(5, 1) for _ in range(20_000)]
+        estimator = StreamingPercentiles()
+        for sample in samples:
+            estimator.update(sample)
+
+        exact = sorted(samples)[int(q * len(samples))]
+        assert estimator.count == len(samples)
+        assert estimator.quantile(q) == pytest.approx(exact, rel=0.03)
+
+    def test_estimates_clamped_to_observed_range(self):
+        """Test out-of-range samples still yield estimates within min/max."""
+        estimator = StreamingPercentiles()
+        for sample in (0.01, 90_000.0):
+            estimator.update(sample)
+
+        assert estimator.quantile(0.0) == 0.01
+        assert estimator.quantile(1.0) == 90_000.0
+
+    @pytest.mark.parametrize("sample", [float("nan"), float("inf"), float("-inf")])
+    def test_rejects_non_finite_samples(self, sample):
+        """Test NaN and infinite samples raise ValueError and leave the estimator unchanged."""
+        estimator = StreamingPercentiles()
+        estimator.update(5.0)
+
+        with pytest.raises(ValueError):
+            estimator.update(sample)
+
+        assert estimator.count == 1
+        assert estimator.quantile(0.0) == estimator.quantile(1.0) == 5.0
+
+    async def test_recorded_latency_feeds_fetched_metrics(self):
+        """Test record_latency sets P95/P99 on the next metrics fetch."""
+        tool = QScoreAnalyzerTool()
+        for latency in range(1, 101):
+            tool.record_latency("m", float(latency))
+
+        metrics = await tool._fetch_metrics("m")
+
+        assert metrics.p95_latency_ms == pytest.approx(95, rel=0.03)
+        assert metrics.p99_latency_ms == pytest.approx(99, rel=0.03)
+
+    def test_record_latency_rejects_non_finite(self):
+        """Test a NaN latency raises without creating an estimator for the model."""
+        tool = QScoreAnalyzerTool()
+
+        with pytest.raises(ValueError):
+            tool.record_latency("m", float("nan"))
+
+        assert "m" not in tool._latency_percentiles
+
+    def test_recorded_latency_models_are_bounded(self, monkeypatch):
+        """Test per-model estimators are capped at METRICS_CACHE_SIZE, dropping the stalest."""
+        tool = QScoreAnalyzerTool()
+        monkeypatch.setattr(tool, "METRICS_CACHE_SIZE", 2)
+
+        for model_id in ("a", "b", "a", "c"):
+            tool.record_latency(model_id, 10.0)
+
+        assert list(tool._latency_percentiles) == ["a", "c"]
+        assert tool._latency_percentiles["a"].count == 2
+
@@ -0,0 +1,371 @@
+"""
+Tests for QScoreAnalyzerTool
+"""
+
+import asyncio
+
+import pytest
+from tools import market_tools
+from tools._jsonrpc import json_dumps, json_loads
+from tools import QScoreAnalyzerTool, QScoreResult, MarketAnalysis, PerformanceMetrics
+from tools import CompareResponse, ErrorResponse, MarketResponse, QScoreResponse
+
+# Keep every q_analyzer user on one xdist worker
+pytestmark = pytest.mark.xdist_group(name="qscore")
+
+
+@pytest.fixture(scope="module")
+def analyzer_cls():
+    """The analyzer class itself, for tests that only read class constants."""
+    return QScoreAnalyzerTool
+
+
+class TestQScoreAnalyzerTool:
+    """Test suite for the Q-Score Analyzer Tool."""
+
+    def test_initialization(self, q_analyzer):
+        """Test tool initialization."""
+        assert q_analyzer.name == "q_score_analyzer"
+        assert q_analyzer.MIN_SCORE_FOR_MINT == 50
+
+    def test_thresholds(self, analyzer_cls):
+        """Test Q-score thresholds."""
+        assert analyzer_cls.EXCELLENT_THRESHOLD == 80
+        assert analyzer_cls.GOOD_THRESHOLD == 60
+        assert analyzer_cls.MIN_SCORE_FOR_MINT == 50
+
+    def test_weights_sum_to_one(self, analyzer_cls):
+        """Test that scoring weights sum to 1.0."""
+        total = (
+            analyzer_cls.LATENCY_WEIGHT +
+            analyzer_cls.THROUGHPUT_WEIGHT +
+            analyzer_cls.QUALITY_WEIGHT +
+            analyzer_cls.RELIABILITY_WEIGHT
+        )
+        assert total == 1.0
+
+    async def test_calculate_q_score_returns_result(self, q_analyzer):
+        """Test calculate_q_score returns QScoreResult."""
+        result = await q_analyzer.calculate_q_score("test-model")
+
+        assert isinstance(result, QScoreResult)
+        assert result.model_id == "test-model"
+
+    async def test_provided_metrics_skip_fetch(self, sample_performance_metrics, monkeypatch):
+        """Test calculate_q_score scores supplied metrics without an oracle fetch."""
+        tool = QScoreAnalyzerTool()
+
+        async def fail_fetch(model_id):
+            raise AssertionError("oracle fetched for provided metrics")
+
+        monkeypatch.setattr(tool, "_fetch_metrics", fail_fetch)
+        result = await tool.calculate_q_score("m", metrics=sample_performance_metrics)
+
+        assert result == tool._score_from_metrics("m", sample_performance_metrics)
+
+    async def test_compare_models_returns_sorted_list(self, q_analyzer, model_ids_pair):
+        """Test compare_models returns sorted list by q_score."""
+        results = await q_analyzer.compare_models(model_ids_pair)
+
+        assert len(results) == 2
+        # Results should be sorted by q_score (highest first)
+        assert results[0].q_score >= results[1].q_score
+
+    async def test_compare_models_reuses_scores(self, model_ids_pair, monkeypatch):
+        """Test repeated comparisons score each model once until clear_cache()."""
+        tool = QScoreAnalyzerTool()
+        fetched = []
+        original_fetch = tool._fetch_metrics
+
+        async def counting_fetch(model_id):
+            fetched.append(model_id)
+            return await original_fetch(model_id)
+
+        monkeypatch.setattr(tool, "_fetch_metrics", counting_fetch)
+        await tool.compare_models(model_ids_pair)
+        await tool.compare_models(model_ids_pair)
+        assert fetched == list(model_ids_pair)
+
+        tool.clear_cache()
+        await tool.compare_models(model_ids_pair)
+        assert fetched == list(model_ids_pair) * 2
+
+    @pytest.mark.parametrize("invalidate", ["ttl", "scoring_mode"])
+    async def test_compare_models_rescores_stale_results(self, invalidate, monkeypatch):
+        """Test memoized scores expire with their metrics and on a SCORING_MODE change."""
+        tool = QScoreAnalyzerTool()
+        now = [1000.0]
+        monkeypatch.setattr(market_tools.time, "monotonic", lambda: now[0])
+        fetched = []
+        original_fetch = tool._fetch_metrics
+
+        async def counting_fetch(model_id):
+            fetched.append(model_id)
+            return await original_fetch(model_id)
+
+        monkeypatch.setattr(tool, "_fetch_metrics", counting_fetch)
+        await tool.compare_models(["m"])
+        if invalidate == "ttl":
+            now[0] += tool.METRICS_TTL_SECONDS
+        else:
+            tool.SCORING_MODE = "smooth"
+        await tool.compare_models(["m"])
+
+        assert fetched == ["m", "m"]
+        assert (await tool.get_market_analysis()).total_models == 1
+
+    async def test_score_cache_evicts_least_recently_used(self, monkeypatch):
+        """Test the score cache drops the least recently compared model when full."""
+        tool = QScoreAnalyzerTool()
+        monkeypatch.setattr(tool, "SCORE_CACHE_SIZE", 2)
+
+        for model_ids in (["a"], ["b"], ["a"], ["c"]):
+            await tool.compare_models(model_ids)
+
+        assert list(tool._score_cache) == ["a", "c"]
+
+    async def test_market_analysis_skips_expired_scores(self, monkeypatch):
+        """Test market analysis ignores scores whose metrics have expired."""
+        tool = QScoreAnalyzerTool()
+        now = [1000.0]
+        monkeypatch.setattr(market_tools.time, "monotonic", lambda: now[0])
+        await tool.compare_models(["a", "b"])
+
+        now[0] += tool.METRICS_TTL_SECONDS
+
+        assert (await tool.get_market_analysis()).total_models == 0
+        assert not tool._score_cache
+
+    @pytest.mark.parametrize("numpy_sort", [True, False], ids=["argsort", "sorted"])
+    async def test_compare_models_ranks_large_batches(self, numpy_sort, monkeypatch):
+        """Test large comparisons rank highest first and keep input order on ties."""
+        if numpy_sort and not market_tools.NUMPY_AVAILABLE:
+            pytest.skip("numpy not installed")
+        monkeypatch.setattr(market_tools, "NUMPY_AVAILABLE", numpy_sort)
+        tool = QScoreAnalyzerTool()
+        model_ids = [f"model-{i}" for i in range(market_tools._ARGSORT_MIN_MODELS * 2)]
+
+        async def fake_fetch(model_id):
+            i = int(model_id.split("-")[1])
+            return PerformanceMetrics(avg_latency_ms=float(i % 7) * 150, uptime_percentage=99.9)
+
+        monkeypatch.setattr(tool, "_fetch_metrics", fake_fetch)
+        results = await tool.compare_models(model_ids)
+
+        assert [r.model_id for r in results] == [
+            r.model_id for r in sorted(results, key=lambda r: (-r.q_score, int(r.model_id[6:])))
+        ]
+
+    @pytest.mark.parametrize("smooth", [False, True])
+    def test_numba_parallel_kernel_matches_serial(self, smooth, monkeypatch):
+        """Test the parallel kernel used for large batches scores exactly like the serial one."""
+        if not market_tools.NUMBA_AVAILABLE:
+            pytest.skip("numba not installed")
+        import numpy as np
+        from tools import _qscore_numba
+
+        rng = np.random.default_rng(7)
+        columns = [
+            rng.uniform(0, 2000, 64), rng.uniform(0, 2000, 64), rng.uniform(0, 1, 64),
+            rng.uniform(0, 100, 64), rng.uniform(85, 100, 64), rng.uniform(0, 0.2, 64),
+        ]
+        weights = np.full(4, 0.25)
+        serial = _qscore_numba.q_score_kernel(*columns, weights, smooth)
+        monkeypatch.setattr(_qscore_numba, "_PARALLEL_MIN_MODELS", 1)
+
+        assert np.array_equal(_qscore_numba.q_score_kernel(*columns, weights, smooth), serial)
+
+    @pytest.mark.parametrize("scoring_mode", ["legacy", "smooth"])
+    @pytest.mark.parametrize("backend", ["numba", "numpy", "python"])
+    async def test_batch_scores_match_single_scores(
+        self, backend, scoring_mode, sample_performance_metrics, sample_poor_metrics,
+        excellent_metrics, monkeypatch
+    ):
+        """Test batched compare_models scoring matches calculate_q_score exactly."""
+        if backend == "numba" and not market_tools.NUMBA_AVAILABLE:
+            pytest.skip("numba not installed")
+        if backend == "numpy" and not market_tools.NUMPY_AVAILABLE:
+            pytest.skip("numpy not installed")
+        monkeypatch.setattr(market_tools, "NUMBA_AVAILABLE", backend == "numba")
+        monkeypatch.setattr(market_tools, "NUMPY_AVAILABLE", backend != "python")
+
+        by_model = {
+            "sample": sample_performance_metrics,
+            "poor": sample_poor_metrics,
+            "excellent": excellent_metrics,
+            # Values sitting exactly on ladder boundaries
+            "edges": PerformanceMetrics(
+                avg_latency_ms=50.0, tokens_per_second=50.0, accuracy_score=1.5,
+                benchmark_score=-10.0, uptime_percentage=99.0, error_rate=0.01,
+            ),
+            "cutoffs": PerformanceMetrics(
+                avg_latency_ms=1000.0, tokens_per_second=1000.0,
+                uptime_percentage=90.0, error_rate=0.10,
+            ),
+            "empty": PerformanceMetrics(),
+            # Between smooth-mode knots and past both ends
+            "between": PerformanceMetrics(avg_latency_ms=123.4, tokens_per_second=612.5),
+            "extremes": PerformanceMetrics(avg_latency_ms=5000.0, tokens_per_second=10.0),
+        }
+        tool = QScoreAnalyzerTool()
+        tool.SCORING_MODE = scoring_mode
+
+        async def fake_fetch(model_id):
+            return by_model[model_id]
+
+        monkeypatch.setattr(tool, "_fetch_metrics", fake_fetch)
+        batched = {r.model_id: r for r in await tool.compare_models(list(by_model))}
+
+        for model_id, metrics in by_model.items():
+            single = await tool.calculate_q_score(model_id, metrics=metrics)
+            assert batched[model_id] == single
+
+    @pytest.mark.parametrize("q_score, scores, expected", [
+        (85, (0.9, 0.9, 0.9, 0.9), ("Excellent performance - eligible for premium rates",)),
+        (50, (0.4, 0.9, 0.9, 0.9), (
+            "Consider optimizing inference latency",
+            "Good performance - eligible for token minting",
+        )),
+        (20, (0.0, 0.0, 0.0, 0.0), (
+            "Consider optimizing inference latency",
+            "Throughput could be improved with batching",
+            "Model accuracy needs improvement",
+            "Improve uptime and reduce error rates",
+            "Below threshold - improvements needed before minting",
+        )),
+        (79.9, (0.5, 0.2, 0.5, 0.1), (
+            "Throughput could be improved with batching",
+            "Improve uptime and reduce error rates",
+            "Good performance - eligible for token minting",
+        )),
+    ])
+    def test_generate_recommendations(self, q_analyzer, q_score, scores, expected):
+        """Test recommendations list weak components then the score band."""
+        recommendations = q_analyzer._generate_recommendations(q_score, *scores)
+
+        assert recommendations == expected
+        # Served from the shared table rather than rebuilt per call
+        assert q_analyzer._generate_recommendations(q_score, *scores) is recommendations
+
+    async def test_concurrent_fetches_share_one_load(self, monkeypatch):
+        """Test concurrent cache misses for one model trigger a single oracle load."""
+        tool = QScoreAnalyzerTool()
+        load = tool._load_metrics
+        loads = []
+
+        async def slow_load(model_id):
+            loads.append(model_id)
+            await asyncio.sleep(0)
+            return await load(model_id)
+
+        monkeypatch.setattr(tool, "_load_metrics", slow_load)
+        results = await asyncio.gather(*(tool._fetch_metrics("m") for _ in range(5)))
+
+        assert loads == ["m"]
+        assert all(r is results[0] for r in results)
+        assert not tool._pending_metrics
+
+    async def test_metrics_cache_expires_after_ttl(self, monkeypatch):
+        """Test cached metrics are re-fetched once METRICS_TTL_SECONDS has passed."""
+        tool = QScoreAnalyzerTool()
+        now = [1000.0]
+        monkeypatch.setattr(market_tools.time, "monotonic", lambda: now[0])
+
+        first = await tool._fetch_metrics("m")
+        assert await tool._fetch_metrics("m") is first
+
+        now[0] += tool.METRICS_TTL_SECONDS
+        assert await tool._fetch_metrics("m") is not first
+
+    async def test_metrics_cache_evicts_least_recently_used(self, monkeypatch):
+        """Test the metrics cache stays within METRICS_CACHE_SIZE, dropping the LRU entry."""
+        tool = QScoreAnalyzerTool()
+        monkeypatch.setattr(tool, "METRICS_CACHE_SIZE", 2)
+
+        await tool._fetch_metrics("a")
+        await tool._fetch_metrics("b")
+        await tool._fetch_metrics("a")
+        await tool._fetch_metrics("c")
+
+        assert list(tool._metrics_cache) == ["a", "c"]
+
+    async def test_get_market_analysis_returns_analysis(self, q_analyzer):
+        """Test get_market_analysis returns MarketAnalysis."""
+        result = await q_analyzer.get_market_analysis()
+
+        assert isinstance(result, MarketAnalysis)
+
+    @pytest.mark.parametrize("use_numpy", [True, False], ids=["numpy", "python"])
+    async def test_market_analysis_aggregates_scored_models(self, use_numpy, monkeypatch):
+        """Test market analysis averages cached scores and lists the top performers."""
+        if use_numpy and not market_tools.NUMPY_AVAILABLE:
+            pytest.skip("numpy not installed")
+        monkeypatch.setattr(market_tools, "NUMPY_AVAILABLE", use_numpy)
+        tool = QScoreAnalyzerTool()
+        model_ids = [f"model-{i}" for i in range(market_tools._ARGSORT_MIN_MODELS + 20)]
+
+        async def fake_fetch(model_id):
+            i = int(model_id.split("-")[1])
+            return PerformanceMetrics(accuracy_score=i / len(model_ids), uptime_percentage=99.9)
+
+        monkeypatch.setattr(tool, "_fetch_metrics", fake_fetch)
+        ranked = await tool.compare_models(model_ids)
+        analysis = await tool.get_market_analysis()
+
+        assert analysis.total_models == len(model_ids)
+        assert analysis.avg_q_score == pytest.approx(sum(r.q_score for r in ranked) / len(ranked))
+        assert analysis.top_performers == [
+            r.model_id for r in ranked[:QScoreAnalyzerTool.TOP_PERFORMERS]
+        ]
+
+    @pytest.mark.parametrize("use_numpy", [True, False], ids=["numpy", "python"])
+    async def test_market_analysis_breaks_ties_in_cache_order(self, use_numpy, monkeypatch):
+        """Test both backends pick the same top performers when scores tie at the cutoff."""
+        if use_numpy and not market_tools.NUMPY_AVAILABLE:
+            pytest.skip("numpy not installed")
+        monkeypatch.setattr(market_tools, "NUMPY_AVAILABLE", use_numpy)
+        tool = QScoreAnalyzerTool()
+        model_ids = [f"model-{i}" for i in range(market_tools._ARGSORT_MIN_MODELS + 20)]
+
+        async def fake_fetch(model_id):
+            # Two leaders, then a long run of identical scores
+            i = int(model_id.split("-")[1])
+            return PerformanceMetrics(accuracy_score=1.0 if i in (7, 30) else 0.5)
+
+        monkeypatch.setattr(tool, "_fetch_metrics", fake_fetch)
+        await tool.compare_models(model_ids)
+        analysis = await tool.get_market_analysis()
+
+        tied = [m for m in model_ids if m not in ("model-7", "model-30")]
+        assert analysis.top_performers == ["model-7", "model-30"] + tied[:QScoreAnalyzerTool.TOP_PERFORMERS - 2]
+
+    async def test_single_scores_count_towards_market(self, monkeypatch):
+        """Test calculate_q_score on oracle metrics is remembered, but not on supplied metrics."""
+        tool = QScoreAnalyzerTool()
+
+        await tool.calculate_q_score("fetched")
+        await tool.calculate_q_score("supplied", metrics=PerformanceMetrics(accuracy_score=1.0))
+        analysis = await tool.get_market_analysis()
+
+        assert analysis.total_models == 1
+        assert analysis.top_performers == ["fetched"]
+
+    @pytest.mark.parametrize("action, kwargs, response_cls, expected_keys", [
+        ("calculate", {"model_id": "test"}, QScoreResponse, {"model_id", "q_score", "mint_eligible"}),
+        ("compare", {"model_ids": ("model-a", "model-b")}, CompareResponse, {"rankings"}),
+        ("market", {}, MarketResponse, {"total_models", "avg_q_score", "trend"}),
+        ("unknown", {}, ErrorResponse, {"error", "action"}),
+    ])
+    async def test_run_actions(self, q_analyzer, action, kwargs, response_cls, expected_keys):
+        """Test run dispatches each action to a typed response that encodes like its dict form."""
+        result = await q_analyzer.run(action=action, **kwargs)
+
+        assert isinstance(result, response_cls)
+        assert expected_keys <= result.to_dict().keys()
+        assert json_loads(json_dumps(result)) == json_loads(json_dumps(result.to_dict()))
+
+    async def test_run_compare_ranks_every_model(self, q_analyzer, model_ids_pair):
+        """Test run with compare action ranks every requested model."""
+        result = await q_analyzer.run(action="compare", model_ids=model_ids_pair)
+
+        assert len(result.rankings) == len(model_ids_pair)
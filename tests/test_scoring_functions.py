@@ -0,0 +1,93 @@
+"""
+Tests for the Q-score component scoring functions
+"""
+
+import pytest
+from dataclasses import replace
+from tools import QScoreAnalyzerTool
+
+# Keep every q_analyzer user on one xdist worker
+pytestmark = pytest.mark.xdist_group(name="qscore")
+
+
+class TestScoringFunctions:
+    """Test Q-score component scoring functions."""
+
+    @pytest.mark.parametrize("latency_ms, expected", [
+        (25.0, 1.0),    # excellent (<50ms)
+        (75.0, 0.8),    # good (50-100ms)
+        (150.0, 0.6),   # acceptable (100-200ms)
+        (350.0, 0.4),   # fair (200-500ms)
+        (750.0, 0.2),   # poor (500-1000ms)
+        (2000.0, 0.0),  # unacceptable (>=1000ms)
+        (0.0, 0.0),     # zero latency is invalid
+    ])
+    def test_latency_score(self, q_analyzer, sample_performance_metrics, latency_ms, expected):
+        """Test latency score for each threshold band."""
+        metrics = replace(sample_performance_metrics, avg_latency_ms=latency_ms)
+        assert q_analyzer._calculate_latency_score(metrics) == expected
+
+    @pytest.mark.parametrize("tps, expected", [
+        (1500.0, 1.0),  # excellent (>=1000 tps)
+        (750.0, 0.8),   # good (500-1000 tps)
+        (25.0, 0.0),    # poor (<50 tps)
+    ])
+    def test_throughput_score(self, q_analyzer, sample_performance_metrics, tps, expected):
+        """Test throughput score for each threshold band."""
+        metrics = replace(sample_performance_metrics, tokens_per_second=tps)
+        assert q_analyzer._calculate_throughput_score(metrics) == expected
+
+    @pytest.mark.parametrize("value, latency_expected, throughput_expected", [
+        (25.0, 1.0, 0.0),      # first knot
+        (75.0, 0.8, 0.2),      # knots match the legacy bucket scores
+        (750.0, 0.2, 0.8),
+        (112.5, 0.7, 0.3),     # halfway between 75 and 150
+        (10.0, 1.0, 0.0),      # held below the first knot
+        (3000.0, 0.0, 1.0),    # held above the last knot
+    ])
+    def test_smooth_scores(
+        self, sample_performance_metrics, value, latency_expected, throughput_expected
+    ):
+        """Test smooth mode interpolates between the legacy bucket midpoints."""
+        analyzer = QScoreAnalyzerTool()
+        analyzer.SCORING_MODE = "smooth"
+        metrics = replace(sample_performance_metrics, avg_latency_ms=value, tokens_per_second=value)
+
+        assert analyzer._calculate_latency_score(metrics) == pytest.approx(latency_expected)
+        assert analyzer._calculate_throughput_score(metrics) == pytest.approx(throughput_expected)
+
+    def test_quality_score_calculation(self, q_analyzer, sample_performance_metrics):
+        """Test quality score calculation."""
+        metrics = replace(
+            sample_performance_metrics,
+            accuracy_score=0.95,
+            benchmark_score=85.0,
+        )
+        score = q_analyzer._calculate_quality_score(metrics)
+        # 0.95 * 0.6 + 0.85 * 0.4 = 0.57 + 0.34 = 0.91
+        assert 0.90 <= score <= 0.92
+
+    def test_quality_score_clamped(self, q_analyzer, sample_performance_metrics):
+        """Test quality score is clamped to valid range."""
+        metrics = replace(
+            sample_performance_metrics,
+            accuracy_score=1.5,  # Invalid, should be clamped
+            benchmark_score=150.0,  # Invalid, should be clamped
+        )
+        score = q_analyzer._calculate_quality_score(metrics)
+        assert score <= 1.0
+
+    def test_reliability_score_high_uptime(self, q_analyzer, sample_performance_metrics):
+        """Test reliability score with high uptime."""
+        metrics = replace(
+            sample_performance_metrics,
+            uptime_percentage=99.9,
+            error_rate=0.001,
+        )
+        score = q_analyzer._calculate_reliability_score(metrics)
+        assert score >= 0.9
+
+    def test_reliability_score_poor(self, q_analyzer, sample_poor_metrics):
+        """Test reliability score with poor metrics."""
+        score = q_analyzer._calculate_reliability_score(sample_poor_metrics)
+        assert score < 0.5
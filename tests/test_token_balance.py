@@ -0,0 +1,88 @@
+"""
+Tests for TokenBalanceTool
+"""
+
+import asyncio
+from tools import NeoBridgeTool, TokenBalanceTool, TokenTransferTool
+
+
+class TestTokenBalanceTool:
+    """Test suite for the Token Balance Tool."""
+
+    def test_initialization(self):
+        """Test tool initialization."""
+        tool = TokenBalanceTool(
+            contract_hash="0x1234567890abcdef"
+        )
+
+        assert tool.name == "token_balance"
+        assert tool.contract_hash == "0x1234567890abcdef"
+
+    def test_neo_bridge_created_if_not_provided(self):
+        """Test that NeoBridgeTool is created if not provided."""
+        tool = TokenBalanceTool(contract_hash="0x123")
+
+        assert tool.neo_bridge is not None
+        assert isinstance(tool.neo_bridge, NeoBridgeTool)
+
+    def test_default_neo_bridge_shared(self):
+        """Test token tools built without a bridge share one default NeoBridgeTool."""
+        balance = TokenBalanceTool(contract_hash="0x123")
+        transfer = TokenTransferTool(contract_hash="0x123")
+
+        assert balance.neo_bridge is transfer.neo_bridge
+
+    def test_neo_bridge_injected(self):
+        """Test that NeoBridgeTool can be injected."""
+        bridge = NeoBridgeTool()
+        tool = TokenBalanceTool(contract_hash="0x123", neo_bridge=bridge)
+
+        assert tool.neo_bridge is bridge
+
+    def test_script_hash_parsed_once(self):
+        """Test script_hash parses contract_hash on first use and then reuses it."""
+        tool = TokenBalanceTool(contract_hash="0x" + "ab" * 20)
+
+        script_hash = tool.script_hash
+        assert len(script_hash) == 20
+        assert tool.script_hash is script_hash
+
+    async def test_token_supplies_batched(self, monkeypatch):
+        """Test get_token_supplies issues one batched tokenSupply call per token."""
+        bridge = NeoBridgeTool()
+        tool = TokenBalanceTool(contract_hash="0x" + "ab" * 20, neo_bridge=bridge)
+        batches = []
+
+        async def fake_batch(calls):
+            batches.append(calls)
+            return [
+                {"state": "HALT", "stack": [{"type": "Integer", "value": "3"}]},
+                {"error": "fault"},
+                {"state": "FAULT", "stack": [{"type": "Integer", "value": "9"}]},
+                {"state": "HALT", "stack": [{"type": "ByteString", "value": "AQ=="}]},
+            ]
+
+        monkeypatch.setattr(bridge, "test_invoke_batch", fake_batch)
+
+        assert await tool.get_token_supplies([b"a", b"b", b"c", b"d"]) == [3, None, None, None]
+        assert batches == [[
+            (tool.script_hash, "tokenSupply", [token_id]) for token_id in (b"a", b"b", b"c", b"d")
+        ]]
+
+    async def test_token_balance_stubs_batch(self, token_balance_tool):
+        """Test balance/tokens/token_info/owner stubs return empty values."""
+        balance, tokens, info, owner = await asyncio.gather(
+            token_balance_tool.get_balance("NXjtd..."),
+            token_balance_tool.get_tokens("NXjtd..."),
+            token_balance_tool.get_token_info("token123"),
+            token_balance_tool.get_owner("token123"),
+        )
+        assert balance == 0
+        assert tokens == []
+        assert info is None
+        assert owner is None
+
+    async def test_run_returns_balance(self, token_balance_tool):
+        """Test run() with balance action returns balance dict."""
+        result = await token_balance_tool.run(action="balance", address="NXjtd...")
+        assert "balance" in result
@@ -0,0 +1,78 @@
+"""
+Tests for TokenTransferTool
+"""
+
+import asyncio
+from tools import TokenTransferTool
+
+
+class TestTokenTransferTool:
+    """Test suite for Token Transfer Tool."""
+
+    def test_initialization(self):
+        """Test tool initialization."""
+        tool = TokenTransferTool(contract_hash="0x123abc")
+
+        assert tool.name == "token_transfer"
+        assert tool.contract_hash == "0x123abc"
+
+    async def test_write_stubs_batch(self, token_transfer_tool):
+        """Test transfer/approve stubs, and each batched transfer, report not implemented."""
+        transfer, approve, batch = await asyncio.gather(
+            token_transfer_tool.transfer(to="NXjtd...", token_id="abc"),
+            token_transfer_tool.approve(approved="NXjtd...", token_id="abc"),
+            token_transfer_tool.batch_transfer([{"to": "NXjtd...", "token_id": "abc"}]),
+        )
+
+        for result in (transfer, approve, *batch):
+            assert result["success"] is False
+            assert "Not implemented" in result["error"]
+        assert len(batch) == 1
+
+    async def test_batch_transfer_isolates_failures(self, token_transfer_tool, monkeypatch):
+        """Test batch_transfer keeps input order and reports a raising transfer in place."""
+        async def fake_transfer(to, token_id, data=None):
+            await asyncio.sleep(0.01 if token_id == "a" else 0)
+            if token_id == "bad":
+                raise RuntimeError("rpc down")
+            return {"success": True, "tx_hash": f"0x{token_id}"}
+
+        monkeypatch.setattr(token_transfer_tool, "transfer", fake_transfer)
+        results = await token_transfer_tool.batch_transfer(
+            [{"to": "N1", "token_id": "a"}, {"to": "N2", "token_id": "bad"}, {"to": "N3", "token_id": "c"}]
+        )
+
+        assert results == [
+            {"success": True, "tx_hash": "0xa"},
+            {"success": False, "error": "rpc down"},
+            {"success": True, "tx_hash": "0xc"},
+        ]
+
+    async def test_batch_transfer_reports_cancelled_transfer(self, token_transfer_tool, monkeypatch):
+        """Test a cancelled transfer becomes a failure dict instead of a raw CancelledError."""
+        async def fake_transfer(to, token_id, data=None):
+            if token_id == "cancelled":
+                raise asyncio.CancelledError()
+            return {"success": True, "tx_hash": f"0x{token_id}"}
+
+        monkeypatch.setattr(token_transfer_tool, "transfer", fake_transfer)
+        results = await token_transfer_tool.batch_transfer(
+            [{"to": "N1", "token_id": "cancelled"}, {"to": "N2", "token_id": "b"}]
+        )
+
+        assert results == [
+            {"success": False, "error": "CancelledError"},
+            {"success": True, "tx_hash": "0xb"},
+        ]
+
+    async def test_run_transfer_action(self, token_transfer_tool):
+        """Test run() with transfer action."""
+        result = await token_transfer_tool.run(action="transfer", to="NXjtd...", token_id="abc")
+
+        assert result["success"] is False and "error" in result
+
+    async def test_run_unknown_action(self, token_transfer_tool):
+        """Test run() with unknown action returns error."""
+        result = await token_transfer_tool.run(action="unknown")
+
+        assert "error" in result
@@ -4,7 +4,19 @@ Chatten Tools Module
 Custom SpoonOS tools that bridge agents with the Neo N3 blockchain.
 """
 
-from .neo_bridge import NeoBridgeTool
+from .neo_bridge import NeoBridgeTool, NeoConfig, TransactionResult, AppLogNotification
 from .token_tools import TokenBalanceTool, TokenTransferTool
-from .market_tools import QScoreAnalyzerTool
+from .market_tools import (
+    QScoreAnalyzerTool,
+    PerformanceMetrics,
+    QScoreResult,
+    ModelCategory,
+    MarketAnalysis,
+    QScoreResponse,
+    ModelRanking,
+    CompareResponse,
+    MarketResponse,
+    ErrorResponse,
+)
+from .percentiles import StreamingPercentiles
 
@@ -0,0 +1,104 @@
+"""
+JSON-RPC Helpers
+
+JSON encoding and HTTP session setup shared by the tools and agents.
+Encoding uses orjson when installed (perf extra), otherwise a compact
+stdlib encoder; dataclass results encode as JSON objects on both paths.
+"""
+
+from dataclasses import asdict, is_dataclass
+from typing import Any
+
+# aiohttp for pooled keep-alive JSON-RPC sessions
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    aiohttp = None
+    AIOHTTP_AVAILABLE = False
+
+# Connection pool settings for every RPC session
+_CONNECTOR_LIMIT = 32
+_DNS_CACHE_TTL = 300
+_KEEPALIVE_TIMEOUT = 60
+
+try:
+    import orjson
+
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+except ImportError:
+    import json
+
+    def _default(obj: Any) -> Any:
+        if is_dataclass(obj) and not isinstance(obj, type):
+            return asdict(obj)
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), default=_default).encode("utf-8")
+
+    json_loads = json.loads
+
+
+def new_rpc_session() -> "aiohttp.ClientSession":
+    """
+    Create a keep-alive HTTP session for talking to a Neo N3 RPC node.
+    
+    Returns:
+        aiohttp.ClientSession: Session with pooled connections
+    """
+    if not AIOHTTP_AVAILABLE:
+        raise ImportError("aiohttp is not installed. Install it with: pip install aiohttp")
+    
+    connector = aiohttp.TCPConnector(
+        limit=_CONNECTOR_LIMIT,
+        ttl_dns_cache=_DNS_CACHE_TTL,
+        keepalive_timeout=_KEEPALIVE_TIMEOUT,
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+async def rpc_batch(
+    session: "aiohttp.ClientSession",
+    url: str,
+    calls: list[tuple[str, list[Any]]]
+) -> list[dict]:
+    """
+    Send several JSON-RPC calls to a node in one HTTP request.
+    
+    Args:
+        session: Keep-alive session to post over
+        url: RPC node URL
+        calls: List of (method, params) pairs
+        
+    Returns:
+        list: Response objects, in the same order as ``calls``. A call the
+        node did not answer gets an ``error`` object in its slot
+        
+    Raises:
+        RuntimeError: If the node rejects the whole batch
+    """
+    payload = [
+        {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+        for i, (method, params) in enumerate(calls)
+    ]
+    async with session.post(
+        url,
+        data=json_dumps(payload),
+        headers={"Content-Type": "application/json"},
+    ) as response:
+        response.raise_for_status()
+        body = json_loads(await response.read())
+    
+    # A single error object means the node rejected the whole batch
+    if isinstance(body, dict):
+        error = body.get("error") or {}
+        raise RuntimeError(error.get("message", "Invalid JSON-RPC batch response"))
+    
+    # Batch responses may arrive in any order; map them back by id
+    by_id = {item.get("id"): item for item in body}
+    return [
+        by_id.get(i, {"error": {"message": "No response for request"}})
+        for i in range(len(calls))
+    ]
@@ -0,0 +1,169 @@
+"""
+Q-score Numba Kernels
+
+Compiled versions of the QScoreAnalyzerTool score ladders for scoring
+many models in one pass. Only defined when Numba is installed; callers
+check NUMBA_AVAILABLE and fall back to NumPy or the scalar helpers.
+Nothing is compiled at import; each kernel JIT-compiles (or loads from
+the on-disk cache) on first call.
+"""
+
+try:
+    import numpy as np
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    np = None
+    njit = prange = None
+    NUMBA_AVAILABLE = False
+
+
+# Knots for SCORING_MODE = "smooth": the midpoint of each legacy bucket
+# (1500 stands in for the open >=1000 bucket), so the piecewise-linear
+# curves pass exactly through the legacy scores at those points. Defined
+# here, outside the Numba guard, so market_tools and the kernels share
+# one copy.
+_SMOOTH_KNOTS = (25.0, 75.0, 150.0, 350.0, 750.0, 1500.0)
+_LATENCY_SMOOTH_SCORES = (1.0, 0.8, 0.6, 0.4, 0.2, 0.0)
+_THROUGHPUT_SMOOTH_SCORES = (0.0, 0.2, 0.4, 0.6, 0.8, 1.0)
+
+
+if NUMBA_AVAILABLE:
+    # fastmath is left off so results stay bit-identical to the scalar helpers
+
+    @njit(cache=True, inline="always")
+    def _latency_score(latency: float) -> float:
+        """Mirror of QScoreAnalyzerTool._calculate_latency_score."""
+        if latency <= 0:
+            return 0.0
+        if latency < 50:
+            return 1.0
+        if latency < 100:
+            return 0.8
+        if latency < 200:
+            return 0.6
+        if latency < 500:
+            return 0.4
+        if latency < 1000:
+            return 0.2
+        return 0.0
+
+    @njit(cache=True, inline="always")
+    def _throughput_score(tps: float) -> float:
+        """Mirror of QScoreAnalyzerTool._calculate_throughput_score."""
+        if tps >= 1000:
+            return 1.0
+        if tps >= 500:
+            return 0.8
+        if tps >= 200:
+            return 0.6
+        if tps >= 100:
+            return 0.4
+        if tps >= 50:
+            return 0.2
+        return 0.0
+
+    @njit(cache=True, inline="always")
+    def _piecewise_linear(x: float, xs, ys) -> float:
+        """Mirror of market_tools._piecewise_linear."""
+        if not x > xs[0]:
+            return ys[0]
+        last = len(xs) - 1
+        if x >= xs[last]:
+            return ys[last]
+        j = 0
+        while xs[j + 1] <= x:
+            j += 1
+        return (ys[j + 1] - ys[j]) / (xs[j + 1] - xs[j]) * (x - xs[j]) + ys[j]
+
+    @njit(cache=True, inline="always")
+    def _quality_score(accuracy: float, benchmark: float) -> float:
+        """Mirror of QScoreAnalyzerTool._calculate_quality_score."""
+        accuracy = min(max(accuracy, 0.0), 1.0)
+        benchmark = min(max(benchmark / 100.0, 0.0), 1.0)
+        return accuracy * 0.6 + benchmark * 0.4
+
+    @njit(cache=True, inline="always")
+    def _reliability_score(uptime: float, error_rate: float) -> float:
+        """Mirror of QScoreAnalyzerTool._calculate_reliability_score."""
+        if uptime >= 99.9:
+            uptime_score = 1.0
+        elif uptime >= 99:
+            uptime_score = 0.9
+        elif uptime >= 95:
+            uptime_score = 0.5
+        elif uptime >= 90:
+            uptime_score = 0.2
+        else:
+            uptime_score = 0.0
+
+        if error_rate <= 0:
+            error_score = 1.0
+        elif error_rate <= 0.01:
+            error_score = 0.9
+        elif error_rate <= 0.05:
+            error_score = 0.5
+        elif error_rate < 0.10:
+            error_score = 0.2
+        else:
+            error_score = 0.0
+
+        return uptime_score * 0.5 + error_score * 0.5
+
+    # Below this many models, thread start-up costs more than the scoring
+    _PARALLEL_MIN_MODELS = 10_000
+
+    @njit(cache=True, inline="always")
+    def _score_into(out, i, lat, tps, acc, bench, uptime, err, weights, smooth):
+        """Write model i's four sub-scores and Q-score into column i of out."""
+        if smooth:
+            latency = (
+                0.0 if lat[i] <= 0
+                else _piecewise_linear(lat[i], _SMOOTH_KNOTS, _LATENCY_SMOOTH_SCORES)
+            )
+            throughput = _piecewise_linear(tps[i], _SMOOTH_KNOTS, _THROUGHPUT_SMOOTH_SCORES)
+        else:
+            latency = _latency_score(lat[i])
+            throughput = _throughput_score(tps[i])
+        quality = _quality_score(acc[i], bench[i])
+        reliability = _reliability_score(uptime[i], err[i])
+        out[0, i] = latency
+        out[1, i] = throughput
+        out[2, i] = quality
+        out[3, i] = reliability
+        out[4, i] = (
+            latency * weights[0] +
+            throughput * weights[1] +
+            quality * weights[2] +
+            reliability * weights[3]
+        ) * 100
+
+    @njit(cache=True)
+    def _q_score_serial(lat, tps, acc, bench, uptime, err, weights, smooth):
+        """Score every model on the calling thread."""
+        n = lat.shape[0]
+        out = np.empty((5, n), dtype=np.float64)
+        for i in range(n):
+            _score_into(out, i, lat, tps, acc, bench, uptime, err, weights, smooth)
+        return out
+
+    @njit(cache=True, parallel=True)
+    def _q_score_parallel(lat, tps, acc, bench, uptime, err, weights, smooth):
+        """Score every model across Numba's thread pool."""
+        n = lat.shape[0]
+        out = np.empty((5, n), dtype=np.float64)
+        for i in prange(n):
+            _score_into(out, i, lat, tps, acc, bench, uptime, err, weights, smooth)
+        return out
+
+    def q_score_kernel(lat, tps, acc, bench, uptime, err, weights, smooth):
+        """
+        Score every model, in parallel only for large batches.
+
+        ``smooth`` selects the piecewise-linear latency and throughput
+        curves instead of the bucketed ladders. Returns a (5, n) array of
+        latency, throughput, quality and reliability scores (0-1) and
+        composite Q-scores (0-100). Each variant compiles on first use.
+        """
+        kernel = _q_score_parallel if lat.shape[0] >= _PARALLEL_MIN_MODELS else _q_score_serial
+        return kernel(lat, tps, acc, bench, uptime, err, weights, smooth)
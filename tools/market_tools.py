@@ -5,10 +5,16 @@ SpoonOS tools for analyzing market quality and AI model performance.
 """
 from __future__ import annotations
 
-from typing import Any, Optional
-from dataclasses import dataclass, field
+import asyncio
+import bisect
+import heapq
+import math
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Sequence
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime
-from enum import Enum
+from enum import IntEnum
 
 # SpoonOS SDK imports
 try:
@@ -19,18 +25,159 @@ except ImportError:
     ToolResult = dict
     BaseTool = object
 
+# Optional NumPy for batched scoring in compare_models
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+from .percentiles import StreamingPercentiles
+from ._qscore_numba import (
+    NUMBA_AVAILABLE,
+    # Smooth-mode tables (SCORING_MODE = "smooth"), shared with the kernels
+    _LATENCY_SMOOTH_SCORES,
+    _SMOOTH_KNOTS,
+    _THROUGHPUT_SMOOTH_SCORES,
+)
+if NUMBA_AVAILABLE:
+    from ._qscore_numba import q_score_kernel
+
+
+# Score ladders as (bucket bounds, bucket scores) for batched lookup.
+# Each one mirrors the matching QScoreAnalyzerTool._calculate_*_score helper.
+_LATENCY_BOUNDS = (50.0, 100.0, 200.0, 500.0, 1000.0)
+_LATENCY_SCORES = (1.0, 0.8, 0.6, 0.4, 0.2, 0.0)
+_THROUGHPUT_BOUNDS = (50.0, 100.0, 200.0, 500.0, 1000.0)
+_THROUGHPUT_SCORES = (0.0, 0.2, 0.4, 0.6, 0.8, 1.0)
+_UPTIME_BOUNDS = (90.0, 95.0, 99.0, 99.9)
+_UPTIME_SCORES = (0.0, 0.2, 0.5, 0.9, 1.0)
+_ERROR_BOUNDS = (0.0, 0.01, 0.05)
+_ERROR_SCORES = (1.0, 0.9, 0.5, 0.2)
+_ERROR_CUTOFF = 0.10
+
+
+def _piecewise_linear(x: float, xs: tuple[float, ...], ys: tuple[float, ...]) -> float:
+    """
+    Interpolate linearly between knots, holding the end values outside them.
+    
+    Args:
+        x: Input value
+        xs: Ascending knot positions
+        ys: Value at each knot
+        
+    Returns:
+        float: Interpolated value
+    """
+    if not x > xs[0]:
+        return ys[0]
+    if x >= xs[-1]:
+        return ys[-1]
+    j = bisect.bisect_right(xs, x) - 1
+    return (ys[j + 1] - ys[j]) / (xs[j + 1] - xs[j]) * (x - xs[j]) + ys[j]
+
+
+def _frozen_array(table: tuple[float, ...]) -> "np.ndarray":
+    """Read-only float64 copy of a score table."""
+    array = np.array(table, dtype=np.float64)
+    array.flags.writeable = False
+    return array
+
+
+if NUMPY_AVAILABLE:
+    # Converted once so searchsorted and indexing never rebuild them per call
+    _LATENCY_BOUNDS_ARR = _frozen_array(_LATENCY_BOUNDS)
+    _LATENCY_SCORES_ARR = _frozen_array(_LATENCY_SCORES)
+    _THROUGHPUT_BOUNDS_ARR = _frozen_array(_THROUGHPUT_BOUNDS)
+    _THROUGHPUT_SCORES_ARR = _frozen_array(_THROUGHPUT_SCORES)
+    _UPTIME_BOUNDS_ARR = _frozen_array(_UPTIME_BOUNDS)
+    _UPTIME_SCORES_ARR = _frozen_array(_UPTIME_SCORES)
+    _ERROR_BOUNDS_ARR = _frozen_array(_ERROR_BOUNDS)
+    _ERROR_SCORES_ARR = _frozen_array(_ERROR_SCORES)
+    _SMOOTH_KNOTS_ARR = _frozen_array(_SMOOTH_KNOTS)
+    _LATENCY_SMOOTH_SCORES_ARR = _frozen_array(_LATENCY_SMOOTH_SCORES)
+    _THROUGHPUT_SMOOTH_SCORES_ARR = _frozen_array(_THROUGHPUT_SMOOTH_SCORES)
+
+
+def _piecewise_linear_array(x: "np.ndarray", xs: "np.ndarray", ys: "np.ndarray") -> "np.ndarray":
+    """
+    Vectorized _piecewise_linear, computed with the same float operations.
+    
+    Args:
+        x: Input values
+        xs: Ascending knot positions
+        ys: Value at each knot
+        
+    Returns:
+        np.ndarray: Interpolated values
+    """
+    j = np.clip(np.searchsorted(xs, x, side="right") - 1, 0, len(xs) - 2)
+    inner = (ys[j + 1] - ys[j]) / (xs[j + 1] - xs[j]) * (x - xs[j]) + ys[j]
+    return np.where(~(x > xs[0]), ys[0], np.where(x >= xs[-1], ys[-1], inner))
+
+
+# Below this many results plain sorted()/heapq beat the NumPy round-trip
+_ARGSORT_MIN_MODELS = 100
+
+
+# Recommendations for weak components (score < 0.5), in bit order:
+# latency, throughput, quality, reliability
+_COMPONENT_RECOMMENDATIONS = (
+    "Consider optimizing inference latency",
+    "Throughput could be improved with batching",
+    "Model accuracy needs improvement",
+    "Improve uptime and reduce error rates",
+)
+# Closing recommendation per Q-score band: below mint, mint eligible, excellent
+_BAND_RECOMMENDATIONS = (
+    "Below threshold - improvements needed before minting",
+    "Good performance - eligible for token minting",
+    "Excellent performance - eligible for premium rates",
+)
+
+
+def _build_recommendation_table() -> dict[int, tuple[str, ...]]:
+    """Map every (weak components, band) bitmask to its recommendations."""
+    table = {}
+    for band, closing in enumerate(_BAND_RECOMMENDATIONS):
+        for weak in range(1 << len(_COMPONENT_RECOMMENDATIONS)):
+            table[weak | band << 4] = tuple(
+                text
+                for bit, text in enumerate(_COMPONENT_RECOMMENDATIONS)
+                if weak >> bit & 1
+            ) + (closing,)
+    return table
+
+
+_RECOMMENDATION_TABLE = _build_recommendation_table()
+
 
-class ModelCategory(Enum):
-    """Categories of AI models for Q-score calculation."""
+class ModelCategory(IntEnum):
+    """
+    Categories of AI models for Q-score calculation.
+    
+    Integer values are stable, so categories can be stored in compact
+    arrays and used directly as table indices.
+    """
     
-    LLM = "llm"                    # Large Language Models
-    IMAGE_GEN = "image_generation"  # Image Generation
-    EMBEDDING = "embedding"         # Embedding Models
-    AUDIO = "audio"                # Audio Processing
-    MULTIMODAL = "multimodal"      # Multimodal Models
+    LLM = 0           # Large Language Models
+    IMAGE_GEN = 1     # Image Generation
+    EMBEDDING = 2     # Embedding Models
+    AUDIO = 3         # Audio Processing
+    MULTIMODAL = 4    # Multimodal Models
+    
+    @property
+    def slug(self) -> str:
+        """String identifier used in JSON payloads."""
+        return _CATEGORY_SLUGS[self]
+
 
+# Indexed by ModelCategory value
+_CATEGORY_SLUGS = ("llm", "image_generation", "embedding", "audio", "multimodal")
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class PerformanceMetrics:
     """Performance metrics for Q-score calculation."""
     
@@ -59,7 +206,7 @@ class PerformanceMetrics:
     sample_size: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class QScoreResult:
     """Result of Q-score calculation."""
     
@@ -75,21 +222,90 @@ class QScoreResult:
     reliability_score: float = 0.0    # 0-25 max
     
     # Recommendations
-    recommendations: list[str] = field(default_factory=list)
+    recommendations: tuple[str, ...] = ()
     mint_eligible: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketAnalysis:
-    """Market-wide analysis result."""
+    """
+    Market-wide analysis result.
     
-    total_models: int = 0
-    avg_q_score: float = 0.0
-    top_performers: list[str] = field(default_factory=list)
+    Covers models with a still-valid cached score: those ranked by
+    compare_models or scored by calculate_q_score from oracle metrics.
+    """
+    
+    total_models: int = 0             # models with a valid cached score
+    avg_q_score: float = 0.0          # mean over those models
+    top_performers: list[str] = field(default_factory=list)  # ties in cache order
     market_liquidity: float = 0.0
     price_trend: str = "stable"       # "up", "down", "stable"
 
 
+# =============================================================================
+# RUN() RESPONSES
+# =============================================================================
+# run() returns these frozen dataclasses; orjson encodes them natively, so
+# the framework boundary serializes them without building dicts first.
+
+@dataclass(frozen=True, slots=True)
+class QScoreResponse:
+    """Result of run(action="calculate")."""
+    
+    model_id: str
+    q_score: float
+    mint_eligible: bool
+    recommendations: tuple[str, ...] = ()
+    
+    def to_dict(self) -> dict:
+        """Plain dict form for legacy callers."""
+        return asdict(self)
+
+
+@dataclass(frozen=True, slots=True)
+class ModelRanking:
+    """One entry of a CompareResponse."""
+    
+    model_id: str
+    q_score: float
+
+
+@dataclass(frozen=True, slots=True)
+class CompareResponse:
+    """Result of run(action="compare"), highest Q-score first."""
+    
+    rankings: tuple[ModelRanking, ...] = ()
+    
+    def to_dict(self) -> dict:
+        """Plain dict form for legacy callers."""
+        return asdict(self)
+
+
+@dataclass(frozen=True, slots=True)
+class MarketResponse:
+    """Result of run(action="market")."""
+    
+    total_models: int = 0
+    avg_q_score: float = 0.0
+    trend: str = "stable"
+    
+    def to_dict(self) -> dict:
+        """Plain dict form for legacy callers."""
+        return asdict(self)
+
+
+@dataclass(frozen=True, slots=True)
+class ErrorResponse:
+    """Result of run() for an action it does not handle."""
+    
+    error: str
+    action: str = ""
+    
+    def to_dict(self) -> dict:
+        """Plain dict form for legacy callers."""
+        return asdict(self)
+
+
 class QScoreAnalyzerTool(BaseTool):
     """
     SpoonOS Tool for analyzing AI model Quality Scores (Q-score).
@@ -125,10 +341,30 @@ class QScoreAnalyzerTool(BaseTool):
     QUALITY_WEIGHT = 0.25
     RELIABILITY_WEIGHT = 0.25
     
+    # "legacy" bucketed latency/throughput ladders, or "smooth"
+    # piecewise-linear curves through the legacy bucket midpoints
+    SCORING_MODE = "legacy"
+    
+    # Max per-model results kept for compare_models
+    SCORE_CACHE_SIZE = 1024
+    
+    # Models listed in MarketAnalysis.top_performers
+    TOP_PERFORMERS = 10
+    
+    # Oracle metrics cache bounds (entries, seconds)
+    METRICS_CACHE_SIZE = 1024
+    METRICS_TTL_SECONDS = 30.0
+    
     def __init__(self) -> None:
         """Initialize the Q-score Analyzer Tool."""
         super().__init__()
-        self._metrics_cache: dict[str, PerformanceMetrics] = {}
+        # model_id -> (expires_at, metrics), least recently used first
+        self._metrics_cache: OrderedDict[str, tuple[float, PerformanceMetrics]] = OrderedDict()
+        self._pending_metrics: dict[str, asyncio.Task] = {}
+        # model_id -> latency estimator, least recently updated first
+        self._latency_percentiles: OrderedDict[str, StreamingPercentiles] = OrderedDict()
+        # model_id -> (expires_at, scoring mode, result), least recently used first
+        self._score_cache: OrderedDict[str, tuple[float, str, QScoreResult]] = OrderedDict()
     
     # =========================================================================
     # Q-SCORE CALCULATION
@@ -143,6 +379,9 @@ class QScoreAnalyzerTool(BaseTool):
         """
         Calculate the Q-score for an AI model.
         
+        When metrics are fetched from the oracle the result is remembered
+        for get_market_analysis; scores of caller-supplied metrics are not.
+        
         Args:
             model_id: Unique identifier of the model
             metrics: Pre-collected performance metrics (if available)
@@ -151,17 +390,33 @@ class QScoreAnalyzerTool(BaseTool):
         Returns:
             QScoreResult: Complete Q-score analysis
         """
-        # TODO: Implement Q-score calculation
-        # 1. Fetch metrics from oracle if not provided
-        # 2. Calculate component scores
-        # 3. Apply weights and normalize
-        # 4. Generate recommendations
+        if metrics is not None:
+            return self._score_from_metrics(model_id, metrics, category)
         
-        # Placeholder implementation
-        if metrics is None:
-            metrics = await self._fetch_metrics(model_id)
+        metrics = await self._fetch_metrics(model_id)
+        result = self._score_from_metrics(model_id, metrics, category)
+        # Oracle-backed scores count towards get_market_analysis
+        self._remember_score(result)
+        return result
+    
+    def _score_from_metrics(
+        self,
+        model_id: str,
+        metrics: PerformanceMetrics,
+        category: ModelCategory = ModelCategory.LLM
+    ) -> QScoreResult:
+        """
+        Score already-fetched metrics without touching the oracle.
         
-        # Calculate component scores (placeholder)
+        Args:
+            model_id: Unique identifier of the model
+            metrics: Performance metrics to score
+            category: Model category for scoring context
+            
+        Returns:
+            QScoreResult: Complete Q-score analysis
+        """
+        # Calculate component scores
         latency_score = self._calculate_latency_score(metrics)
         throughput_score = self._calculate_throughput_score(metrics)
         quality_score = self._calculate_quality_score(metrics)
@@ -210,23 +465,252 @@ class QScoreAnalyzerTool(BaseTool):
         Returns:
             list: Sorted list of QScoreResults (highest first)
         """
-        # TODO: Implement model comparison
-        results = []
-        for model_id in model_ids:
-            result = await self.calculate_q_score(model_id)
-            results.append(result)
+        now = time.monotonic()
+        scored = {}
+        for model_id in dict.fromkeys(model_ids):
+            result = self._cached_score(model_id, now)
+            if result is not None:
+                scored[model_id] = result
+        missing = [m for m in dict.fromkeys(model_ids) if m not in scored]
+        
+        if missing:
+            # Fetch all missing metrics concurrently, then score in one batch
+            metrics_list = await asyncio.gather(*map(self._fetch_metrics, missing))
+            for result in self._results_from_batch(missing, metrics_list):
+                scored[result.model_id] = result
+                self._remember_score(result)
         
+        results = [scored[model_id] for model_id in model_ids]
+        if NUMPY_AVAILABLE and len(results) >= _ARGSORT_MIN_MODELS:
+            q_scores = np.fromiter((r.q_score for r in results), dtype=np.float64, count=len(results))
+            # Negate rather than reverse so tied models keep their input order
+            return [results[i] for i in np.argsort(-q_scores, kind="stable")]
         return sorted(results, key=lambda x: x.q_score, reverse=True)
     
+    def _cached_score(self, model_id: str, now: float) -> Optional[QScoreResult]:
+        """
+        Get a memoized oracle-backed score if it is still valid.
+        
+        Entries expire together with the metrics they were scored from,
+        and are dropped if SCORING_MODE has changed since.
+        
+        Args:
+            model_id: Model to look up
+            now: Current time.monotonic() reading
+            
+        Returns:
+            QScoreResult: Cached result, or None if absent or stale
+        """
+        cached = self._score_cache.get(model_id)
+        if cached is None:
+            return None
+        expires_at, scoring_mode, result = cached
+        if expires_at <= now or scoring_mode != self.SCORING_MODE:
+            del self._score_cache[model_id]
+            return None
+        self._score_cache.move_to_end(model_id)
+        return result
+    
+    def _remember_score(self, result: QScoreResult) -> None:
+        """Store an oracle-backed score, evicting the least recently used when full."""
+        # Expire with the metrics entry the result was scored from
+        cached_metrics = self._metrics_cache.get(result.model_id)
+        if cached_metrics is not None:
+            expires_at = cached_metrics[0]
+        else:
+            expires_at = time.monotonic() + self.METRICS_TTL_SECONDS
+        
+        self._score_cache.pop(result.model_id, None)
+        if len(self._score_cache) >= self.SCORE_CACHE_SIZE:
+            self._score_cache.popitem(last=False)
+        self._score_cache[result.model_id] = (expires_at, self.SCORING_MODE, result)
+    
+    def clear_cache(self) -> None:
+        """Drop cached metrics and scores so the next call re-fetches and re-scores."""
+        self._metrics_cache.clear()
+        self._score_cache.clear()
+    
+    def _results_from_batch(
+        self,
+        model_ids: Sequence[str],
+        metrics_list: Sequence[PerformanceMetrics],
+        category: ModelCategory = ModelCategory.LLM
+    ) -> list[QScoreResult]:
+        """
+        Build QScoreResults for many models from one batched scoring pass.
+        
+        Args:
+            model_ids: Model identifiers, parallel to ``metrics_list``
+            metrics_list: Performance metrics for each model
+            category: Model category for scoring context
+            
+        Returns:
+            list: One QScoreResult per model, in input order
+        """
+        latency, throughput, quality, reliability, q_scores = self._score_batch(metrics_list)
+        
+        return [
+            QScoreResult(
+                model_id=model_id,
+                q_score=q_score,
+                category=category,
+                metrics=metrics,
+                latency_score=l * 25,
+                throughput_score=t * 25,
+                quality_score=q * 25,
+                reliability_score=r * 25,
+                recommendations=self._generate_recommendations(q_score, l, t, q, r),
+                mint_eligible=q_score >= self.MIN_SCORE_FOR_MINT
+            )
+            for model_id, metrics, l, t, q, r, q_score in zip(
+                model_ids, metrics_list, latency, throughput, quality, reliability, q_scores
+            )
+        ]
+    
+    def _score_batch(
+        self,
+        metrics_list: Sequence[PerformanceMetrics]
+    ) -> tuple[list[float], list[float], list[float], list[float], list[float]]:
+        """
+        Score many models at once.
+        
+        With NumPy, each metric field becomes one float64 array. Numba,
+        when installed, runs the compiled ladders over those arrays in
+        parallel. Otherwise every score ladder is a single searchsorted
+        lookup. Without NumPy this falls back to the scalar helpers. All
+        paths give the same results as calculate_q_score.
+        
+        Args:
+            metrics_list: Performance metrics for each model
+            
+        Returns:
+            tuple: Latency, throughput, quality and reliability component
+            scores (0-1) and composite Q-scores (0-100), one entry per model
+        """
+        if not NUMPY_AVAILABLE:
+            latency = [self._calculate_latency_score(m) for m in metrics_list]
+            throughput = [self._calculate_throughput_score(m) for m in metrics_list]
+            quality = [self._calculate_quality_score(m) for m in metrics_list]
+            reliability = [self._calculate_reliability_score(m) for m in metrics_list]
+            q_scores = [
+                (l * self.LATENCY_WEIGHT + t * self.THROUGHPUT_WEIGHT +
+                 q * self.QUALITY_WEIGHT + r * self.RELIABILITY_WEIGHT) * 100
+                for l, t, q, r in zip(latency, throughput, quality, reliability)
+            ]
+            return latency, throughput, quality, reliability, q_scores
+        
+        n = len(metrics_list)
+        
+        def column(attr: str) -> "np.ndarray":
+            return np.fromiter(
+                (getattr(m, attr) for m in metrics_list), dtype=np.float64, count=n
+            )
+        
+        lat = column("avg_latency_ms")
+        tps = column("tokens_per_second")
+        acc = column("accuracy_score")
+        bench = column("benchmark_score")
+        uptime = column("uptime_percentage")
+        err = column("error_rate")
+        
+        if NUMBA_AVAILABLE:
+            weights = np.array([
+                self.LATENCY_WEIGHT,
+                self.THROUGHPUT_WEIGHT,
+                self.QUALITY_WEIGHT,
+                self.RELIABILITY_WEIGHT,
+            ])
+            out = q_score_kernel(
+                lat, tps, acc, bench, uptime, err, weights, self.SCORING_MODE == "smooth"
+            )
+            return tuple(row.tolist() for row in out)
+        
+        if self.SCORING_MODE == "smooth":
+            latency = np.where(
+                lat <= 0,
+                0.0,
+                _piecewise_linear_array(lat, _SMOOTH_KNOTS_ARR, _LATENCY_SMOOTH_SCORES_ARR)
+            )
+            throughput = _piecewise_linear_array(
+                tps, _SMOOTH_KNOTS_ARR, _THROUGHPUT_SMOOTH_SCORES_ARR
+            )
+        else:
+            latency = np.where(
+                lat <= 0,
+                0.0,
+                _LATENCY_SCORES_ARR[np.searchsorted(_LATENCY_BOUNDS_ARR, lat, side="right")]
+            )
+            throughput = _THROUGHPUT_SCORES_ARR[
+                np.searchsorted(_THROUGHPUT_BOUNDS_ARR, tps, side="right")
+            ]
+        quality = np.clip(acc, 0.0, 1.0) * 0.6 + np.clip(bench / 100.0, 0.0, 1.0) * 0.4
+        uptime_score = _UPTIME_SCORES_ARR[
+            np.searchsorted(_UPTIME_BOUNDS_ARR, uptime, side="right")
+        ]
+        error_score = np.where(
+            err >= _ERROR_CUTOFF,
+            0.0,
+            _ERROR_SCORES_ARR[np.searchsorted(_ERROR_BOUNDS_ARR, err, side="left")]
+        )
+        reliability = uptime_score * 0.5 + error_score * 0.5
+        
+        q_scores = (
+            latency * self.LATENCY_WEIGHT +
+            throughput * self.THROUGHPUT_WEIGHT +
+            quality * self.QUALITY_WEIGHT +
+            reliability * self.RELIABILITY_WEIGHT
+        ) * 100
+        
+        return (
+            latency.tolist(),
+            throughput.tolist(),
+            quality.tolist(),
+            reliability.tolist(),
+            q_scores.tolist(),
+        )
+    
     async def get_market_analysis(self) -> MarketAnalysis:
         """
         Get market-wide Q-score analysis.
         
+        Aggregates every model with a still-valid score in the cache, i.e.
+        models scored by compare_models or by calculate_q_score from
+        oracle metrics (scores of caller-supplied metrics are not kept).
+        Large markets use NumPy reductions and a partial sort for the top
+        performers instead of a full sort; either way, tied scores rank in
+        cache order (least recently used first).
+        
         Returns:
             MarketAnalysis: Overview of market quality metrics
         """
-        # TODO: Implement market analysis
-        return MarketAnalysis()
+        # Liquidity and price trend need on-chain trade data
+        now = time.monotonic()
+        # Copy the keys: _cached_score drops stale entries as it goes
+        cached = (self._cached_score(model_id, now) for model_id in list(self._score_cache))
+        results = [result for result in cached if result is not None]
+        n = len(results)
+        if not n:
+            return MarketAnalysis()
+        
+        k = min(self.TOP_PERFORMERS, n)
+        if NUMPY_AVAILABLE and n >= _ARGSORT_MIN_MODELS:
+            q_scores = np.fromiter((r.q_score for r in results), dtype=np.float64, count=n)
+            avg_q_score = float(q_scores.mean())
+            # Everything above the k-th largest score, then the earliest ties
+            kth = np.partition(q_scores, n - k)[n - k]
+            above = np.flatnonzero(q_scores > kth)
+            ties = np.flatnonzero(q_scores == kth)[:k - above.size]
+            top = np.sort(np.concatenate((above, ties)))
+            top = top[np.argsort(-q_scores[top], kind="stable")].tolist()
+        else:
+            avg_q_score = sum(r.q_score for r in results) / n
+            top = heapq.nlargest(k, range(n), key=lambda i: (results[i].q_score, -i))
+        
+        return MarketAnalysis(
+            total_models=n,
+            avg_q_score=avg_q_score,
+            top_performers=[results[i].model_id for i in top],
+        )
     
     # =========================================================================
     # SCORE CALCULATION HELPERS
@@ -244,10 +728,15 @@ class QScoreAnalyzerTool(BaseTool):
         - <500ms = 0.4 (fair)
         - <1000ms = 0.2 (poor)
         - >=1000ms = 0.0 (unacceptable)
+        
+        With SCORING_MODE = "smooth" the score instead falls linearly
+        between the bucket midpoints (25, 75, 150, 350, 750, 1500ms).
         """
         latency = metrics.avg_latency_ms
         if latency <= 0:
             return 0.0
+        if self.SCORING_MODE == "smooth":
+            return _piecewise_linear(latency, _SMOOTH_KNOTS, _LATENCY_SMOOTH_SCORES)
         if latency < 50:
             return 1.0
         if latency < 100:
@@ -272,8 +761,13 @@ class QScoreAnalyzerTool(BaseTool):
         - >=100 = 0.4 (fair)
         - >=50 = 0.2 (poor)
         - <50 = 0.0 (unacceptable)
+        
+        With SCORING_MODE = "smooth" the score instead rises linearly
+        between the bucket midpoints (25, 75, 150, 350, 750, 1500 tps).
         """
         tps = metrics.tokens_per_second
+        if self.SCORING_MODE == "smooth":
+            return _piecewise_linear(tps, _SMOOTH_KNOTS, _THROUGHPUT_SMOOTH_SCORES)
         if tps >= 1000:
             return 1.0
         if tps >= 500:
@@ -341,49 +835,109 @@ class QScoreAnalyzerTool(BaseTool):
         throughput: float,
         quality: float,
         reliability: float
-    ) -> list[str]:
+    ) -> tuple[str, ...]:
         """
         Generate improvement recommendations based on scores.
+        
+        Weak components and the Q-score band are packed into a bitmask
+        that indexes a table of recommendation tuples built once at import.
+        The shared tuple is returned as-is, so callers must not mutate it.
         """
-        recommendations = []
-        
-        if latency < 0.5:
-            recommendations.append("Consider optimizing inference latency")
-        if throughput < 0.5:
-            recommendations.append("Throughput could be improved with batching")
-        if quality < 0.5:
-            recommendations.append("Model accuracy needs improvement")
-        if reliability < 0.5:
-            recommendations.append("Improve uptime and reduce error rates")
-        
-        if q_score >= self.EXCELLENT_THRESHOLD:
-            recommendations.append("Excellent performance - eligible for premium rates")
-        elif q_score >= self.MIN_SCORE_FOR_MINT:
-            recommendations.append("Good performance - eligible for token minting")
-        else:
-            recommendations.append("Below threshold - improvements needed before minting")
+        band = (q_score >= self.EXCELLENT_THRESHOLD) + (q_score >= self.MIN_SCORE_FOR_MINT)
+        mask = (
+            (latency < 0.5)
+            | (throughput < 0.5) << 1
+            | (quality < 0.5) << 2
+            | (reliability < 0.5) << 3
+            | band << 4
+        )
+        return _RECOMMENDATION_TABLE[mask]
+    
+    def record_latency(self, model_id: str, latency_ms: float) -> None:
+        """
+        Record an observed request latency for a model.
+        
+        Feeds the streaming estimator behind the P95/P99 latency reported
+        in the model's next metrics fetch.
         
-        return recommendations
+        Args:
+            model_id: Model the request was served by
+            latency_ms: Observed latency in milliseconds
+            
+        Raises:
+            ValueError: If latency_ms is NaN or infinite
+        """
+        # Reject before a new model gets an (empty) estimator slot
+        if not math.isfinite(latency_ms):
+            raise ValueError(f"Latency sample must be finite, got {latency_ms}")
+        percentiles = self._latency_percentiles.get(model_id)
+        if percentiles is None:
+            # Same bound as the metrics cache; evict the stalest model
+            if len(self._latency_percentiles) >= self.METRICS_CACHE_SIZE:
+                self._latency_percentiles.popitem(last=False)
+            percentiles = self._latency_percentiles[model_id] = StreamingPercentiles()
+        else:
+            self._latency_percentiles.move_to_end(model_id)
+        percentiles.update(latency_ms)
     
     async def _fetch_metrics(self, model_id: str) -> PerformanceMetrics:
         """
         Fetch performance metrics from oracle or cache.
         
+        Cached metrics are served until METRICS_TTL_SECONDS old, and
+        concurrent misses for the same model share one oracle request.
+        
         Args:
             model_id: Model to fetch metrics for
             
         Returns:
             PerformanceMetrics: Current metrics
         """
-        # TODO: Implement oracle integration
         # Check cache first
-        if model_id in self._metrics_cache:
-            return self._metrics_cache[model_id]
+        cached = self._metrics_cache.get(model_id)
+        if cached is not None:
+            expires_at, metrics = cached
+            if expires_at > time.monotonic():
+                self._metrics_cache.move_to_end(model_id)
+                return metrics
+            del self._metrics_cache[model_id]
         
+        task = self._pending_metrics.get(model_id)
+        if task is None:
+            task = asyncio.ensure_future(self._load_metrics(model_id))
+            self._pending_metrics[model_id] = task
+            task.add_done_callback(lambda _: self._pending_metrics.pop(model_id, None))
+        
+        # Shield so one cancelled caller does not cancel the shared request
+        return await asyncio.shield(task)
+    
+    async def _load_metrics(self, model_id: str) -> PerformanceMetrics:
+        """
+        Fetch metrics from the oracle and store them in the cache.
+        
+        Args:
+            model_id: Model to fetch metrics for
+            
+        Returns:
+            PerformanceMetrics: Freshly fetched metrics
+        """
+        # TODO: Implement oracle integration
         # Fetch from oracle
         # ...
+        metrics = PerformanceMetrics()
+        
+        percentiles = self._latency_percentiles.get(model_id)
+        if percentiles is not None and percentiles.count:
+            metrics = replace(
+                metrics,
+                p95_latency_ms=percentiles.quantile(0.95),
+                p99_latency_ms=percentiles.quantile(0.99),
+            )
         
-        return PerformanceMetrics()
+        if len(self._metrics_cache) >= self.METRICS_CACHE_SIZE:
+            self._metrics_cache.popitem(last=False)
+        self._metrics_cache[model_id] = (time.monotonic() + self.METRICS_TTL_SECONDS, metrics)
+        return metrics
     
     # =========================================================================
     # TOOL INTERFACE (SpoonOS)
@@ -396,30 +950,28 @@ class QScoreAnalyzerTool(BaseTool):
         if action == "calculate":
             model_id = kwargs.get("model_id", "")
             result = await self.calculate_q_score(model_id)
-            return {
-                "model_id": result.model_id,
-                "q_score": result.q_score,
-                "mint_eligible": result.mint_eligible,
-                "recommendations": result.recommendations
-            }
+            return QScoreResponse(
+                model_id=result.model_id,
+                q_score=result.q_score,
+                mint_eligible=result.mint_eligible,
+                recommendations=result.recommendations
+            )
         
         elif action == "compare":
             model_ids = kwargs.get("model_ids", [])
             results = await self.compare_models(model_ids)
-            return {
-                "rankings": [
-                    {"model_id": r.model_id, "q_score": r.q_score}
-                    for r in results
-                ]
-            }
+            return CompareResponse(rankings=tuple(
+                ModelRanking(model_id=r.model_id, q_score=r.q_score)
+                for r in results
+            ))
         
         elif action == "market":
             analysis = await self.get_market_analysis()
-            return {
-                "total_models": analysis.total_models,
-                "avg_q_score": analysis.avg_q_score,
-                "trend": analysis.price_trend
-            }
+            return MarketResponse(
+                total_models=analysis.total_models,
+                avg_q_score=analysis.avg_q_score,
+                trend=analysis.price_trend
+            )
         
-        return {"error": "Unknown action"}
+        return ErrorResponse(error="Unknown action", action=action)
 
@@ -6,8 +6,9 @@ Handles RPC communication, transaction signing, and contract invocation.
 """
 
 from __future__ import annotations
+import base64
 from typing import Any, Optional, List
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 # SpoonOS SDK imports
 try:
@@ -37,8 +38,84 @@ except ImportError:
     UInt256 = bytes
     Transaction = object
 
+# orjson-backed (de)serialization and pooled sessions for RPC payloads
+from ._jsonrpc import (
+    json_dumps as _json_dumps,
+    json_loads as _json_loads,
+    new_rpc_session,
+    rpc_batch,
+)
 
-@dataclass
+
+def to_uint160(value: str | UInt160) -> UInt160:
+    """
+    Convert a hex script hash to UInt160, passing UInt160 values through.
+    
+    Lets callers parse a contract hash once and reuse the result across
+    RPC calls instead of re-parsing the hex string on every invocation.
+    
+    Args:
+        value: Script hash as a hex string (0x prefix optional) or UInt160
+        
+    Returns:
+        UInt160: Parsed script hash (raw bytes without neo3 installed)
+    """
+    if not isinstance(value, str):
+        return value
+    if value[:2] in ("0x", "0X"):
+        value = value[2:]
+    if NEO3_AVAILABLE:
+        return UInt160.from_string(value)
+    script_hash = bytes.fromhex(value)
+    if len(script_hash) != 20:
+        raise ValueError(f"Script hash must be 20 bytes, got {len(script_hash)}")
+    return script_hash
+
+
+def _script_hash_hex(value: str | UInt160) -> str:
+    """Render a script hash as the 0x-prefixed hex string RPC nodes expect."""
+    # Strings go through to_uint160 so malformed hashes fail before the RPC
+    script_hash = to_uint160(value)
+    if NEO3_AVAILABLE:
+        return str(script_hash)
+    return "0x" + script_hash.hex()
+
+
+def _contract_param(value: Any) -> dict:
+    """
+    Encode a Python value as a JSON-RPC ContractParameter.
+    
+    Dicts are assumed to be encoded already and pass through unchanged;
+    lists and tuples become an Array of recursively encoded items.
+    
+    Args:
+        value: bool, int, str, bytes, UInt160, list, tuple or
+            ContractParameter dict
+        
+    Returns:
+        dict: ContractParameter with ``type`` and ``value``
+        
+    Raises:
+        TypeError: If value is a float, which the NeoVM cannot represent
+    """
+    if isinstance(value, dict):
+        return value
+    if isinstance(value, bool):
+        return {"type": "Boolean", "value": value}
+    if isinstance(value, int):
+        return {"type": "Integer", "value": str(value)}
+    if isinstance(value, float):
+        raise TypeError("Contract parameters cannot be floats; scale to an integer amount")
+    if isinstance(value, (list, tuple)):
+        return {"type": "Array", "value": [_contract_param(item) for item in value]}
+    if isinstance(value, str):
+        return {"type": "String", "value": value}
+    if NEO3_AVAILABLE and isinstance(value, UInt160):
+        return {"type": "Hash160", "value": str(value)}
+    return {"type": "ByteArray", "value": base64.b64encode(bytes(value)).decode("ascii")}
+
+
+@dataclass(slots=True)
 class NeoConfig:
     """Configuration for Neo N3 connection."""
     
@@ -48,7 +125,16 @@ class NeoConfig:
     wallet_password: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class AppLogNotification:
+    """A contract notification from a transaction's application log."""
+    
+    contract: str
+    event_name: str
+    state: Any = None
+
+
+@dataclass(slots=True)
 class TransactionResult:
     """Result of a Neo N3 transaction."""
     
@@ -56,11 +142,39 @@ class TransactionResult:
     block_height: Optional[int] = None
     gas_consumed: float = 0.0
     state: str = "NONE"
-    notifications: list = None
+    notifications: list[AppLogNotification] = field(default_factory=list)
     
-    def __post_init__(self):
-        if self.notifications is None:
-            self.notifications = []
+    @classmethod
+    def from_application_log(cls, tx_hash: str, log: dict) -> TransactionResult:
+        """
+        Build a result from a ``getapplicationlog`` RPC response.
+        
+        Only the first execution is read; a transaction's application
+        log has exactly one.
+        
+        Args:
+            tx_hash: Transaction hash the log belongs to
+            log: The RPC ``result`` object
+            
+        Returns:
+            TransactionResult: Final state, GAS consumed and notifications
+        """
+        executions = log.get("executions") or [{}]
+        execution = executions[0]
+        return cls(
+            tx_hash=tx_hash,
+            # gasconsumed is an integer string in 10^-8 GAS
+            gas_consumed=int(execution.get("gasconsumed", 0)) / 100_000_000,
+            state=execution.get("vmstate", "NONE"),
+            notifications=[
+                AppLogNotification(
+                    contract=n.get("contract", ""),
+                    event_name=n.get("eventname", ""),
+                    state=n.get("state"),
+                )
+                for n in execution.get("notifications", ())
+            ],
+        )
 
 
 class NeoBridgeTool(BaseTool):
@@ -102,6 +216,10 @@ class NeoBridgeTool(BaseTool):
         self._facade: Optional[ChainFacade] = None
         self._wallet: Optional[Wallet] = None
         self._account: Optional[Account] = None
+        self._address: Optional[str] = None
+        self._script_hash: Optional[UInt160] = None
+        self._http: Optional["aiohttp.ClientSession"] = None
+        self._connected = False
     
     # =========================================================================
     # CONNECTION MANAGEMENT
@@ -114,16 +232,67 @@ class NeoBridgeTool(BaseTool):
         Returns:
             bool: True if connection successful
         """
-        # TODO: Implement RPC connection
-        # self._client = NeoRpcClient(self.config.rpc_url)
-        # self._facade = ChainFacade(self._client)
-        # return await self._client.test_connection()
-        return False
+        try:
+            version = await self._rpc("getversion")
+        except ImportError:
+            raise
+        except Exception:
+            # Unreachable node, HTTP failure or JSON-RPC error
+            self._connected = False
+            return False
+        
+        # Refuse a node that serves a different network than configured
+        network = (version or {}).get("protocol", {}).get("network")
+        self._connected = network == self.config.network_magic
+        return self._connected
     
     async def disconnect(self) -> None:
         """Close connection to Neo N3 RPC node."""
-        # TODO: Implement connection cleanup
-        pass
+        self._connected = False
+        http, self._http = self._http, None
+        if http is not None and not http.closed:
+            await http.close()
+    
+    def _get_http(self) -> "aiohttp.ClientSession":
+        """
+        Get or create the keep-alive HTTP session for the RPC node.
+        
+        Reusing one pooled session lets every RPC call skip the TCP and
+        TLS handshake after the first.
+        
+        Returns:
+            aiohttp.ClientSession: Session with pooled connections
+        """
+        if self._http is None or self._http.closed:
+            self._http = new_rpc_session()
+        return self._http
+    
+    async def _rpc(self, method: str, params: Optional[list[Any]] = None) -> Any:
+        """
+        Send one JSON-RPC call over the shared HTTP session.
+        
+        Args:
+            method: RPC method name
+            params: RPC method parameters
+            
+        Returns:
+            Any: The response ``result`` field
+            
+        Raises:
+            RuntimeError: If the node returns a JSON-RPC error
+        """
+        payload = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params or []}
+        async with self._get_http().post(
+            self.config.rpc_url,
+            data=_json_dumps(payload),
+            headers={"Content-Type": "application/json"},
+        ) as response:
+            response.raise_for_status()
+            body = _json_loads(await response.read())
+        
+        if "error" in body:
+            raise RuntimeError(body["error"].get("message", f"RPC {method} failed"))
+        return body.get("result")
     
     def is_connected(self) -> bool:
         """
@@ -132,7 +301,7 @@ class NeoBridgeTool(BaseTool):
         Returns:
             bool: True if connected
         """
-        return self._client is not None
+        return self._connected
     
     # =========================================================================
     # WALLET OPERATIONS
@@ -155,9 +324,23 @@ class NeoBridgeTool(BaseTool):
         """
         # TODO: Implement wallet loading
         # self._wallet = Wallet.load(wallet_path, password)
-        # self._account = self._wallet.accounts[0]
+        # self._set_account(self._wallet.accounts[0])
         return False
     
+    def _set_account(self, account: Account) -> None:
+        """
+        Make an account the signer and cache its derived identifiers.
+        
+        The address and script hash are derived by hashing, so they are
+        computed once here instead of on every invocation.
+        
+        Args:
+            account: Account to sign transactions with
+        """
+        self._account = account
+        self._address = account.address
+        self._script_hash = account.script_hash
+    
     def get_address(self) -> Optional[str]:
         """
         Get the current wallet address.
@@ -165,10 +348,7 @@ class NeoBridgeTool(BaseTool):
         Returns:
             str: Neo N3 address or None if no wallet loaded
         """
-        # TODO: Implement address retrieval
-        # if self._account:
-        #     return self._account.address
-        return None
+        return self._address
     
     # =========================================================================
     # BLOCKCHAIN QUERIES
@@ -181,9 +361,8 @@ class NeoBridgeTool(BaseTool):
         Returns:
             int: Current block height
         """
-        # TODO: Implement block height query
-        # return await self._facade.get_block_count()
-        return 0
+        # getblockcount counts the genesis block, so the height is one less
+        return await self._rpc("getblockcount") - 1
     
     async def get_transaction(self, tx_hash: str) -> Optional[dict]:
         """
@@ -195,8 +374,11 @@ class NeoBridgeTool(BaseTool):
         Returns:
             dict: Transaction details or None if not found
         """
-        # TODO: Implement transaction query
-        return None
+        try:
+            return await self._rpc("getrawtransaction", [tx_hash, True])
+        except RuntimeError:
+            # The node reports unknown hashes as a JSON-RPC error
+            return None
     
     async def wait_for_transaction(
         self,
@@ -214,6 +396,9 @@ class NeoBridgeTool(BaseTool):
             TransactionResult: Final transaction result
         """
         # TODO: Implement transaction monitoring
+        # Poll until the node has the log, then decode it in one pass:
+        # log = await self._rpc("getapplicationlog", [tx_hash])
+        # return TransactionResult.from_application_log(tx_hash, log)
         return TransactionResult(tx_hash=tx_hash)
     
     # =========================================================================
@@ -222,7 +407,7 @@ class NeoBridgeTool(BaseTool):
     
     async def invoke_contract(
         self,
-        contract_hash: str,
+        contract_hash: str | UInt160,
         method: str,
         params: list[Any] = None,
         sign: bool = True
@@ -231,7 +416,7 @@ class NeoBridgeTool(BaseTool):
         Invoke a smart contract method.
         
         Args:
-            contract_hash: Contract script hash (hex string)
+            contract_hash: Contract script hash (UInt160 or hex string)
             method: Method name to invoke
             params: Method parameters
             sign: Whether to sign and broadcast (False for read-only)
@@ -240,15 +425,16 @@ class NeoBridgeTool(BaseTool):
             TransactionResult: Invocation result
         """
         # TODO: Implement contract invocation
+        # 0. contract = to_uint160(contract_hash)
         # 1. Build invocation script
-        # 2. If sign=True, sign and broadcast
+        # 2. If sign=True, sign as self._script_hash and broadcast
         # 3. If sign=False, use test invoke
         # 4. Return result
         return TransactionResult(tx_hash="")
     
     async def test_invoke(
         self,
-        contract_hash: str,
+        contract_hash: str | UInt160,
         method: str,
         params: list[Any] = None
     ) -> dict:
@@ -256,7 +442,7 @@ class NeoBridgeTool(BaseTool):
         Test invoke a contract method (read-only, no gas cost).
         
         Args:
-            contract_hash: Contract script hash
+            contract_hash: Contract script hash (UInt160 or hex string)
             method: Method name
             params: Method parameters
             
@@ -264,8 +450,59 @@ class NeoBridgeTool(BaseTool):
             dict: Invocation result including stack and gas consumed
         """
         # TODO: Implement test invocation
+        # contract = to_uint160(contract_hash)
         return {"stack": [], "gas_consumed": 0}
     
+    async def test_invoke_batch(
+        self,
+        calls: list[tuple[str | UInt160, str, list[Any]]]
+    ) -> list[dict]:
+        """
+        Test invoke several contract methods in one JSON-RPC batch request.
+        
+        Every call travels in a single HTTP POST, so N read-only lookups
+        cost one round trip instead of N.
+        
+        Args:
+            calls: List of (contract_hash, method, params) tuples
+            
+        Returns:
+            list: One result per call, in input order. Each holds stack,
+            gas_consumed and state, or an ``error`` message if that
+            invocation failed
+        """
+        if not calls:
+            return []
+        
+        responses = await rpc_batch(self._get_http(), self.config.rpc_url, [
+            (
+                "invokefunction",
+                [
+                    _script_hash_hex(contract_hash),
+                    method,
+                    [_contract_param(p) for p in params or ()],
+                ],
+            )
+            for contract_hash, method, params in calls
+        ])
+        
+        results = []
+        for item in responses:
+            if "error" in item:
+                results.append({"error": item["error"].get("message", "Invocation failed")})
+                continue
+            result = item.get("result")
+            if not isinstance(result, dict):
+                results.append({"error": "No invocation result in response"})
+                continue
+            results.append({
+                "stack": result.get("stack", []),
+                # gasconsumed is an integer string in 10^-8 GAS
+                "gas_consumed": int(result.get("gasconsumed", 0)) / 100_000_000,
+                "state": result.get("state", "NONE"),
+            })
+        return results
+    
     # =========================================================================
     # TOOL INTERFACE (SpoonOS)
     # =========================================================================
@@ -0,0 +1,101 @@
+"""
+Streaming Percentiles
+
+Constant-memory latency percentile estimation for Q-score metrics.
+Samples are counted into log-spaced histogram bins, so each update is
+O(1) and quantiles never require storing or sorting the full history.
+"""
+
+import math
+
+
+class StreamingPercentiles:
+    """
+    Fixed log-spaced histogram for estimating latency percentiles.
+
+    Bin edges grow geometrically from ``low`` to ``high`` (milliseconds),
+    which bounds the relative error of every estimate by half a bin width
+    (about 1.3% with the defaults). Samples outside the range land in the
+    first or last bin, and estimates are clamped to the observed min/max.
+    """
+
+    def __init__(self, bins: int = 512, low: float = 0.1, high: float = 60_000.0) -> None:
+        """
+        Initialize an empty estimator.
+
+        Args:
+            bins: Number of histogram bins
+            low: Lower edge of the first bin (ms), must be positive
+            high: Upper edge of the last bin (ms)
+        """
+        if bins < 1 or not 0 < low < high:
+            raise ValueError("StreamingPercentiles needs bins >= 1 and 0 < low < high")
+
+        self.bins = bins
+        self.low = low
+        self.high = high
+        self._log_low = math.log(low)
+        self._log_step = (math.log(high) - self._log_low) / bins
+        self._counts = [0] * bins
+        self._count = 0
+        self._min = math.inf
+        self._max = -math.inf
+
+    @property
+    def count(self) -> int:
+        """Number of samples recorded so far."""
+        return self._count
+
+    def update(self, x: float) -> None:
+        """
+        Record one latency sample.
+
+        Args:
+            x: Observed latency in milliseconds
+            
+        Raises:
+            ValueError: If x is NaN or infinite, which would corrupt the
+                bin index and the observed min/max
+        """
+        if not math.isfinite(x):
+            raise ValueError(f"Latency sample must be finite, got {x}")
+        if x > self.low:
+            index = min(int((math.log(x) - self._log_low) / self._log_step), self.bins - 1)
+        else:
+            index = 0
+        self._counts[index] += 1
+        self._count += 1
+        if x < self._min:
+            self._min = x
+        if x > self._max:
+            self._max = x
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the ``q``-th quantile of the recorded samples.
+
+        Args:
+            q: Quantile in [0, 1], e.g. 0.95 for P95
+
+        Returns:
+            float: Estimated latency in milliseconds (0.0 with no samples)
+        """
+        if not 0.0 <= q <= 1.0:
+            raise ValueError(f"Quantile must be within [0, 1], got {q}")
+        if not self._count:
+            return 0.0
+        if q == 0.0:
+            return self._min
+        if q == 1.0:
+            return self._max
+
+        target = q * self._count
+        seen = 0
+        for index, bin_count in enumerate(self._counts):
+            if bin_count and seen + bin_count >= target:
+                # Interpolate geometrically within the bin
+                fraction = (target - seen) / bin_count
+                estimate = math.exp(self._log_low + (index + fraction) * self._log_step)
+                return min(max(estimate, self._min), self._max)
+            seen += bin_count
+        return self._max
@@ -5,6 +5,7 @@ SpoonOS tools for interacting with the Chatten NEP-11 token contract.
 """
 from __future__ import annotations
 
+import asyncio
 from typing import Any, Optional
 from dataclasses import dataclass
 
@@ -18,10 +19,48 @@ except ImportError:
     BaseTool = object
 
 # Local imports
-from .neo_bridge import NeoBridgeTool, NeoConfig
+from .neo_bridge import NeoBridgeTool, NeoConfig, UInt160, to_uint160
 
+# Bridge shared by token tools constructed without one
+_default_bridge: Optional[NeoBridgeTool] = None
 
-@dataclass
+
+def _get_default_bridge() -> NeoBridgeTool:
+    """
+    Get or create the NeoBridgeTool shared by token tools.
+    
+    Tools built without an explicit bridge reuse this one, so they share
+    a single RPC session and wallet instead of opening one each.
+    
+    Returns:
+        NeoBridgeTool: Process-wide default bridge
+    """
+    global _default_bridge
+    if _default_bridge is None:
+        _default_bridge = NeoBridgeTool()
+    return _default_bridge
+
+
+def _integer_result(result: dict) -> Optional[int]:
+    """
+    Read a single Integer return value from a test_invoke_batch result.
+    
+    Args:
+        result: One entry returned by NeoBridgeTool.test_invoke_batch
+        
+    Returns:
+        int: The returned integer, or None if the call errored, did not
+        HALT, or returned something other than an Integer
+    """
+    if result.get("state") != "HALT":
+        return None
+    stack = result.get("stack") or ()
+    if not stack or stack[0].get("type") != "Integer":
+        return None
+    return int(stack[0]["value"])
+
+
+@dataclass(slots=True)
 class TokenInfo:
     """Information about a Compute Token."""
     
@@ -59,11 +98,19 @@ class TokenBalanceTool(BaseTool):
         
         Args:
             contract_hash: Chatten token contract hash
-            neo_bridge: Neo bridge tool for blockchain access
+            neo_bridge: Neo bridge tool for blockchain access (shared default if None)
         """
         super().__init__()
         self.contract_hash = contract_hash
-        self.neo_bridge = neo_bridge or NeoBridgeTool()
+        self.neo_bridge = neo_bridge or _get_default_bridge()
+        self._script_hash: Optional[UInt160] = None
+    
+    @property
+    def script_hash(self) -> UInt160:
+        """Contract hash as UInt160, parsed once on first use."""
+        if self._script_hash is None:
+            self._script_hash = to_uint160(self.contract_hash)
+        return self._script_hash
     
     async def get_balance(self, address: str) -> int:
         """
@@ -77,7 +124,7 @@ class TokenBalanceTool(BaseTool):
         """
         # TODO: Invoke balanceOf on contract
         # result = await self.neo_bridge.test_invoke(
-        #     self.contract_hash,
+        #     self.script_hash,
         #     "balanceOf",
         #     [address]
         # )
@@ -110,6 +157,22 @@ class TokenBalanceTool(BaseTool):
         # TODO: Invoke properties on contract
         return None
     
+    async def get_token_supplies(self, token_ids: list[bytes]) -> list[Optional[int]]:
+        """
+        Get the circulating supply of several tokens in one RPC round trip.
+        
+        Args:
+            token_ids: Token IDs to query
+            
+        Returns:
+            list: Supply of each token, in input order (None if the lookup
+            failed, faulted or did not return an Integer)
+        """
+        results = await self.neo_bridge.test_invoke_batch(
+            [(self.script_hash, "tokenSupply", [token_id]) for token_id in token_ids]
+        )
+        return [_integer_result(r) for r in results]
+    
     async def get_owner(self, token_id: str) -> Optional[str]:
         """
         Get the owner of a specific token.
@@ -159,11 +222,19 @@ class TokenTransferTool(BaseTool):
         
         Args:
             contract_hash: Chatten token contract hash
-            neo_bridge: Neo bridge tool for blockchain access
+            neo_bridge: Neo bridge tool for blockchain access (shared default if None)
         """
         super().__init__()
         self.contract_hash = contract_hash
-        self.neo_bridge = neo_bridge or NeoBridgeTool()
+        self.neo_bridge = neo_bridge or _get_default_bridge()
+        self._script_hash: Optional[UInt160] = None
+    
+    @property
+    def script_hash(self) -> UInt160:
+        """Contract hash as UInt160, parsed once on first use."""
+        if self._script_hash is None:
+            self._script_hash = to_uint160(self.contract_hash)
+        return self._script_hash
     
     async def transfer(
         self,
@@ -184,7 +255,7 @@ class TokenTransferTool(BaseTool):
         """
         # TODO: Invoke transfer on contract
         # result = await self.neo_bridge.invoke_contract(
-        #     self.contract_hash,
+        #     self.script_hash,
         #     "transfer",
         #     [to, token_id, data],
         #     sign=True
@@ -215,16 +286,32 @@ class TokenTransferTool(BaseTool):
         transfers: list[dict]
     ) -> list[dict]:
         """
-        Execute multiple transfers in sequence.
+        Execute multiple transfers concurrently.
+        
+        Neo N3 transactions carry their own nonce, so independent transfers
+        can be built, signed and broadcast in parallel. A failing or
+        cancelled transfer is reported in its own result without affecting
+        the others.
         
         Args:
             transfers: List of {to, token_id, data} dicts
             
         Returns:
-            list: Results for each transfer
+            list: Results for each transfer, in input order
         """
-        # TODO: Implement batch transfer
-        return []
+        results = await asyncio.gather(
+            *(
+                self.transfer(t.get("to", ""), t.get("token_id", ""), t.get("data"))
+                for t in transfers
+            ),
+            return_exceptions=True
+        )
+        # BaseException also catches a cancelled transfer's CancelledError
+        return [
+            {"success": False, "error": str(r) or type(r).__name__}
+            if isinstance(r, BaseException) else r
+            for r in results
+        ]
     
     async def run(self, **kwargs: Any) -> ToolResult:
         """SpoonOS tool execution entry point."""